@@ -0,0 +1,272 @@
+"""
+Instrumentation Implementation
+
+This module contains an opt-in instrumentation layer that counts the comparisons, in-place writes, recursion depth
+and auxiliary memory of the sorting and selection algorithms.
+
+The algorithms themselves are not changed. Instead, instrument calls an algorithm on an instrumented copy of its
+input: every element is wrapped in an object that counts its comparisons, and the list counts the elements written to
+it. Writes to the auxiliary buffers an algorithm allocates itself are not seen, so the write counts of in-place and
+out-of-place algorithms are not comparable. Recursion depth is tracked with a profiling hook and memory with
+tracemalloc, both only for the duration of the call. Calling an algorithm directly therefore runs exactly the same
+code as before, with no overhead.
+
+Author: Aflah Hanif Amarlyadi
+Date: 2026-10-17
+License: MIT
+"""
+
+from typing import Any, Callable, Dict, Generic, Iterator, MutableSequence, Tuple, TypeVar
+import os
+import sys
+import tracemalloc
+
+T = TypeVar('T')
+
+ALGORITHMS_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+
+
+class Counts:
+    """
+    The operation counts of an instrumented call.
+
+    Attributes:
+        comparisons (int): The number of comparisons between elements.
+        writes (int): The number of elements written to the input list, where a swap counts as two writes. Writes to
+        auxiliary buffers are not counted, so an algorithm that merges into its own buffers and copies the result
+        back once counts n writes per copy, and one that returns a new list counts none.
+        max_depth (int): The maximum recursion depth, which is the largest number of calls to the same function of
+        the algorithms package that are active at once. Non-recursive algorithms have a depth of 1.
+        peak_memory (int): The peak size in bytes of the memory allocated during the call.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialises all counts to zero.
+        """
+        self.comparisons = 0
+        self.writes = 0
+        self.max_depth = 0
+        self.peak_memory = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        """
+        Returns the counts as a dictionary.
+
+        Returns:
+            Dict[str, int]: The counts, keyed by attribute name.
+        """
+        return {'comparisons': self.comparisons, 'writes': self.writes, 'max_depth': self.max_depth,
+                'peak_memory': self.peak_memory}
+
+    def __repr__(self) -> str:
+        return f"Counts(comparisons={self.comparisons}, writes={self.writes}, max_depth={self.max_depth}, " \
+               f"peak_memory={self.peak_memory})"
+
+
+class CountedElement(Generic[T]):
+    """
+    An element that counts the comparisons made with it.
+
+    Attributes:
+        value (T): The wrapped element.
+        counts (Counts): The counts to add the comparisons to.
+    """
+
+    __slots__ = ('value', 'counts')
+
+    def __init__(self, value: T, counts: Counts) -> None:
+        """
+        Wraps an element.
+
+        Args:
+            value (T): The element to wrap.
+            counts (Counts): The counts to add the comparisons to.
+        """
+        self.value = value
+        self.counts = counts
+
+    def __lt__(self, other: 'CountedElement[T]') -> bool:
+        self.counts.comparisons += 1
+        return self.value < other.value
+
+    def __le__(self, other: 'CountedElement[T]') -> bool:
+        self.counts.comparisons += 1
+        return self.value <= other.value
+
+    def __gt__(self, other: 'CountedElement[T]') -> bool:
+        self.counts.comparisons += 1
+        return self.value > other.value
+
+    def __ge__(self, other: 'CountedElement[T]') -> bool:
+        self.counts.comparisons += 1
+        return self.value >= other.value
+
+    def __eq__(self, other: 'CountedElement[T]') -> bool:
+        self.counts.comparisons += 1
+        return self.value == other.value
+
+    def __hash__(self) -> int:
+        return hash(self.value)
+
+    def __repr__(self) -> str:
+        return repr(self.value)
+
+
+class CountedList(list):
+    """
+    A list that counts the elements written to it by index or slice assignment.
+
+    Attributes:
+        counts (Counts): The counts to add the writes to.
+    """
+
+    def __init__(self, iterable: Any, counts: Counts) -> None:
+        """
+        Initialises the list with the given elements, which are not counted as writes.
+
+        Args:
+            iterable (Any): The initial elements.
+            counts (Counts): The counts to add the writes to.
+        """
+        super().__init__(iterable)
+        self.counts = counts
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        if isinstance(index, slice):
+            value = list(value)
+            self.counts.writes += len(value)
+        else:
+            self.counts.writes += 1
+        super().__setitem__(index, value)
+
+
+def unwrap(value: Any) -> Any:
+    """
+    Replaces the counted elements in a result by the elements they wrap.
+
+    Args:
+        value (Any): A counted element, or a list or tuple that may contain counted elements.
+
+    Returns:
+        Any: The result without counted elements.
+    """
+    if isinstance(value, CountedElement):
+        return value.value
+    if isinstance(value, list):
+        return [unwrap(x) for x in value]
+    if isinstance(value, tuple):
+        return tuple(unwrap(x) for x in value)
+    return value
+
+
+def instrument(function: Callable[..., Any], array: MutableSequence[T], *args: Any, comparisons: bool = True,
+               writes: bool = True, depth: bool = True, memory: bool = True, **kwargs: Any) -> Tuple[Any, Counts]:
+    """
+    Calls a sorting or selection algorithm on a list and counts the operations it performs.
+
+    The algorithm is called on an instrumented copy of the list, whose final contents are written back into the
+    list, so in-place algorithms behave as usual. Results that are iterators, such as that of External Merge Sort,
+    are consumed during the call. A key function passed as a keyword argument is called on the original elements,
+    and its comparisons are counted as well.
+
+    Comparisons cannot be counted for algorithms that need the elements to be integers or strings, such as Counting
+    Sort and Radix Sort, so comparisons must be False for them. Comparisons and writes made in other processes, as in
+    Parallel Merge Sort and Sample Sort above their thresholds, are not counted.
+
+    Args:
+        function (Callable[..., Any]): The algorithm, called with the list as its first argument.
+        array (MutableSequence[T]): The list to pass to the algorithm.
+        *args (Any): The other positional arguments of the algorithm.
+        comparisons (bool, optional): Whether to count comparisons. Defaults to True.
+        writes (bool, optional): Whether to count the elements written to the list. Defaults to True.
+        depth (bool, optional): Whether to track the recursion depth. Defaults to True.
+        memory (bool, optional): Whether to measure the peak memory. Defaults to True.
+        **kwargs (Any): The keyword arguments of the algorithm.
+
+    Returns:
+        Tuple[Any, Counts]: The result of the algorithm and the operation counts.
+
+    Examples:
+    >>> from algorithms.sorting.insertion_sort import insertion_sort
+    >>> array = [3, 1, 2]
+    >>> result, counts = instrument(insertion_sort, array)
+    >>> result, array
+    ([1, 2, 3], [1, 2, 3])
+    >>> counts.comparisons, counts.writes, counts.max_depth
+    (3, 4, 1)
+    >>> from algorithms.sorting.tim_sort import tim_sort
+    >>> instrument(tim_sort, [(2, 'a'), (1, 'b')], key=lambda pair: pair[0])[0]
+    [(1, 'b'), (2, 'a')]
+    >>> from algorithms.sorting.merge_sort import merge_sort_recursive
+    >>> instrument(merge_sort_recursive, list(range(16, 0, -1)), memory=False)[1].max_depth
+    5
+    >>> from algorithms.selection.select_min_max import select_min_max
+    >>> instrument(select_min_max, [3, 2, 6, 8, 7, 9, 8, 2], memory=False)[1].comparisons
+    12
+    """
+    counts = Counts()
+
+    elements = [CountedElement(x, counts) for x in array] if comparisons else list(array)
+    instrumented = CountedList(elements, counts) if writes else elements
+
+    key = kwargs.get('key')
+    if comparisons and key is not None:
+        kwargs['key'] = lambda element: CountedElement(key(element.value), counts)
+
+    def profile(frame: Any, event: str, _: Any) -> None:
+        """
+        Tracks the number of active calls to every function of the algorithms package.
+
+        Args:
+            frame (Any): The frame of the function being called or returning.
+            event (str): The kind of event.
+            _ (Any): The event argument, which is not used.
+        """
+        filename = frame.f_code.co_filename
+        if not filename.startswith(ALGORITHMS_DIRECTORY) or filename == __file__:
+            return
+        code = frame.f_code
+        if event == 'call':
+            active[code] = active.get(code, 0) + 1
+            counts.max_depth = max(counts.max_depth, active[code])
+        elif event == 'return':
+            active[code] -= 1
+
+    active = {}
+
+    if memory:
+        tracemalloc.start()
+    if depth:
+        previous = sys.getprofile()
+        sys.setprofile(profile)
+
+    try:
+        result = function(instrumented, *args, **kwargs)
+        if isinstance(result, Iterator):
+            result = list(result)
+    finally:
+        if depth:
+            sys.setprofile(previous)
+        if memory:
+            counts.peak_memory = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+    values = unwrap(list(instrumented))
+    if isinstance(array, list):
+        array[:] = values
+    else:
+        for i in range(len(values)):
+            array[i] = values[i]
+
+    if result is instrumented:
+        result = array
+    else:
+        result = unwrap(result)
+
+    return result, counts
+
+
+if __name__ == "__main__":
+    import doctest
+    doctest.testmod()
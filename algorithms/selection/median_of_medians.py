@@ -36,6 +36,10 @@ def median_of_medians(array: List[int]) -> int:
         """
         Finds the median of list of up to 5 integers.
 
+        Five integers take six comparisons: the smaller of two sorted pairs is below three other integers, so it
+        cannot be the median and is replaced by the fifth integer, twice. Shorter lists, which only occur at the end
+        of the input, are sorted.
+
         Args:
             array (List[int]): A list of integers.
 
@@ -44,10 +48,23 @@ def median_of_medians(array: List[int]) -> int:
         """
         n = len(array)
 
-        array = sorted(array)
-        median = n // 2
+        if n < 5:
+            return sorted(array)[n // 2]
+
+        a, b, c, d, e = array
+        if b < a:
+            a, b = b, a
+        if d < c:
+            c, d = d, c
+        if c < a:
+            a, b, c, d = c, d, a, b
+        a = e
+        if b < a:
+            a, b = b, a
+        if c < a:
+            a, b, c, d = c, d, a, b
 
-        return array[median]
+        return b if b < c else c
     
     n = len(array)
     
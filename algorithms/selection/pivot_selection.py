@@ -0,0 +1,121 @@
+"""
+Pivot Selection Implementation
+
+This module contains the pivot selection strategies shared by the Quick Sort variants and Quick Select.
+
+Author: Aflah Hanif Amarlyadi
+Date: 2026-10-17
+License: MIT
+"""
+
+from typing import List, TypeVar
+from algorithms.selection.median_of_medians import median_of_medians
+import random
+
+T = TypeVar('T')
+
+PIVOT_STRATEGIES = ('random', 'median_of_three', 'ninther', 'median_of_medians')
+NINTHER_THRESHOLD = 40
+
+
+def median_of_three(array: List[T], i: int, j: int, k: int) -> int:
+    """
+    Finds the index of the median of the elements at three indices.
+
+    Args:
+        array (List[T]): The input list.
+        i (int): The first index.
+        j (int): The second index.
+        k (int): The third index.
+
+    Returns:
+        int: The index of the median element.
+
+    Time Complexity:
+        O(1) - with at most three comparisons.
+
+    Examples:
+    >>> median_of_three([5, 1, 3], 0, 1, 2)
+    2
+    >>> median_of_three([1, 2, 3], 0, 1, 2)
+    1
+    """
+    if array[i] < array[j]:
+        if array[j] < array[k]:
+            return j
+        return k if array[i] < array[k] else i
+    if array[i] < array[k]:
+        return i
+    return k if array[j] < array[k] else j
+
+
+def select_pivot(array: List[T], low: int, high: int, strategy: str = 'random', rng: random.Random = None) -> int:
+    """
+    Selects the index of a pivot in the sublist with the given strategy.
+
+    The strategies are:
+    - 'random': a uniformly random element, drawn from rng. Expected O(n log n) Quick Sort on any input.
+    - 'median_of_three': the median of the first, middle and last elements. Cheap and good on sorted and reversed
+      inputs, but can be defeated by crafted inputs.
+    - 'ninther': Tukey's ninther, the median of the medians of three groups of three elements spread over the
+      sublist, for sublists of at least NINTHER_THRESHOLD elements, and the median of three otherwise. A better
+      estimate of the median on large sublists.
+    - 'median_of_medians': the approximate median found by median_of_medians, which is deterministic and never close
+      to the extremes, at the cost of O(n) extra time and space per pivot.
+
+    Args:
+        array (List[T]): The input list.
+        low (int): The lower index of the sublist.
+        high (int): The upper index of the sublist.
+        strategy (str, optional): The pivot selection strategy, one of PIVOT_STRATEGIES. Defaults to 'random'.
+        rng (random.Random, optional): The random number generator for the 'random' strategy, which makes runs
+        reproducible when seeded. Defaults to the random module.
+
+    Returns:
+        int: The index of the pivot, between low and high.
+
+    Raises:
+        ValueError: If the strategy is unknown.
+
+    Time Complexity:
+        O(1) - O(n) for the 'median_of_medians' strategy.
+
+    Examples:
+    >>> select_pivot([3, 1, 2], 0, 2, 'median_of_three')
+    2
+    >>> select_pivot(list(range(100)), 0, 99, 'ninther')
+    49
+    >>> select_pivot([9, 1, 8, 2, 7, 3, 6, 4, 5], 0, 8, 'median_of_medians')
+    4
+    >>> select_pivot(list(range(100)), 0, 99, rng=random.Random(0)) == select_pivot(list(range(100)), 0, 99,
+    ...                                                                              rng=random.Random(0))
+    True
+    """
+    if strategy == 'random':
+        return (random if rng is None else rng).randint(low, high)
+
+    if strategy == 'median_of_three':
+        return median_of_three(array, low, (low + high) // 2, high)
+
+    if strategy == 'ninther':
+        mid = (low + high) // 2
+        if high - low + 1 < NINTHER_THRESHOLD:
+            return median_of_three(array, low, mid, high)
+        step = (high - low + 1) // 8
+        return median_of_three(array,
+                               median_of_three(array, low, low + step, low + 2 * step),
+                               median_of_three(array, mid - step, mid, mid + step),
+                               median_of_three(array, high - 2 * step, high - step, high))
+
+    if strategy == 'median_of_medians':
+        median = median_of_medians(array[low:high + 1])
+        for i in range(low, high + 1):
+            if not array[i] < median and not median < array[i]:
+                return i
+
+    raise ValueError(f"Unknown pivot strategy: {strategy}. Expected one of {', '.join(PIVOT_STRATEGIES)}.")
+
+
+if __name__ == "__main__":
+    import doctest
+    doctest.testmod()
@@ -9,14 +9,16 @@ License: MIT
 """
 
 from typing import List, TypeVar
+from algorithms.selection.pivot_selection import select_pivot
 import random
 
 T = TypeVar('T')
 
 
-def quick_select(array: List[T], k: int, low: int = 0, high: int = None) -> T:
+def quick_select(array: List[T], k: int, low: int = 0, high: int = None, pivot: str = 'random',
+                 rng: random.Random = None) -> T:
     """
-    Finds the k-th smallest element from the list using the Quick Select algorithm with randomised pivot selection.
+    Finds the k-th smallest element from the list using the Quick Select algorithm, with a random pivot by default.
 
     Quick Select is a selection algorithm to find the k-th smallest element in an unordered list by partitioning the list 
     around a randomly chosen pivot, then recursively searching only the side of the partition that contains the k-th element.
@@ -26,6 +28,10 @@ def quick_select(array: List[T], k: int, low: int = 0, high: int = None) -> T:
         k (int): The k-th smallest element to find.
         low (int, optional): The lower index of the sublist. Defaults to 0.
         high (int, optional): The upper index of the sublist. Defaults to None.
+        pivot (str, optional): The pivot selection strategy, one of PIVOT_STRATEGIES in pivot_selection. Defaults to
+        'random'.
+        rng (random.Random, optional): The random number generator for the 'random' pivot strategy, which makes runs
+        reproducible when seeded. Defaults to the random module.
     
     Returns:
         T: The k-th smallest element in the list.
@@ -57,10 +63,14 @@ def quick_select(array: List[T], k: int, low: int = 0, high: int = None) -> T:
     8
     >>> quick_select([0, 1, 2, 3, 4, 5, 6, 7, 8, 9], 9)
     9
+    >>> quick_select([9, 8, 7, 6, 5, 4, 3, 2, 1, 0], 3, pivot='median_of_three')
+    3
+    >>> quick_select([5, 1, 4, 2, 3], 2, rng=random.Random(0))
+    3
     """
     def partition(array: List[T], low: int, high: int) -> int:
         """
-        Partitions the list with Hoare's partitioning.
+        Partitions the list with Hoare's partitioning around a pivot chosen by the pivot strategy.
 
         Args:
             array (List[T]): The list to partition.
@@ -70,8 +80,8 @@ def quick_select(array: List[T], k: int, low: int = 0, high: int = None) -> T:
         Returns:
             int: The index of the sorted pivot.
         """
-        pivot = random.randint(low, high)
-        array[low], array[pivot] = array[pivot], array[low]
+        index = select_pivot(array, low, high, pivot, rng)
+        array[low], array[index] = array[index], array[low]
         i, j = low, high
         
         while i <= j:
@@ -95,9 +105,9 @@ def quick_select(array: List[T], k: int, low: int = 0, high: int = None) -> T:
     mid = partition(array, low, high)
 
     if k < mid:
-        return quick_select(array, k, low, mid-1)
+        return quick_select(array, k, low, mid-1, pivot, rng)
     elif k > mid:
-        return quick_select(array, k, mid+1, high)
+        return quick_select(array, k, mid+1, high, pivot, rng)
     else:
         return array[k]
 
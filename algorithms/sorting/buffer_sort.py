@@ -0,0 +1,153 @@
+"""
+Buffer Sort Implementation
+
+This module contains a sort function for typed buffers, such as NumPy arrays, array.array buffers and memoryviews,
+that sorts them in place without boxing their elements into Python objects where possible.
+
+Author: Aflah Hanif Amarlyadi
+Date: 2026-10-17
+License: MIT
+"""
+
+from array import array as typed_array
+from typing import Any, Callable, MutableSequence, TypeVar
+from algorithms.sorting.pdq_sort import pdq_sort
+from algorithms.sorting.radix_sort import INTEGER_TYPECODES, radix_sort_vectorized
+from algorithms.sorting.sort_by_key import sort_by_key
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+T = TypeVar('T')
+
+KINDS = ('quicksort', 'mergesort', 'heapsort', 'stable')
+
+
+def is_typed_buffer(array: Any) -> bool:
+    """
+    Checks whether a sequence is a typed buffer, whose elements are stored unboxed in a single block of memory.
+
+    Args:
+        array (Any): The sequence.
+
+    Returns:
+        bool: Whether the sequence is a NumPy array, an array.array buffer, a memoryview or a bytearray.
+
+    Examples:
+    >>> is_typed_buffer(typed_array('d', [1.0]))
+    True
+    >>> is_typed_buffer(memoryview(bytearray(b'ab')))
+    True
+    >>> is_typed_buffer([1.0])
+    False
+    """
+    return isinstance(array, (typed_array, memoryview, bytearray)) or np is not None and isinstance(array, np.ndarray)
+
+
+def buffer_sort(array: MutableSequence[T], kind: str = 'quicksort', key: Callable[[T], Any] = None,
+                reverse: bool = False) -> MutableSequence[T]:
+    """
+    Sorts a typed buffer in ascending order in place, without boxing its elements where possible.
+
+    The buffer is sorted with the first of these paths that applies:
+    - With NumPy installed, the buffer is viewed as a NumPy array that shares its memory, through the buffer protocol,
+      and sorted in place with ndarray.sort using the given kind of sorting algorithm. In descending order, the
+      reversed view is sorted instead.
+    - Without NumPy, a buffer of non-negative integers is sorted with radix_sort_vectorized, whose second buffer has
+      the same type as the input.
+    - Otherwise, the buffer is sorted in place with Pattern-Defeating Quick Sort. Any other mutable sequence, and any
+      buffer sorted with a key function, also take this path, at the cost of boxing the elements.
+
+    Args:
+        array (MutableSequence[T]): The buffer to be sorted, which must be one-dimensional and writable.
+        kind (str, optional): The NumPy sorting algorithm, one of KINDS. Defaults to 'quicksort', which is NumPy's
+        Intro Sort.
+        key (Callable[[T], Any], optional): A function computing the comparison key of every element, called once per
+        element. Defaults to None.
+        reverse (bool, optional): Whether to sort in descending order. Defaults to False.
+
+    Returns:
+        MutableSequence[T]: The sorted buffer.
+
+    Raises:
+        ValueError: If the kind is unknown, or if the buffer is read-only or has more than one dimension.
+
+    Time Complexity:
+        O(n log n) - O(dn) for integers sorted with Radix Sort, where d is the number of digits.
+
+    Space Complexity:
+        O(n) - for the stable kinds and Radix Sort, O(log n) otherwise.
+
+    Stability:
+        The stable kinds and Radix Sort are stable. Equal elements of a buffer are indistinguishable, unless they are
+        sorted with a key function, in which case the sort is stable.
+
+    Examples:
+    >>> buffer_sort(typed_array('d', []))
+    array('d')
+    >>> buffer_sort(typed_array('d', [2.5, -1.0, 0.5]))
+    array('d', [-1.0, 0.5, 2.5])
+    >>> buffer_sort(typed_array('I', [1, 2, 3, 4, 5, 1, 2, 3, 4, 5]))
+    array('I', [1, 1, 2, 2, 3, 3, 4, 4, 5, 5])
+    >>> buffer_sort(typed_array('i', [1, 2, 3, 4, 5, 0, -1, -2, -3, -4, -5]))
+    array('i', [-5, -4, -3, -2, -1, 0, 1, 2, 3, 4, 5])
+    >>> buffer = typed_array('q', [10, 9, 8, 7, 6, 5, 4, 3, 2, 1])
+    >>> view = buffer_sort(memoryview(buffer))
+    >>> buffer
+    array('q', [1, 2, 3, 4, 5, 6, 7, 8, 9, 10])
+    >>> buffer = typed_array('d', [6.0, 5.0, 4.0, 3.0, 2.0, 1.0])
+    >>> view = buffer_sort(memoryview(buffer)[::2])
+    >>> buffer
+    array('d', [2.0, 5.0, 4.0, 3.0, 6.0, 1.0])
+    >>> buffer_sort(bytearray(b'sorted'))
+    bytearray(b'deorst')
+    >>> buffer_sort(typed_array('i', [-3, 1, -2]), key=abs)
+    array('i', [1, -2, -3])
+    >>> buffer_sort(typed_array('i', [3, 1, 2, 1]), reverse=True)
+    array('i', [3, 2, 1, 1])
+    >>> buffer_sort(memoryview(b'read-only'))
+    Traceback (most recent call last):
+        ...
+    ValueError: Buffer must be writable.
+    """
+    if kind not in KINDS:
+        raise ValueError(f"Unknown sorting algorithm: {kind}. Expected one of {', '.join(KINDS)}.")
+
+    if key is not None or not is_typed_buffer(array):
+        if key is not None or reverse:
+            return sort_by_key(pdq_sort, array, key, reverse)
+        return pdq_sort(array)
+
+    if np is not None and isinstance(array, np.ndarray):
+        readonly, ndim = not array.flags.writeable, array.ndim
+    else:
+        view = array if isinstance(array, memoryview) else memoryview(array)
+        readonly, ndim = view.readonly, view.ndim
+
+    if readonly:
+        raise ValueError("Buffer must be writable.")
+    if ndim > 1:
+        raise ValueError("Buffer must be one-dimensional.")
+
+    if np is not None:
+        # np.asarray shares the memory of strided views too, which np.frombuffer rejects
+        values = array if isinstance(array, np.ndarray) else np.asarray(view)
+        # Sorting the reversed view in ascending order leaves the buffer in descending order
+        (values[::-1] if reverse else values).sort(kind=kind)
+        return array
+
+    if view.format in INTEGER_TYPECODES and all(x >= 0 for x in view):
+        radix_sort_vectorized(array, reverse=reverse)
+    elif reverse:
+        sort_by_key(pdq_sort, array, reverse=reverse)
+    else:
+        pdq_sort(array)
+
+    return array
+
+
+if __name__ == "__main__":
+    import doctest
+    doctest.testmod()
@@ -8,13 +8,15 @@ Date: 2024-09-11
 License: MIT
 """
 
-from typing import List, TypeVar
+from array import array as typed_array
+from typing import Callable, List, TypeVar
 from algorithms.selection.select_min_max import select_min_max
+from algorithms.sorting.sort_by_key import sort_by_key
 
 T = TypeVar('T')
 
 
-def counting_sort(array: List[int]):
+def counting_sort(array: List[int], key: Callable[[T], int] = None, reverse: bool = False):
     """
     Sorts a list of integers in ascending order using the stable Counting Sort algorithm.
 
@@ -24,6 +26,10 @@ def counting_sort(array: List[int]):
 
     Args:
         array (List[int]): The list of integers to be sorted.
+        key (Callable[[T], int], optional): A function computing the key of every element, called once per element.
+        Defaults to None.
+        reverse (bool, optional): Whether to sort in descending order, keeping equal elements in their original order.
+        Defaults to False.
 
     Returns:
         List[int]: The sorted list of integers.
@@ -50,7 +56,12 @@ def counting_sort(array: List[int]):
     [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
     >>> counting_sort([10, 9, 8, 7, 6, 5, 4, 3, 2, 1])
     [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+    >>> counting_sort([('b', 2), ('a', 1), ('c', 2)], key=lambda record: record[1], reverse=True)
+    [('b', 2), ('c', 2), ('a', 1)]
     """
+    if key is not None or reverse:
+        return sort_by_key(counting_sort, array, key, reverse, decorate=False)
+
     n = len(array)
 
     if n == 0:
@@ -73,7 +84,83 @@ def counting_sort(array: List[int]):
     return array
 
 
-def counting_sort_chr(array: List[chr]):
+def counting_sort_prefix_sum(array: List[T], key: Callable[[T], int] = None, reverse: bool = False) -> List[T]:
+    """
+    Sorts a list in ascending order of integer keys using the stable Counting Sort algorithm with prefix sums.
+
+    This version of Counting Sort keeps a single typed array of 64-bit counts instead of a list per key. After
+    counting, the counts are turned into prefix sums, the starting position of every key, and every element is
+    written straight to its position in a preallocated output list. With a key function, records can be sorted by
+    an integer field; the key of every element is computed only once.
+
+    Args:
+        array (List[T]): The list to be sorted.
+        key (Callable[[T], int], optional): A function extracting an integer key from every element. Defaults to
+        None, in which case the elements are the keys.
+        reverse (bool, optional): Whether to sort in descending order, keeping equal elements in their original order.
+        Defaults to False.
+
+    Returns:
+        List[T]: The sorted list.
+
+    Time Complexity:
+        O(n + k) - where n is the number of elements and k is the range of keys.
+
+    Space Complexity:
+        O(n + k) - where n is the number of elements and k is the range of keys. The count array takes 8 bytes per
+        key in the range.
+
+    Stability:
+        This implementation of Counting Sort is stable, it maintains the relative order of equal elements.
+
+    Examples:
+    >>> counting_sort_prefix_sum([])
+    []
+    >>> counting_sort_prefix_sum([1])
+    [1]
+    >>> counting_sort_prefix_sum([1, 2, 3, 4, 5, 1, 2, 3, 4, 5])
+    [1, 1, 2, 2, 3, 3, 4, 4, 5, 5]
+    >>> counting_sort_prefix_sum([1, 2, 3, 4, 5, 0, -1, -2, -3, -4, -5])
+    [-5, -4, -3, -2, -1, 0, 1, 2, 3, 4, 5]
+    >>> counting_sort_prefix_sum([10, 9, 8, 7, 6, 5, 4, 3, 2, 1])
+    [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+    >>> counting_sort_prefix_sum([('b', 2), ('a', 1), ('c', 2), ('d', 1)], key=lambda record: record[1])
+    [('a', 1), ('d', 1), ('b', 2), ('c', 2)]
+    >>> counting_sort_prefix_sum([('b', 2), ('a', 1), ('c', 2), ('d', 1)], key=lambda record: record[1], reverse=True)
+    [('b', 2), ('c', 2), ('a', 1), ('d', 1)]
+    """
+    n = len(array)
+
+    if n == 0:
+        return array
+
+    keys = array if key is None else [key(x) for x in array]
+
+    minimum, maximum = select_min_max(keys)
+    k = maximum - minimum + 1
+
+    count = typed_array('q', bytes(8 * k))
+
+    for num in keys:
+        count[num - minimum] += 1
+
+    # Turn the counts into the starting position of every key, with the largest key first if reversed
+    total = 0
+    for i in range(k - 1, -1, -1) if reverse else range(k):
+        count[i], total = total, total + count[i]
+
+    output = [None] * n
+    for i in range(n):
+        position = keys[i] - minimum
+        output[count[position]] = array[i]
+        count[position] += 1
+
+    array[:] = output
+
+    return array
+
+
+def counting_sort_chr(array: List[chr], key: Callable[[T], chr] = None, reverse: bool = False):
     """
     Sorts a list of characters in ascending order using the stable Counting Sort algorithm.
 
@@ -81,6 +168,10 @@ def counting_sort_chr(array: List[chr]):
 
     Args:
         array (List[chr]): The list of characters to be sorted.
+        key (Callable[[T], chr], optional): A function computing the key of every element, called once per element.
+        Defaults to None.
+        reverse (bool, optional): Whether to sort in descending order, keeping equal elements in their original order.
+        Defaults to False.
 
     Returns:
         List[chr]: The sorted list of characters.
@@ -107,7 +198,14 @@ def counting_sort_chr(array: List[chr]):
     ['a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i', 'j']
     >>> counting_sort_chr(['A', 'a', 'B', 'b', 'C', 'c', 'D', 'd', 'E', 'e'])
     ['A', 'B', 'C', 'D', 'E', 'a', 'b', 'c', 'd', 'e']
+    >>> counting_sort_chr(['b', 'A', 'a'], key=str.lower)
+    ['A', 'a', 'b']
+    >>> counting_sort_chr(['a', 'c', 'b'], reverse=True)
+    ['c', 'b', 'a']
     """
+    if key is not None or reverse:
+        return sort_by_key(counting_sort_chr, array, key, reverse, decorate=False)
+
     n = len(array)
 
     if n == 0:
@@ -127,7 +225,7 @@ def counting_sort_chr(array: List[chr]):
     return array
 
 
-def counting_sort_unstable(array: List[int]):
+def counting_sort_unstable(array: List[int], key: Callable[[T], int] = None, reverse: bool = False):
     """
     Sorts a list of integers in ascending order using the unstable Counting Sort algorithm.
 
@@ -136,6 +234,10 @@ def counting_sort_unstable(array: List[int]):
 
     Args:
         array (List[int]): The list of integers to be sorted.
+        key (Callable[[T], int], optional): A function computing the key of every element, called once per element.
+        Defaults to None.
+        reverse (bool, optional): Whether to sort in descending order, keeping equal elements in their original order.
+        Defaults to False.
 
     Returns:
         List[int]: The sorted list of integers.
@@ -162,7 +264,12 @@ def counting_sort_unstable(array: List[int]):
     [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
     >>> counting_sort_unstable([10, 9, 8, 7, 6, 5, 4, 3, 2, 1])
     [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+    >>> counting_sort_unstable([('b', 2), ('a', 1), ('c', 2)], key=lambda record: record[1], reverse=True)
+    [('b', 2), ('c', 2), ('a', 1)]
     """
+    if key is not None or reverse:
+        return sort_by_key(counting_sort_unstable, array, key, reverse, decorate=False)
+
     n = len(array)
 
     if n == 0:
@@ -186,7 +293,7 @@ def counting_sort_unstable(array: List[int]):
     return array
 
 
-def counting_sort_chr_unstable(array: List[chr]):
+def counting_sort_chr_unstable(array: List[chr], key: Callable[[T], chr] = None, reverse: bool = False):
     """
     Sorts a list of characters in ascending order using the unstable Counting Sort algorithm.
 
@@ -195,6 +302,10 @@ def counting_sort_chr_unstable(array: List[chr]):
 
     Args:
         array (List[chr]): The list of characters to be sorted.
+        key (Callable[[T], chr], optional): A function computing the key of every element, called once per element.
+        Defaults to None.
+        reverse (bool, optional): Whether to sort in descending order, keeping equal elements in their original order.
+        Defaults to False.
 
     Returns:
         List[chr]: The sorted list of characters.
@@ -221,7 +332,14 @@ def counting_sort_chr_unstable(array: List[chr]):
     ['a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i', 'j']
     >>> counting_sort_chr_unstable(['A', 'a', 'B', 'b', 'C', 'c', 'D', 'd', 'E', 'e'])
     ['A', 'B', 'C', 'D', 'E', 'a', 'b', 'c', 'd', 'e']
+    >>> counting_sort_chr_unstable(['b', 'A', 'a'], key=str.lower)
+    ['A', 'a', 'b']
+    >>> counting_sort_chr_unstable(['a', 'c', 'b'], reverse=True)
+    ['c', 'b', 'a']
     """
+    if key is not None or reverse:
+        return sort_by_key(counting_sort_chr_unstable, array, key, reverse, decorate=False)
+
     n = len(array)
 
     if n == 0:
@@ -0,0 +1,251 @@
+"""
+Sort Dispatcher Implementation
+
+This module contains a sort function that profiles its input and dispatches it to the most suitable sorting algorithm
+in this package.
+
+Author: Aflah Hanif Amarlyadi
+Date: 2026-10-17
+License: MIT
+"""
+
+from typing import Any, Callable, List, MutableSequence, Tuple, TypeVar, Union
+from algorithms.selection.select_min_max import select_min_max
+from algorithms.sorting.counting_sort import counting_sort
+from algorithms.sorting.insertion_sort import insertion_sort
+from algorithms.sorting.pdq_sort import pdq_sort
+from algorithms.sorting.radix_sort import radix_sort
+from algorithms.sorting.sort_by_key import assign_slice, sort_by_key
+
+T = TypeVar('T')
+
+INSERTION_SORT_THRESHOLD = 16
+DESCENT_FACTOR = 32
+INSERTION_SORT_MOVE_FACTOR = 4
+COUNTING_SORT_RANGE_FACTOR = 2
+RADIX_SORT_BITS = 8
+
+STRATEGIES = {
+    'insertion_sort': insertion_sort,
+    'counting_sort': counting_sort,
+    'radix_sort': lambda array: radix_sort(array, 1 << RADIX_SORT_BITS),
+    'pdq_sort': pdq_sort,
+}
+
+
+class SortResult:
+    """
+    The result of a dispatched sort, recording which algorithm was chosen and why.
+
+    Attributes:
+        array (List[T]): The sorted list.
+        strategy (str): The name of the sorting algorithm that was used.
+        reason (str): Why the algorithm was chosen.
+    """
+
+    def __init__(self, array: List[T], strategy: str, reason: str) -> None:
+        """
+        Initialises the result.
+
+        Args:
+            array (List[T]): The sorted list.
+            strategy (str): The name of the sorting algorithm that was used.
+            reason (str): Why the algorithm was chosen.
+        """
+        self.array = array
+        self.strategy = strategy
+        self.reason = reason
+
+    def __repr__(self) -> str:
+        return f"SortResult(strategy={self.strategy!r}, reason={self.reason!r})"
+
+
+def bounded_insertion_sort(array: MutableSequence[T], limit: int) -> bool:
+    """
+    Sorts a list in ascending order in place using Insertion Sort, giving up once it has moved too many elements.
+
+    Args:
+        array (MutableSequence[T]): The list to be sorted.
+        limit (int): The number of element moves after which the sort gives up.
+
+    Returns:
+        bool: Whether the list was sorted. If not, it holds a permutation of its elements.
+
+    Time Complexity:
+        O(n + limit)
+
+    Examples:
+    >>> array = [2, 1, 3, 5, 4]
+    >>> bounded_insertion_sort(array, 2), array
+    (True, [1, 2, 3, 4, 5])
+    >>> bounded_insertion_sort([5, 4, 3, 2, 1], 2)
+    False
+    """
+    moves = 0
+    for i in range(1, len(array)):
+        current = array[i]
+        j = i - 1
+        while j >= 0 and current < array[j]:
+            array[j + 1] = array[j]
+            j -= 1
+        array[j + 1] = current
+        moves += i - 1 - j
+        if moves > limit:
+            return False
+    return True
+
+
+def choose_strategy(array: List[T]) -> Tuple[str, str]:
+    """
+    Profiles a list and chooses the sorting algorithm to sort it with.
+
+    The checks are made in order, from the cheapest to the most expensive:
+    - Lists with at most INSERTION_SORT_THRESHOLD elements use Insertion Sort.
+    - The descents, adjacent pairs of elements that are out of order, are counted. If there are at most
+      n / DESCENT_FACTOR, the list is nearly sorted and Insertion Sort is used. A few descents may still hide many
+      inversions, so sort gives up on Insertion Sort after INSERTION_SORT_MOVE_FACTOR * n moves.
+    - For lists of integers, the minimum and maximum are found with select_min_max. If the range is at most
+      COUNTING_SORT_RANGE_FACTOR * n, Counting Sort is used.
+    - For wider ranges of non-negative integers, Radix Sort with a base of 2^RADIX_SORT_BITS is used, if it needs
+      fewer passes than log2(n).
+    - Otherwise, the hybrid Pattern-Defeating Quick Sort is used.
+
+    Args:
+        array (List[T]): The list to be sorted.
+
+    Returns:
+        Tuple[str, str]: The name of the sorting algorithm, which is a key of STRATEGIES, and the reason it was chosen.
+
+    Time Complexity:
+        O(n)
+
+    Examples:
+    >>> choose_strategy([3, 1, 2])
+    ('insertion_sort', 'at most 16 elements')
+    >>> choose_strategy(list(range(1000)))[0]
+    'insertion_sort'
+    >>> choose_strategy([i // 200 * 200 + 199 - i % 200 for i in range(200000)])[0]
+    'counting_sort'
+    >>> choose_strategy([i % 10 for i in range(1000)])[0]
+    'counting_sort'
+    >>> choose_strategy([(i * 7919) % 1000 * 10 ** 6 for i in range(1000)])[0]
+    'radix_sort'
+    >>> choose_strategy([-((i * 7919) % 1000) * 10 ** 6 for i in range(1000)])[0]
+    'pdq_sort'
+    """
+    n = len(array)
+
+    if n <= INSERTION_SORT_THRESHOLD:
+        return 'insertion_sort', f'at most {INSERTION_SORT_THRESHOLD} elements'
+
+    descents = sum(1 for i in range(1, n) if array[i] < array[i - 1])
+    if descents * DESCENT_FACTOR <= n:
+        return 'insertion_sort', f'{descents} descents among {n} elements'
+
+    if all(type(x) is int for x in array):
+        minimum, maximum = select_min_max(array)
+        k = maximum - minimum + 1
+
+        if k <= COUNTING_SORT_RANGE_FACTOR * n:
+            return 'counting_sort', f'integer range {k} is at most {COUNTING_SORT_RANGE_FACTOR} * {n}'
+
+        passes = -(-maximum.bit_length() // RADIX_SORT_BITS)
+        if minimum >= 0 and passes < n.bit_length() - 1:
+            return 'radix_sort', f'non-negative integers with range {k}, sorted in {passes} passes'
+
+        if minimum < 0:
+            return 'pdq_sort', f'integer range {k} is too wide for Counting Sort and includes negative integers'
+        return 'pdq_sort', f'integers need {passes} Radix Sort passes, more than log2({n})'
+
+    return 'pdq_sort', 'elements are not integers'
+
+
+def sort(array: MutableSequence[T], key: Callable[[T], Any] = None, reverse: bool = False,
+         debug: bool = False) -> Union[MutableSequence[T], SortResult]:
+    """
+    Sorts a list in ascending order with the sorting algorithm best suited to its data.
+
+    The list is profiled with choose_strategy, and sorted in place with the chosen algorithm. If Insertion Sort is
+    chosen but moves more than INSERTION_SORT_MOVE_FACTOR * n elements, it gives up and the list is sorted with
+    Pattern-Defeating Quick Sort instead, so a nearly sorted list never takes quadratic time. With a key function,
+    the keys are profiled and sorted instead, and the elements are rearranged to match. This needs hashable keys, so
+    unhashable keys, such as lists, are decorated with their indices and the (key, index) pairs are sorted instead.
+
+    Args:
+        array (MutableSequence[T]): The list to be sorted.
+        key (Callable[[T], Any], optional): A function computing the comparison key of every element, called once per
+        element. Defaults to None.
+        reverse (bool, optional): Whether to sort in descending order, keeping equal elements in their original order.
+        Defaults to False.
+        debug (bool, optional): Whether to return a SortResult recording the chosen algorithm and the reason, rather
+        than the sorted list. Defaults to False.
+
+    Returns:
+        Union[MutableSequence[T], SortResult]: The sorted list, or a SortResult holding it if debug is True.
+
+    Time Complexity:
+        O(n log n) - O(n) for nearly sorted lists and small ranges of integers.
+
+    Space Complexity:
+        O(n) - for Counting Sort and Radix Sort, O(log n) otherwise.
+
+    Stability:
+        The dispatched sort is unstable, it does not maintain the relative order of equal elements. With a key
+        function or in descending order, it is stable.
+
+    Examples:
+    >>> sort([])
+    []
+    >>> sort([1, 2, 3, 4, 5, 0, -1, -2, -3, -4, -5])
+    [-5, -4, -3, -2, -1, 0, 1, 2, 3, 4, 5]
+    >>> sort(['A', 'a', 'B', 'b', 'C', 'c', 'D', 'd', 'E', 'e'])
+    ['A', 'B', 'C', 'D', 'E', 'a', 'b', 'c', 'd', 'e']
+    >>> sort([i % 10 for i in range(1000)], debug=True)
+    SortResult(strategy='counting_sort', reason='integer range 10 is at most 2 * 1000')
+    >>> result = sort(list(range(100, 1000)) + list(range(100)), debug=True)
+    >>> result.strategy, result.reason
+    ('pdq_sort', '1 descents among 1000 elements, but Insertion Sort gave up after 4000 moves')
+    >>> sort(['bb', 'a', 'ccc', 'dd'], key=len)
+    ['a', 'bb', 'dd', 'ccc']
+    >>> sort([3, 1, 2, 1], reverse=True)
+    [3, 2, 1, 1]
+    >>> sort([[2], [1]] * 10, key=lambda x: x)[::5]
+    [[1], [1], [2], [2]]
+    """
+    if key is not None or reverse:
+        results = []
+
+        def sort_keys(keys: List[Any]) -> List[Any]:
+            results.append(sort(keys, debug=True))
+            return results[-1].array
+
+        values = list(array)
+        keys = values if key is None else [key(x) for x in values]
+        try:
+            for k in keys:
+                hash(k)
+            hashable = True
+        except TypeError:
+            hashable = False
+
+        # The indices are sorted by the precomputed keys, so the key function is still called once per element
+        order = sort_by_key(sort_keys, list(range(len(keys))), keys.__getitem__, reverse, in_place=False,
+                            decorate=not hashable)
+        assign_slice(array, 0, [values[i] for i in order])
+        return SortResult(array, results[-1].strategy, results[-1].reason) if debug else array
+
+    strategy, reason = choose_strategy(array)
+    if strategy == 'insertion_sort':
+        limit = INSERTION_SORT_MOVE_FACTOR * len(array)
+        if not bounded_insertion_sort(array, limit):
+            strategy, reason = 'pdq_sort', f'{reason}, but Insertion Sort gave up after {limit} moves'
+            pdq_sort(array)
+    else:
+        STRATEGIES[strategy](array)
+
+    return SortResult(array, strategy, reason) if debug else array
+
+
+if __name__ == "__main__":
+    import doctest
+    doctest.testmod()
@@ -0,0 +1,233 @@
+"""
+External Merge Sort Algorithm Implementation
+
+This module contains an implementation of the External Merge Sort algorithm, for inputs that do not fit in memory.
+
+Author: Aflah Hanif Amarlyadi
+Date: 2026-10-17
+License: MIT
+"""
+
+from operator import itemgetter
+from typing import Any, BinaryIO, Callable, Iterable, Iterator, List, TypeVar, Union
+from algorithms.sorting.merge_sort import k_way_merge
+from algorithms.sorting.tim_sort import tim_sort
+import os
+import pickle
+import sys
+import tempfile
+
+T = TypeVar('T')
+
+
+def external_merge_sort(source: Iterable[T] = None, chunk_size: int = 100000, max_fan_in: int = 64,
+                        temp_dir: str = None, path: Union[str, os.PathLike] = None, memory_limit: int = None,
+                        key: Callable[[T], Any] = None, reverse: bool = False) -> Iterator[T]:
+    """
+    Sorts an iterable in ascending order using the External Merge Sort algorithm, yielding the sorted elements.
+
+    External Merge Sort reads the input in chunks, sorts every chunk in memory, and spills it as a sorted run to a
+    temporary file. A chunk ends after chunk_size elements, or once the elements read into it take up memory_limit
+    bytes, whichever comes first. The runs are then merged with a k-way merge that keeps a tournament tree of
+    the head element of every run, reading each run lazily from disk. If there are more than max_fan_in runs, groups of
+    runs are first merged into longer runs, so at most max_fan_in files are open and buffered at a time. The result
+    is streamed and never materialised in full.
+
+    The memory budget is measured with sys.getsizeof, which counts the size of every element but not of the objects
+    it refers to, so it is only approximate for containers. The merge phase holds one element per run, plus the read
+    buffers of at most max_fan_in files.
+
+    Args:
+        source (Iterable[T], optional): The elements to be sorted. Strings are iterables of characters, so a file is
+        given through path instead. Defaults to None.
+        chunk_size (int, optional): The maximum number of elements, not bytes, sorted in memory at a time. Defaults to
+        100000.
+        max_fan_in (int, optional): The maximum number of runs merged at once, at least 2. Defaults to 64.
+        temp_dir (str, optional): The directory for the temporary run files. Defaults to the system default.
+        path (Union[str, os.PathLike], optional): The path of a text file whose lines are to be sorted, without their
+        line terminators, instead of source. Defaults to None.
+        memory_limit (int, optional): The approximate number of bytes of elements sorted in memory at a time.
+        Defaults to None, in which case only chunk_size limits the chunks.
+        key (Callable[[T], Any], optional): A function computing the comparison key of every element, called once per
+        element. Defaults to None.
+        reverse (bool, optional): Whether to sort in descending order, keeping equal elements in their original order.
+        Defaults to False.
+
+    Returns:
+        Iterator[T]: The sorted elements.
+
+    Raises:
+        ValueError: If not exactly one of source and path is given, if chunk_size or memory_limit is less than 1, or
+        if max_fan_in is less than 2.
+
+    Time Complexity:
+        O(n log n) - plus O(n log_f(n / c)) element transfers to and from disk, where c is the chunk size and f is
+        the fan-in.
+
+    Space Complexity:
+        O(c + f) in memory - where c is the chunk size and f is the fan-in. O(n) on disk.
+
+    Stability:
+        External Merge Sort is stable, it maintains the relative order of equal elements.
+
+    Examples:
+    >>> list(external_merge_sort([]))
+    []
+    >>> list(external_merge_sort([1]))
+    [1]
+    >>> list(external_merge_sort([1, 2, 3, 4, 5, 1, 2, 3, 4, 5], chunk_size=3))
+    [1, 1, 2, 2, 3, 3, 4, 4, 5, 5]
+    >>> list(external_merge_sort([1, 2, 3, 4, 5, 0, -1, -2, -3, -4, -5], chunk_size=2, max_fan_in=2))
+    [-5, -4, -3, -2, -1, 0, 1, 2, 3, 4, 5]
+    >>> list(external_merge_sort(iter(range(10, 0, -1)), chunk_size=4))
+    [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+    >>> list(external_merge_sort(['A', 'a', 'B', 'b', 'C', 'c', 'D', 'd', 'E', 'e'], chunk_size=3))
+    ['A', 'B', 'C', 'D', 'E', 'a', 'b', 'c', 'd', 'e']
+    >>> list(external_merge_sort(['bb', 'a', 'ccc', 'dd', 'e'], chunk_size=2, key=len, reverse=True))
+    ['ccc', 'bb', 'dd', 'a', 'e']
+    >>> list(external_merge_sort('merge'))
+    ['e', 'e', 'g', 'm', 'r']
+    >>> list(external_merge_sort(range(1000, 0, -1), memory_limit=1000))[:5]
+    [1, 2, 3, 4, 5]
+    >>> with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as file:
+    ...     _ = file.write('pear\\napple\\nfig\\n')
+    >>> list(external_merge_sort(path=file.name, chunk_size=2))
+    ['apple', 'fig', 'pear']
+    >>> os.remove(file.name)
+    """
+    def read_lines(path: Union[str, os.PathLike]) -> Iterator[str]:
+        """
+        Reads the lines of a text file without their line terminators.
+
+        Args:
+            path (Union[str, os.PathLike]): The path of the text file.
+
+        Returns:
+            Iterator[str]: The lines of the file.
+        """
+        with open(path) as file:
+            for line in file:
+                yield line.rstrip('\n')
+
+    def write_run(elements: Iterable[T]) -> BinaryIO:
+        """
+        Writes a sorted run to a new temporary file.
+
+        Args:
+            elements (Iterable[T]): The sorted elements of the run.
+
+        Returns:
+            BinaryIO: The temporary file, positioned at its start.
+        """
+        file = tempfile.TemporaryFile(dir=temp_dir)
+        pickler = pickle.Pickler(file, pickle.HIGHEST_PROTOCOL)
+        for element in elements:
+            pickler.dump(element)
+            # Without this the pickler memoises every element written to the run
+            pickler.clear_memo()
+        file.seek(0)
+        return file
+
+    def read_run(file: BinaryIO) -> Iterator[T]:
+        """
+        Reads a sorted run back from its temporary file, one element at a time.
+
+        Args:
+            file (BinaryIO): The temporary file holding the run.
+
+        Returns:
+            Iterator[T]: The elements of the run.
+        """
+        unpickler = pickle.Unpickler(file)
+        while True:
+            try:
+                yield unpickler.load()
+            except EOFError:
+                return
+
+    def sort_chunk(chunk: List[T]) -> List[T]:
+        """
+        Sorts a chunk in memory. With a key function, every element is paired with its key first, so the key is
+        computed only once even though the runs are merged again later.
+
+        Args:
+            chunk (List[T]): The chunk to be sorted.
+
+        Returns:
+            List[T]: The sorted chunk, of (key, element) pairs if there is a key function.
+        """
+        if key is None:
+            return tim_sort(chunk, reverse=reverse)
+        return tim_sort([(key(x), x) for x in chunk], key=itemgetter(0), reverse=reverse)
+
+    def merge(runs: List[Iterator[T]]) -> Iterator[T]:
+        """
+        Merges sorted runs with k_way_merge, which holds the head element of every run.
+
+        Ties are broken by the position of the run, so elements from earlier runs are yielded first.
+
+        Args:
+            runs (List[Iterator[T]]): The sorted runs, in input order.
+
+        Returns:
+            Iterator[T]: The merged elements.
+        """
+        return k_way_merge(*runs, key=None if key is None else itemgetter(0), reverse=reverse)
+
+    if (source is None) == (path is None):
+        raise ValueError("Exactly one of source and path must be given.")
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be at least 1.")
+    if memory_limit is not None and memory_limit < 1:
+        raise ValueError("Memory limit must be at least 1 byte.")
+    if max_fan_in < 2:
+        raise ValueError("Fan-in must be at least 2.")
+
+    if path is not None:
+        source = read_lines(path)
+
+    files = []
+    try:
+        chunk = []
+        size = 0
+        for element in source:
+            chunk.append(element)
+            if memory_limit is not None:
+                size += sys.getsizeof(element)
+            if len(chunk) == chunk_size or memory_limit is not None and size >= memory_limit:
+                files.append(write_run(sort_chunk(chunk)))
+                chunk = []
+                size = 0
+
+        # A single chunk never needs to touch the disk
+        if not files:
+            run = sort_chunk(chunk)
+        else:
+            if chunk:
+                files.append(write_run(sort_chunk(chunk)))
+            chunk = None
+
+            while len(files) > max_fan_in:
+                merged = []
+                for i in range(0, len(files), max_fan_in):
+                    group = files[i:i + max_fan_in]
+                    merged.append(write_run(merge([read_run(file) for file in group])))
+                    for file in group:
+                        file.close()
+                files = merged
+
+            run = merge([read_run(file) for file in files])
+
+        if key is None:
+            yield from run
+        else:
+            for _, element in run:
+                yield element
+    finally:
+        for file in files:
+            file.close()
+
+
+if __name__ == "__main__":
+    import doctest
+    doctest.testmod()
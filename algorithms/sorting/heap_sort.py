@@ -1,19 +1,180 @@
 """
 Heap Sort Algorithm Implementation
 
-This module contains an implementation of the Heap Sort algorithm.
+This module contains implementations of the Heap Sort algorithm with binary, bottom-up and d-ary heaps, along with
+partial sorting and top-k selection built on the binary heap.
 
 Author: Aflah Hanif Amarlyadi
 Date: 2024-09-11
 License: MIT
 """
 
-from typing import List, TypeVar
+from typing import Any, Callable, Iterable, List, MutableSequence, TypeVar
+from algorithms.sorting.sort_by_key import assign_slice, sort_by_key
 
 T = TypeVar('T')
 
 
-def heap_sort(array: List[T]) -> List[T]:
+def heapify(array: MutableSequence[T], low: int = 0, high: int = None) -> None:
+    """
+    Converts the given sublist into a max heap.
+
+    Args:
+        array (MutableSequence[T]): The list containing the sublist to convert into a max heap.
+        low (int, optional): The lower index of the sublist. Defaults to 0.
+        high (int, optional): The upper index of the sublist. Defaults to None.
+
+    Time Complexity:
+        O(n)
+    """
+    high = len(array)-1 if high is None else high
+
+    n = high - low + 1
+    for i in range(n // 2 - 1, -1, -1):
+        fall(array, i, n, low)
+
+
+def fall(array: MutableSequence[T], index: int, n: int, low: int = 0) -> None:
+    """
+    Moves the element at the given index down to maintain the max heap property.
+
+    The heap is stored in array[low:low + n], with its root at array[low].
+
+    Args:
+        array (MutableSequence[T]): The list representing the heap.
+        index (int): The index of the element to fall, relative to the root of the heap.
+        n (int): The number of elements in the heap portion of the list.
+        low (int, optional): The index of the root of the heap. Defaults to 0.
+
+    Time Complexity:
+        O(log n)
+    """
+    while index * 2 + 1 < n:
+        left = index * 2 + 1
+        right = index * 2 + 2
+        largest = index
+
+        if left < n and array[low + left] > array[low + largest]:
+            largest = left
+        if right < n and array[low + right] > array[low + largest]:
+            largest = right
+
+        if largest != index:
+            array[low + index], array[low + largest] = array[low + largest], array[low + index]
+            index = largest
+        else:
+            break
+
+
+def fall_min(array: MutableSequence[T], index: int, n: int, low: int = 0) -> None:
+    """
+    Moves the element at the given index down to maintain the min heap property.
+
+    The heap is stored in array[low:low + n], with its root at array[low].
+
+    Args:
+        array (MutableSequence[T]): The list representing the heap.
+        index (int): The index of the element to fall, relative to the root of the heap.
+        n (int): The number of elements in the heap portion of the list.
+        low (int, optional): The index of the root of the heap. Defaults to 0.
+
+    Time Complexity:
+        O(log n)
+    """
+    while index * 2 + 1 < n:
+        left = index * 2 + 1
+        right = index * 2 + 2
+        smallest = index
+
+        if left < n and array[low + left] < array[low + smallest]:
+            smallest = left
+        if right < n and array[low + right] < array[low + smallest]:
+            smallest = right
+
+        if smallest != index:
+            array[low + index], array[low + smallest] = array[low + smallest], array[low + index]
+            index = smallest
+        else:
+            break
+
+
+def fall_bottom_up(array: MutableSequence[T], index: int, n: int, low: int = 0) -> None:
+    """
+    Moves the element at the given index down to maintain the max heap property, using Floyd's bottom-up method.
+
+    Instead of comparing the falling element with both children at every level, the path of larger children is
+    followed all the way down to a leaf with one comparison per level. The element's place is then found by climbing
+    back up that path, and the elements above it on the path move up one level. As an element taken from a leaf
+    usually belongs near the bottom again, this takes about half the comparisons of fall.
+
+    Args:
+        array (MutableSequence[T]): The list representing the heap.
+        index (int): The index of the element to fall, relative to the root of the heap.
+        n (int): The number of elements in the heap portion of the list.
+        low (int, optional): The index of the root of the heap. Defaults to 0.
+
+    Time Complexity:
+        O(log n)
+    """
+    item = array[low + index]
+
+    # Follow the larger children down to a leaf
+    leaf = index
+    while leaf * 2 + 2 < n:
+        left = leaf * 2 + 1
+        leaf = left + 1 if array[low + left] < array[low + left + 1] else left
+    if leaf * 2 + 1 < n:
+        leaf = leaf * 2 + 1
+
+    # Climb back up to the first element on the path that is not less than the falling element
+    while leaf > index and array[low + leaf] < item:
+        leaf = (leaf - 1) // 2
+
+    # Put the falling element there and move the elements above it up one level
+    while leaf > index:
+        array[low + leaf], item = item, array[low + leaf]
+        leaf = (leaf - 1) // 2
+    array[low + index] = item
+
+
+def fall_d_ary(array: MutableSequence[T], index: int, n: int, d: int, low: int = 0) -> None:
+    """
+    Moves the element at the given index down to maintain the max heap property of a d-ary heap.
+
+    The children of the element at index i are at indices d * i + 1 to d * i + d. A d-ary heap has only log_d(n)
+    levels, at the cost of d comparisons per level. Instead of swapping at every level, the larger children move up
+    and the falling element is written once, into its final place.
+
+    Args:
+        array (MutableSequence[T]): The list representing the heap.
+        index (int): The index of the element to fall, relative to the root of the heap.
+        n (int): The number of elements in the heap portion of the list.
+        d (int): The number of children of every element.
+        low (int, optional): The index of the root of the heap. Defaults to 0.
+
+    Time Complexity:
+        O(d log_d n)
+    """
+    item = array[low + index]
+
+    while index * d + 1 < n:
+        first = index * d + 1
+        largest = first
+        for child in range(first + 1, min(first + d, n)):
+            if array[low + largest] < array[low + child]:
+                largest = child
+
+        if not item < array[low + largest]:
+            break
+
+        array[low + index] = array[low + largest]
+        index = largest
+
+    array[low + index] = item
+
+
+def heap_sort(array: MutableSequence[T], low: int = 0, high: int = None, key: Callable[[T], Any] = None,
+              reverse: bool = False) -> MutableSequence[T]:
     """
     Sorts a list in ascending order using the Heap Sort algorithm.
 
@@ -22,10 +183,16 @@ def heap_sort(array: List[T]) -> List[T]:
     from the heap and rebuilds the heap until all elements are sorted.
 
     Args:
-        array (List[T]): The list to be sorted.
+        array (MutableSequence[T]): The list to be sorted.
+        low (int, optional): The lower index of the sublist. Defaults to 0.
+        high (int, optional): The upper index of the sublist. Defaults to None.
+        key (Callable[[T], Any], optional): A function computing the comparison key of every element, called once per
+        element. Defaults to None.
+        reverse (bool, optional): Whether to sort in descending order, keeping equal elements in their original order.
+        Defaults to False.
 
     Returns:
-        List[T]: The sorted list.
+        MutableSequence[T]: The sorted list.
 
     Time Complexity:
         Best Case: O(n) - occurs when the entire list consists of identical elements.
@@ -53,54 +220,362 @@ def heap_sort(array: List[T]) -> List[T]:
     [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
     >>> heap_sort(['A', 'a', 'B', 'b', 'C', 'c', 'D', 'd', 'E', 'e'])
     ['A', 'B', 'C', 'D', 'E', 'a', 'b', 'c', 'd', 'e']
+    >>> heap_sort([5, 4, 3, 2, 1, 0], 1, 4)
+    [5, 1, 2, 3, 4, 0]
+    >>> heap_sort(['bb', 'a', 'ccc', 'dd'], key=len)
+    ['a', 'bb', 'dd', 'ccc']
+    >>> heap_sort([3, 1, 2, 1], reverse=True)
+    [3, 2, 1, 1]
+    """
+    if key is not None or reverse:
+        return sort_by_key(heap_sort, array, key, reverse, low, high)
+
+    n = len(array)
+
+    high = n-1 if high is None else high
+
+    heapify(array, low, high)
+
+    for i in range(high - low, 0, -1):
+        array[low], array[low + i] = array[low + i], array[low]
+        fall(array, 0, i, low)
+
+    return array
+
+
+def heap_sort_bottom_up(array: MutableSequence[T], low: int = 0, high: int = None, key: Callable[[T], Any] = None,
+                        reverse: bool = False) -> MutableSequence[T]:
+    """
+    Sorts a list in ascending order using the bottom-up Heap Sort algorithm.
+
+    Bottom-up Heap Sort is Heap Sort with Floyd's bottom-up sift-down. After the maximum is extracted, the element
+    moved to the root came from a leaf and almost always falls back to the bottom, so the heap is descended along the
+    larger children with one comparison per level and the element's place is searched for from the leaf upwards.
+    This roughly halves the number of comparisons, which pays off when comparisons are expensive.
+
+    Args:
+        array (MutableSequence[T]): The list to be sorted.
+        low (int, optional): The lower index of the sublist. Defaults to 0.
+        high (int, optional): The upper index of the sublist. Defaults to None.
+        key (Callable[[T], Any], optional): A function computing the comparison key of every element, called once per
+        element. Defaults to None.
+        reverse (bool, optional): Whether to sort in descending order, keeping equal elements in their original order.
+        Defaults to False.
+
+    Returns:
+        MutableSequence[T]: The sorted list.
+
+    Time Complexity:
+        O(n log n) - with about n log2(n) comparisons, against about 2n log2(n) for Heap Sort.
+
+    Space Complexity:
+        O(1) - sorting is done in-place, only a constant amount of extra memory is used.
+
+    Stability:
+        Bottom-up Heap Sort is unstable, it does not maintain the relative order of equal elements.
+
+    Examples:
+    >>> heap_sort_bottom_up([])
+    []
+    >>> heap_sort_bottom_up([1])
+    [1]
+    >>> heap_sort_bottom_up([1, 2, 3, 4, 5, 1, 2, 3, 4, 5])
+    [1, 1, 2, 2, 3, 3, 4, 4, 5, 5]
+    >>> heap_sort_bottom_up([1, 2, 3, 4, 5, 0, -1, -2, -3, -4, -5])
+    [-5, -4, -3, -2, -1, 0, 1, 2, 3, 4, 5]
+    >>> heap_sort_bottom_up([10, 9, 8, 7, 6, 5, 4, 3, 2, 1])
+    [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+    >>> heap_sort_bottom_up(['A', 'a', 'B', 'b', 'C', 'c', 'D', 'd', 'E', 'e'])
+    ['A', 'B', 'C', 'D', 'E', 'a', 'b', 'c', 'd', 'e']
+    >>> heap_sort_bottom_up([5, 4, 3, 2, 1, 0], 1, 4)
+    [5, 1, 2, 3, 4, 0]
+    >>> heap_sort_bottom_up(['bb', 'a', 'ccc', 'dd'], key=len)
+    ['a', 'bb', 'dd', 'ccc']
+    >>> heap_sort_bottom_up([3, 1, 2, 1], reverse=True)
+    [3, 2, 1, 1]
+    """
+    if key is not None or reverse:
+        return sort_by_key(heap_sort_bottom_up, array, key, reverse, low, high)
+
+    n = len(array)
+
+    high = n-1 if high is None else high
+
+    heapify(array, low, high)
+
+    for i in range(high - low, 0, -1):
+        array[low], array[low + i] = array[low + i], array[low]
+        fall_bottom_up(array, 0, i, low)
+
+    return array
+
+
+def heap_sort_d_ary(array: MutableSequence[T], low: int = 0, high: int = None, d: int = 4,
+                    key: Callable[[T], Any] = None, reverse: bool = False) -> MutableSequence[T]:
+    """
+    Sorts a list in ascending order using the d-ary Heap Sort algorithm.
+
+    d-ary Heap Sort is Heap Sort with a heap in which every element has d children rather than two. The heap is only
+    log_d(n) levels deep, so elements move fewer times and the children of an element are adjacent in memory, while
+    every level costs d comparisons. With d = 4 the number of comparisons is about the same as with a binary heap,
+    but with half as many levels.
+
+    Args:
+        array (MutableSequence[T]): The list to be sorted.
+        low (int, optional): The lower index of the sublist. Defaults to 0.
+        high (int, optional): The upper index of the sublist. Defaults to None.
+        d (int, optional): The number of children of every element, at least 2. Defaults to 4.
+        key (Callable[[T], Any], optional): A function computing the comparison key of every element, called once per
+        element. Defaults to None.
+        reverse (bool, optional): Whether to sort in descending order, keeping equal elements in their original order.
+        Defaults to False.
+
+    Returns:
+        MutableSequence[T]: The sorted list.
+
+    Raises:
+        ValueError: If d is less than 2.
+
+    Time Complexity:
+        O(d n log_d n)
+
+    Space Complexity:
+        O(1) - sorting is done in-place, only a constant amount of extra memory is used.
+
+    Stability:
+        d-ary Heap Sort is unstable, it does not maintain the relative order of equal elements.
+
+    Examples:
+    >>> heap_sort_d_ary([])
+    []
+    >>> heap_sort_d_ary([1])
+    [1]
+    >>> heap_sort_d_ary([1, 2, 3, 4, 5, 1, 2, 3, 4, 5])
+    [1, 1, 2, 2, 3, 3, 4, 4, 5, 5]
+    >>> heap_sort_d_ary([1, 2, 3, 4, 5, 0, -1, -2, -3, -4, -5], d=8)
+    [-5, -4, -3, -2, -1, 0, 1, 2, 3, 4, 5]
+    >>> heap_sort_d_ary([10, 9, 8, 7, 6, 5, 4, 3, 2, 1], d=3)
+    [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+    >>> heap_sort_d_ary(['A', 'a', 'B', 'b', 'C', 'c', 'D', 'd', 'E', 'e'])
+    ['A', 'B', 'C', 'D', 'E', 'a', 'b', 'c', 'd', 'e']
+    >>> heap_sort_d_ary([5, 4, 3, 2, 1, 0], 1, 4)
+    [5, 1, 2, 3, 4, 0]
+    >>> heap_sort_d_ary(['bb', 'a', 'ccc', 'dd'], key=len)
+    ['a', 'bb', 'dd', 'ccc']
+    >>> heap_sort_d_ary([3, 1, 2, 1], reverse=True)
+    [3, 2, 1, 1]
     """
-    def heapify(array: List[T]) -> None:
-        """
-        Converts the given array into a max heap.
-
-        Args:
-            array (List[T]): The array to convert into a max heap.
-        """
-        n = len(array)
-        for i in range(n // 2 - 1, -1, -1):
-            fall(array, i, n)
-
-    def fall(array: List[T], index: int, n: int) -> None:
-        """
-        Moves the element at the given index down to maintain the max heap property.
-
-        Args:
-            array (List[T]): The array representing the heap.
-            index (int): The index of the element to fall.
-            n (int): The number of elements in the heap portion of the array.
-        """
-        while index * 2 + 1 < n:
-            left = index * 2 + 1
-            right = index * 2 + 2
-            largest = index
-
-            if left < n and array[left] > array[largest]:
-                largest = left
-            if right < n and array[right] > array[largest]:
-                largest = right
-
-            if largest != index:
-                array[index], array[largest] = array[largest], array[index]
-                index = largest
-            else:
-                break
+    if d < 2:
+        raise ValueError("Arity must be at least 2.")
+
+    if key is not None or reverse:
+        return sort_by_key(lambda pairs: heap_sort_d_ary(pairs, d=d), array, key, reverse, low, high)
 
     n = len(array)
 
-    heapify(array)
+    high = n-1 if high is None else high
+
+    size = high - low + 1
+    for i in range((size - 2) // d, -1, -1):
+        fall_d_ary(array, i, size, d, low)
+
+    for i in range(high - low, 0, -1):
+        array[low], array[low + i] = array[low + i], array[low]
+        fall_d_ary(array, 0, i, d, low)
+
+    return array
+
+
+def partial_sort(array: MutableSequence[T], k: int, key: Callable[[T], Any] = None,
+                 reverse: bool = False) -> MutableSequence[T]:
+    """
+    Rearranges a list so that its first k elements are its k smallest elements, in ascending order.
+
+    The first k elements are turned into a max heap, whose root is the largest of the smallest elements seen so far.
+    Every remaining element that is smaller than the root replaces it and falls into place, and the heap is finally
+    sorted in place as in Heap Sort. The order of the other elements is unspecified.
+
+    With a key function or in descending order, the indices of the first k elements are found with nsmallest or
+    nlargest instead, which keeps equal elements in their original order, and the other elements follow in their
+    original order.
+
+    Args:
+        array (MutableSequence[T]): The list to be partially sorted.
+        k (int): The number of smallest elements to sort to the front of the list.
+        key (Callable[[T], Any], optional): A function computing the comparison key of every element, called once per
+        element. Defaults to None.
+        reverse (bool, optional): Whether to sort the k largest elements to the front in descending order, keeping
+        equal elements in their original order. Defaults to False.
+
+    Returns:
+        MutableSequence[T]: The partially sorted list.
+
+    Time Complexity:
+        O(n log k)
+
+    Space Complexity:
+        O(1) - sorting is done in-place, only a constant amount of extra memory is used. O(n) with a key function or
+        in descending order.
+
+    Stability:
+        Partial sorting is unstable, it does not maintain the relative order of equal elements. With a key function
+        or in descending order, it is stable.
+
+    Examples:
+    >>> partial_sort([], 3)
+    []
+    >>> partial_sort([5, 1, 4, 2, 3], 2)[:2]
+    [1, 2]
+    >>> partial_sort([10, 9, 8, 7, 6, 5, 4, 3, 2, 1], 4)[:4]
+    [1, 2, 3, 4]
+    >>> partial_sort([3, 1, 2], 5)
+    [1, 2, 3]
+    >>> partial_sort(['bb', 'a', 'ccc', 'dd', 'e'], 3, key=len)
+    ['a', 'e', 'bb', 'ccc', 'dd']
+    >>> partial_sort([3, 1, 4, 1, 5], 2, reverse=True)
+    [5, 4, 3, 1, 1]
+    """
+    if key is not None or reverse:
+        values = list(array)
+        keys = values if key is None else [key(x) for x in values]
+        front = (nlargest if reverse else nsmallest)(range(len(values)), k, key=keys.__getitem__)
+        chosen = set(front)
+        assign_slice(array, 0, [values[i] for i in front] + [values[i] for i in range(len(values)) if i not in chosen])
+        return array
 
-    for i in range(n - 1, 0, -1):
+    n = len(array)
+    k = min(k, n)
+
+    if k <= 0:
+        return array
+
+    heapify(array, 0, k - 1)
+
+    for i in range(k, n):
+        if array[i] < array[0]:
+            array[0], array[i] = array[i], array[0]
+            fall(array, 0, k)
+
+    for i in range(k - 1, 0, -1):
         array[0], array[i] = array[i], array[0]
         fall(array, 0, i)
 
     return array
 
 
+def nsmallest(iterable: Iterable[T], k: int, key: Callable[[T], Any] = None) -> List[T]:
+    """
+    Finds the k smallest elements of an iterable, in ascending order.
+
+    The elements are scanned once while keeping a max heap of the k smallest elements seen so far. An element only
+    enters the heap if it is smaller than the root, which then falls into place, so most elements of a long input
+    cost a single comparison. Every element is decorated with its key and position, so equal elements are returned
+    in their original order and the elements themselves are never compared.
+
+    Args:
+        iterable (Iterable[T]): The elements to select from, which may be an iterator.
+        k (int): The number of elements to find.
+        key (Callable[[T], Any], optional): A function computing the comparison key of every element, called once per
+        element. Defaults to None.
+
+    Returns:
+        List[T]: The k smallest elements, or every element if there are fewer than k, in ascending order.
+
+    Time Complexity:
+        O(n log k)
+
+    Space Complexity:
+        O(k) - additional space is used for the heap.
+
+    Stability:
+        Equal elements are returned in their original order.
+
+    Examples:
+    >>> nsmallest([], 3)
+    []
+    >>> nsmallest([5, 1, 4, 2, 3], 2)
+    [1, 2]
+    >>> nsmallest(iter(range(10, 0, -1)), 3)
+    [1, 2, 3]
+    >>> nsmallest(['bb', 'a', 'ccc', 'dd', 'e'], 3, key=len)
+    ['a', 'e', 'bb']
+    """
+    if k <= 0:
+        return []
+
+    heap = []
+    for i, x in enumerate(iterable):
+        entry = (x if key is None else key(x), i, x)
+        if len(heap) < k:
+            heap.append(entry)
+            if len(heap) == k:
+                heapify(heap)
+        elif entry[0] < heap[0][0]:
+            heap[0] = entry
+            fall(heap, 0, k)
+
+    heap_sort(heap)
+
+    return [x for _, _, x in heap]
+
+
+def nlargest(iterable: Iterable[T], k: int, key: Callable[[T], Any] = None) -> List[T]:
+    """
+    Finds the k largest elements of an iterable, in descending order.
+
+    The elements are scanned once while keeping a min heap of the k largest elements seen so far, mirroring
+    nsmallest. Every element is decorated with its key and negated position, so equal elements are returned in their
+    original order and the elements themselves are never compared.
+
+    Args:
+        iterable (Iterable[T]): The elements to select from, which may be an iterator.
+        k (int): The number of elements to find.
+        key (Callable[[T], Any], optional): A function computing the comparison key of every element, called once per
+        element. Defaults to None.
+
+    Returns:
+        List[T]: The k largest elements, or every element if there are fewer than k, in descending order.
+
+    Time Complexity:
+        O(n log k)
+
+    Space Complexity:
+        O(k) - additional space is used for the heap.
+
+    Stability:
+        Equal elements are returned in their original order.
+
+    Examples:
+    >>> nlargest([], 3)
+    []
+    >>> nlargest([5, 1, 4, 2, 3], 2)
+    [5, 4]
+    >>> nlargest(iter(range(10)), 3)
+    [9, 8, 7]
+    >>> nlargest(['bb', 'a', 'ccc', 'dd', 'e'], 3, key=len)
+    ['ccc', 'bb', 'dd']
+    """
+    if k <= 0:
+        return []
+
+    heap = []
+    for i, x in enumerate(iterable):
+        entry = (x if key is None else key(x), -i, x)
+        if len(heap) < k:
+            heap.append(entry)
+            if len(heap) == k:
+                for j in range(k // 2 - 1, -1, -1):
+                    fall_min(heap, j, k)
+        elif entry[0] > heap[0][0]:
+            heap[0] = entry
+            fall_min(heap, 0, k)
+
+    heap_sort(heap)
+    heap.reverse()
+
+    return [x for _, _, x in heap]
+
+
 if __name__ == '__main__':
     import doctest
     doctest.testmod()
@@ -1,19 +1,23 @@
 """
 Insertion Sort Algorithm Implementation
 
-This module contains an implementation of the Insertion Sort algorithm.
+This module contains implementations of the Insertion Sort, Binary Insertion Sort and Shell Sort algorithms.
 
 Author: Aflah Hanif Amarlyadi
 Date: 2024-09-11
 License: MIT
 """
 
-from typing import List, TypeVar
+from typing import Any, Callable, List, MutableSequence, TypeVar
+from algorithms.sorting.sort_by_key import sort_by_key
 
 T = TypeVar('T')
 
+CIURA_GAPS = [1, 4, 10, 23, 57, 132, 301, 701, 1750]
 
-def insertion_sort(array: List[T]) -> List[T]:
+
+def insertion_sort(array: MutableSequence[T], low: int = 0, high: int = None, key: Callable[[T], Any] = None,
+                   reverse: bool = False) -> MutableSequence[T]:
     """
     Sorts a list in ascending order using the Insertion Sort algorithm.
 
@@ -21,10 +25,16 @@ def insertion_sort(array: List[T]) -> List[T]:
     It is particularly efficient for small data sets or nearly sorted data.
 
     Args:
-        array (List[T]): The list to be sorted.
+        array (MutableSequence[T]): The list to be sorted.
+        low (int, optional): The lower index of the sublist. Defaults to 0.
+        high (int, optional): The upper index of the sublist. Defaults to None.
+        key (Callable[[T], Any], optional): A function computing the comparison key of every element, called once per
+        element. Defaults to None.
+        reverse (bool, optional): Whether to sort in descending order, keeping equal elements in their original order.
+        Defaults to False.
 
     Returns:
-        List[T]: The sorted list.
+        MutableSequence[T]: The sorted list.
 
     Time Complexity:
         Best Case: O(n) - occurs when the list is already sorted.
@@ -52,14 +62,25 @@ def insertion_sort(array: List[T]) -> List[T]:
     [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
     >>> insertion_sort(['A', 'a', 'B', 'b', 'C', 'c', 'D', 'd', 'E', 'e'])
     ['A', 'B', 'C', 'D', 'E', 'a', 'b', 'c', 'd', 'e']
+    >>> insertion_sort([5, 4, 3, 2, 1, 0], 1, 4)
+    [5, 1, 2, 3, 4, 0]
+    >>> insertion_sort(['bb', 'a', 'ccc', 'dd'], key=len)
+    ['a', 'bb', 'dd', 'ccc']
+    >>> insertion_sort([3, 1, 2, 1], reverse=True)
+    [3, 2, 1, 1]
     """
+    if key is not None or reverse:
+        return sort_by_key(insertion_sort, array, key, reverse, low, high)
+
     n = len(array)
 
-    for i in range(1, n):
+    high = n-1 if high is None else high
+
+    for i in range(low + 1, high + 1):
         key = array[i]
         j = i - 1
         
-        while j >= 0 and key < array[j]:
+        while j >= low and key < array[j]:
             array[j+1] = array[j]
             j -= 1
         
@@ -68,6 +89,209 @@ def insertion_sort(array: List[T]) -> List[T]:
     return array
 
 
+def binary_insertion_sort(array: MutableSequence[T], low: int = 0, high: int = None, start: int = None,
+                          key: Callable[[T], Any] = None, reverse: bool = False) -> MutableSequence[T]:
+    """
+    Sorts a list in ascending order using the Binary Insertion Sort algorithm.
+
+    Binary Insertion Sort is Insertion Sort that finds the place of every element in the sorted part with a binary
+    search, so it makes only O(n log n) comparisons, which pays off when comparisons are expensive. The elements
+    after that place are then shifted with a single slice assignment. If the start of the sublist is known to be
+    sorted already, as for the runs of Tim Sort, start skips it.
+
+    Args:
+        array (MutableSequence[T]): The list to be sorted.
+        low (int, optional): The lower index of the sublist. Defaults to 0.
+        high (int, optional): The upper index of the sublist. Defaults to None.
+        start (int, optional): The index of the first element not known to be sorted. Defaults to low + 1.
+        key (Callable[[T], Any], optional): A function computing the comparison key of every element, called once per
+        element. Defaults to None.
+        reverse (bool, optional): Whether to sort in descending order, keeping equal elements in their original order.
+        Defaults to False.
+
+    Returns:
+        MutableSequence[T]: The sorted list.
+
+    Time Complexity:
+        Best Case: O(n log n) - with O(n log n) comparisons and no moves, when the list is already sorted.
+        Average Case: O(n^2) - with O(n log n) comparisons and O(n^2) moves.
+        Worst Case: O(n^2) - with O(n log n) comparisons and O(n^2) moves.
+
+    Space Complexity:
+        O(n) - for the slices that shift the elements.
+
+    Stability:
+        Binary Insertion Sort is stable, maintaining the relative order of equal elements.
+
+    Examples:
+    >>> binary_insertion_sort([])
+    []
+    >>> binary_insertion_sort([1])
+    [1]
+    >>> binary_insertion_sort([1, 2, 3, 4, 5, 1, 2, 3, 4, 5])
+    [1, 1, 2, 2, 3, 3, 4, 4, 5, 5]
+    >>> binary_insertion_sort([1, 2, 3, 4, 5, 0, -1, -2, -3, -4, -5])
+    [-5, -4, -3, -2, -1, 0, 1, 2, 3, 4, 5]
+    >>> binary_insertion_sort([10, 9, 8, 7, 6, 5, 4, 3, 2, 1])
+    [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+    >>> binary_insertion_sort(['A', 'a', 'B', 'b', 'C', 'c', 'D', 'd', 'E', 'e'])
+    ['A', 'B', 'C', 'D', 'E', 'a', 'b', 'c', 'd', 'e']
+    >>> binary_insertion_sort([5, 4, 3, 2, 1, 0], 1, 4)
+    [5, 1, 2, 3, 4, 0]
+    >>> binary_insertion_sort([1, 3, 5, 2, 4], start=3)
+    [1, 2, 3, 4, 5]
+    >>> binary_insertion_sort(['bb', 'a', 'ccc', 'dd'], key=len)
+    ['a', 'bb', 'dd', 'ccc']
+    >>> binary_insertion_sort([3, 1, 2, 1], reverse=True)
+    [3, 2, 1, 1]
+    """
+    if key is not None or reverse:
+        return sort_by_key(binary_insertion_sort, array, key, reverse, low, high)
+
+    n = len(array)
+
+    high = n-1 if high is None else high
+    start = low + 1 if start is None else max(start, low + 1)
+
+    for i in range(start, high + 1):
+        item = array[i]
+
+        # Find the position after the last element not greater than the item, which keeps the sort stable
+        left, right = low, i
+        while left < right:
+            mid = (left + right) // 2
+            if item < array[mid]:
+                right = mid
+            else:
+                left = mid + 1
+
+        if left < i:
+            array[left + 1:i + 1] = array[left:i]
+            array[left] = item
+
+    return array
+
+
+def shell_sort_gaps(n: int, sequence: str = 'ciura') -> List[int]:
+    """
+    Generates the gaps of Shell Sort for a list of the given length, in descending order.
+
+    Args:
+        n (int): The length of the list.
+        sequence (str, optional): The gap sequence, either 'ciura' or 'tokuda'. Defaults to 'ciura'.
+
+    Returns:
+        List[int]: The gaps less than n, ending with 1.
+
+    Raises:
+        ValueError: If the gap sequence is unknown.
+
+    Examples:
+    >>> shell_sort_gaps(1000)
+    [701, 301, 132, 57, 23, 10, 4, 1]
+    >>> shell_sort_gaps(5000)
+    [3937, 1750, 701, 301, 132, 57, 23, 10, 4, 1]
+    >>> shell_sort_gaps(1000, 'tokuda')
+    [525, 233, 103, 46, 20, 9, 4, 1]
+    """
+    if sequence == 'ciura':
+        # Ciura's empirically best gaps, extended by a factor of 2.25 beyond 1750
+        gaps = list(CIURA_GAPS)
+        while gaps[-1] < n:
+            gaps.append(int(gaps[-1] * 2.25))
+    elif sequence == 'tokuda':
+        # Tokuda's gaps, the ceiling of (9 * (9 / 4)^(k - 1) - 4) / 5, computed exactly with integers
+        gaps = []
+        k = 1
+        while not gaps or gaps[-1] < n:
+            numerator = 9 ** k - 4 ** k
+            denominator = 5 * 4 ** (k - 1)
+            gaps.append(-(-numerator // denominator))
+            k += 1
+    else:
+        raise ValueError(f"Unknown gap sequence: {sequence}.")
+
+    return [gap for gap in reversed(gaps) if gap < n] or [1]
+
+
+def shell_sort(array: MutableSequence[T], low: int = 0, high: int = None, gaps: str = 'ciura',
+               key: Callable[[T], Any] = None, reverse: bool = False) -> MutableSequence[T]:
+    """
+    Sorts a list in ascending order using the Shell Sort algorithm.
+
+    Shell Sort is a generalisation of Insertion Sort that first sorts elements far apart from each other. For each
+    gap of a decreasing sequence, it insertion sorts the elements that are a gap apart, so elements move long
+    distances in few steps. The last gap is 1, a plain Insertion Sort on an almost sorted list. There is no
+    recursion, which makes it a good fit for mid-size lists.
+
+    Args:
+        array (MutableSequence[T]): The list to be sorted.
+        low (int, optional): The lower index of the sublist. Defaults to 0.
+        high (int, optional): The upper index of the sublist. Defaults to None.
+        gaps (str, optional): The gap sequence, either 'ciura' or 'tokuda'. Defaults to 'ciura'.
+        key (Callable[[T], Any], optional): A function computing the comparison key of every element, called once per
+        element. Defaults to None.
+        reverse (bool, optional): Whether to sort in descending order, keeping equal elements in their original order.
+        Defaults to False.
+
+    Returns:
+        MutableSequence[T]: The sorted list.
+
+    Raises:
+        ValueError: If the gap sequence is unknown.
+
+    Time Complexity:
+        Best Case: O(n log n) - occurs when the list is already sorted.
+        Average Case: Unknown for these gap sequences, empirically about O(n^1.25).
+        Worst Case: Unknown for these gap sequences, at most O(n^1.5).
+
+    Space Complexity:
+        O(1) - sorting is done in-place, only a constant amount of extra memory is used.
+
+    Stability:
+        Shell Sort is unstable, it does not maintain the relative order of equal elements.
+
+    Examples:
+    >>> shell_sort([])
+    []
+    >>> shell_sort([1])
+    [1]
+    >>> shell_sort([1, 2, 3, 4, 5, 1, 2, 3, 4, 5])
+    [1, 1, 2, 2, 3, 3, 4, 4, 5, 5]
+    >>> shell_sort([1, 2, 3, 4, 5, 0, -1, -2, -3, -4, -5])
+    [-5, -4, -3, -2, -1, 0, 1, 2, 3, 4, 5]
+    >>> shell_sort([10, 9, 8, 7, 6, 5, 4, 3, 2, 1], gaps='tokuda')
+    [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+    >>> shell_sort(['A', 'a', 'B', 'b', 'C', 'c', 'D', 'd', 'E', 'e'])
+    ['A', 'B', 'C', 'D', 'E', 'a', 'b', 'c', 'd', 'e']
+    >>> shell_sort([5, 4, 3, 2, 1, 0], 1, 4)
+    [5, 1, 2, 3, 4, 0]
+    >>> shell_sort(['bb', 'a', 'ccc', 'dd'], key=len)
+    ['a', 'bb', 'dd', 'ccc']
+    >>> shell_sort([3, 1, 2, 1], reverse=True)
+    [3, 2, 1, 1]
+    """
+    if key is not None or reverse:
+        return sort_by_key(lambda pairs: shell_sort(pairs, gaps=gaps), array, key, reverse, low, high)
+
+    n = len(array)
+
+    high = n-1 if high is None else high
+
+    for gap in shell_sort_gaps(high - low + 1, gaps):
+        for i in range(low + gap, high + 1):
+            item = array[i]
+            j = i - gap
+
+            while j >= low and item < array[j]:
+                array[j + gap] = array[j]
+                j -= gap
+
+            array[j + gap] = item
+
+    return array
+
+
 if __name__ == "__main__":
     import doctest
     doctest.testmod()
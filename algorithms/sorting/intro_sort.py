@@ -0,0 +1,132 @@
+"""
+Intro Sort Algorithm Implementation
+
+This module contains an implementation of the Intro Sort algorithm.
+
+Author: Aflah Hanif Amarlyadi
+Date: 2026-10-17
+License: MIT
+"""
+
+from typing import Any, Callable, MutableSequence, TypeVar
+from algorithms.sorting.heap_sort import heap_sort
+from algorithms.sorting.quick_sort import hoare_partition
+from algorithms.sorting.sort_by_key import sort_by_key
+from algorithms.sorting.sorting_network import MAX_NETWORK_SIZE, SORTERS
+import random
+
+T = TypeVar('T')
+
+NETWORK_THRESHOLD = MAX_NETWORK_SIZE
+
+
+def intro_sort(array: MutableSequence[T], low: int = 0, high: int = None, pivot: str = 'random',
+               rng: random.Random = None, key: Callable[[T], Any] = None, reverse: bool = False) -> MutableSequence[T]:
+    """
+    Sorts a list in ascending order using the Intro Sort algorithm.
+
+    Intro Sort is a hybrid sorting algorithm that begins with Quick Sort using Hoare's partitioning scheme and keeps
+    track of the recursion depth. Once the depth exceeds 2 * floor(log2(n)), the remaining sublist is sorted with Heap
+    Sort, which bounds the worst case to O(n log n). Sublists with at most NETWORK_THRESHOLD elements are sorted with
+    an optimal sorting network, which has lower constant factors on small inputs.
+
+    Args:
+        array (MutableSequence[T]): The list to be sorted.
+        low (int, optional): The lower index of the sublist. Defaults to 0.
+        high (int, optional): The upper index of the sublist. Defaults to None.
+        pivot (str, optional): The pivot selection strategy, one of PIVOT_STRATEGIES in pivot_selection. Defaults to
+        'random'.
+        rng (random.Random, optional): The random number generator for the 'random' pivot strategy, which makes runs
+        reproducible when seeded. Defaults to the random module.
+        key (Callable[[T], Any], optional): A function computing the comparison key of every element, called once per
+        element. Defaults to None.
+        reverse (bool, optional): Whether to sort in descending order, keeping equal elements in their original order.
+        Defaults to False.
+
+    Returns:
+        MutableSequence[T]: The sorted list.
+
+    Time Complexity:
+        Best Case: O(n log n)
+        Average Case: O(n log n)
+        Worst Case: O(n log n) - Heap Sort takes over once the partitions become too unbalanced.
+
+    Space Complexity:
+        O(log n) - additional space is used for the recursive call stack.
+
+    Stability:
+        Intro Sort is unstable, it does not maintain the relative order of equal elements.
+
+    Examples:
+    >>> intro_sort([])
+    []
+    >>> intro_sort([1])
+    [1]
+    >>> intro_sort([1, 2, 3, 4, 5, 1, 2, 3, 4, 5])
+    [1, 1, 2, 2, 3, 3, 4, 4, 5, 5]
+    >>> intro_sort([1, 2, 3, 4, 5, 0, -1, -2, -3, -4, -5])
+    [-5, -4, -3, -2, -1, 0, 1, 2, 3, 4, 5]
+    >>> intro_sort([1, 2, 3, 4, 5, 6, 7, 8, 9, 10])
+    [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+    >>> intro_sort([10, 9, 8, 7, 6, 5, 4, 3, 2, 1])
+    [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+    >>> intro_sort(['A', 'a', 'B', 'b', 'C', 'c', 'D', 'd', 'E', 'e'])
+    ['A', 'B', 'C', 'D', 'E', 'a', 'b', 'c', 'd', 'e']
+    >>> intro_sort([i % 7 for i in range(100)]) == sorted(i % 7 for i in range(100))
+    True
+    >>> intro_sort(list(range(100, 0, -1)), pivot='ninther') == list(range(1, 101))
+    True
+    >>> intro_sort([i % 7 for i in range(100)], rng=random.Random(0)) == sorted(i % 7 for i in range(100))
+    True
+    >>> intro_sort(['bb', 'a', 'ccc', 'dd'], key=len)
+    ['a', 'bb', 'dd', 'ccc']
+    >>> intro_sort([3, 1, 2, 1], reverse=True)
+    [3, 2, 1, 1]
+    >>> from array import array
+    >>> intro_sort(array('d', [2.5, -1.0, 0.5]))
+    array('d', [-1.0, 0.5, 2.5])
+    """
+    if key is not None or reverse:
+        return sort_by_key(lambda pairs: intro_sort(pairs, pivot=pivot, rng=rng), array, key, reverse, low, high)
+
+    def sort(array: MutableSequence[T], low: int, high: int, depth: int) -> None:
+        """
+        Sorts the sublist with Quick Sort until the depth limit is reached, and small sublists with a sorting network.
+
+        Args:
+            array (MutableSequence[T]): The list to be sorted.
+            low (int): The lower index of the sublist.
+            high (int): The upper index of the sublist.
+            depth (int): The number of partitioning levels left before falling back to Heap Sort.
+        """
+        while high - low + 1 > NETWORK_THRESHOLD:
+            if depth == 0:
+                heap_sort(array, low, high)
+                return
+
+            depth -= 1
+            mid = hoare_partition(array, low, high, pivot, rng)
+
+            # Recurse into the smaller side and loop on the larger one
+            if mid - low < high - mid:
+                sort(array, low, mid, depth)
+                low = mid + 1
+            else:
+                sort(array, mid + 1, high, depth)
+                high = mid
+
+        SORTERS[high - low + 1](array, low)
+
+    n = len(array)
+
+    high = n-1 if high is None else high
+
+    if low < high:
+        sort(array, low, high, 2 * ((high - low + 1).bit_length() - 1))
+
+    return array
+
+
+if __name__ == "__main__":
+    import doctest
+    doctest.testmod()
@@ -1,19 +1,368 @@
 """
 Merge Sort Algorithm Implementation
 
-This module contains both iterative and recursive implementations of the Merge Sort algorithm.
+This module contains iterative, recursive and buffered implementations of the Merge Sort algorithm, and a streaming
+k-way merge of sorted iterables and its asynchronous counterpart.
 
 Author: Aflah Hanif Amarlyadi
 Date: 2024-09-11
 License: MIT
 """
 
-from typing import List, TypeVar
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Iterable, Iterator, List, MutableSequence, TypeVar
+from algorithms.sorting.sort_by_key import assign_slice, copy_slice, sort_by_key
+import asyncio
 
 T = TypeVar('T')
 
 
-def merge_sort_iterative(array: List[T]) -> List[T]:
+def merge(left: List[T], right: List[T]) -> List[T]:
+    """
+    Merges two sorted lists into one sorted list.
+
+    When elements are equal, the element from the left list is taken first, so merging is stable.
+
+    Args:
+        left (List[T]): The first sorted list.
+        right (List[T]): The second sorted list.
+
+    Returns:
+        List[T]: The merged sorted list.
+
+    Time Complexity:
+        O(n + m) - where n and m are the lengths of the two lists.
+
+    Examples:
+    >>> merge([1, 3, 5], [2, 4, 6])
+    [1, 2, 3, 4, 5, 6]
+    >>> merge([], [1])
+    [1]
+    """
+    merged = []
+    n, m = len(left), len(right)
+    i, j = 0, 0
+
+    while i < n or j < m:
+        if j == m or (i < n and left[i] <= right[j]):
+            merged.append(left[i])
+            i += 1
+        else:
+            merged.append(right[j])
+            j += 1
+
+    return merged
+
+
+class LoserTree:
+    """
+    A tournament tree of losers over the head elements of k sorted sources, used by the k-way merges.
+
+    Every internal node holds the source that lost the match played at that node, and the root holds the overall
+    winner, the source whose head comes first. When the winner advances to its next element, only the matches on
+    the path from its leaf to the root are replayed, so finding the next winner takes ceil(log2(k)) comparisons.
+    Ties are won by the source with the lower index, which makes the merge stable.
+
+    Attributes:
+        k (int): The number of sources.
+        key (Callable[[T], Any]): The function computing the comparison key of every element, or None.
+        reverse (bool): Whether the sources are sorted in descending order.
+        heads (List[T]): The current head element of every source.
+        keys (List[Any]): The comparison key of the head element of every source.
+        exhausted (List[bool]): Whether every source has run out of elements.
+        tree (List[int]): The winner at index 0 and the loser of every match at indices 1 to k - 1.
+    """
+
+    def __init__(self, k: int, key: Callable[[T], Any] = None, reverse: bool = False) -> None:
+        """
+        Initialises a tree over k sources with no head elements, which must be set before it is built.
+
+        Args:
+            k (int): The number of sources, at least 1.
+            key (Callable[[T], Any], optional): A function computing the comparison key of every element, called once
+            per element. Defaults to None.
+            reverse (bool, optional): Whether the sources are sorted in descending order. Defaults to False.
+        """
+        self.k = k
+        self.key = key
+        self.reverse = reverse
+        self.heads = [None] * k
+        self.keys = [None] * k
+        self.exhausted = [False] * k
+        self.tree = [0] * k
+
+    def set_head(self, source: int, element: T) -> None:
+        """
+        Sets the head element of a source.
+
+        Args:
+            source (int): The index of the source.
+            element (T): The new head element.
+        """
+        self.heads[source] = element
+        self.keys[source] = element if self.key is None else self.key(element)
+
+    def exhaust(self, source: int) -> None:
+        """
+        Marks a source as having run out of elements, so it loses every match.
+
+        Args:
+            source (int): The index of the source.
+        """
+        self.heads[source] = self.keys[source] = None
+        self.exhausted[source] = True
+
+    def beats(self, a: int, b: int) -> bool:
+        """
+        Plays a match between the heads of two sources.
+
+        Args:
+            a (int): The index of the first source.
+            b (int): The index of the second source.
+
+        Returns:
+            bool: Whether the head of source a comes before the head of source b.
+        """
+        if self.exhausted[a]:
+            return False
+        if self.exhausted[b]:
+            return True
+
+        first, second = (self.keys[b], self.keys[a]) if self.reverse else (self.keys[a], self.keys[b])
+        if second < first:
+            return False
+        return first < second or a < b
+
+    def build(self) -> int:
+        """
+        Plays every match of the tournament once all head elements are set.
+
+        Returns:
+            int: The index of the winning source.
+        """
+        def play(node: int) -> int:
+            """
+            Plays the matches of a subtree, recording the loser of every match.
+
+            Args:
+                node (int): The index of the root of the subtree, where the leaves are k to 2k - 1.
+
+            Returns:
+                int: The index of the winning source of the subtree.
+            """
+            if node >= self.k:
+                return node - self.k
+
+            left, right = play(2 * node), play(2 * node + 1)
+            if self.beats(left, right):
+                self.tree[node] = right
+                return left
+            self.tree[node] = left
+            return right
+
+        self.tree[0] = play(1)
+        return self.tree[0]
+
+    def replay(self, source: int) -> int:
+        """
+        Replays the matches from the leaf of a source to the root, after its head element has changed.
+
+        Args:
+            source (int): The index of the source, which must be the previous winner.
+
+        Returns:
+            int: The index of the winning source.
+        """
+        tree = self.tree
+        winner = source
+        node = (source + self.k) // 2
+
+        while node:
+            if self.beats(tree[node], winner):
+                tree[node], winner = winner, tree[node]
+            node //= 2
+
+        tree[0] = winner
+        return winner
+
+
+def k_way_merge(*iterables: Iterable[T], key: Callable[[T], Any] = None, reverse: bool = False) -> Iterator[T]:
+    """
+    Merges sorted iterables into one sorted stream, yielding the elements lazily.
+
+    The head element of every iterable is kept in a LoserTree, so the next element is found with ceil(log2(k))
+    comparisons. Only one element per iterable is held at a time, and the iterables are consumed only as far as the
+    merged stream is, so they may be generators, files or other lazy sources of any length.
+
+    Args:
+        *iterables (Iterable[T]): The sorted iterables.
+        key (Callable[[T], Any], optional): A function computing the comparison key of every element, called once per
+        element. Defaults to None.
+        reverse (bool, optional): Whether the iterables are sorted in descending order. Defaults to False.
+
+    Returns:
+        Iterator[T]: The merged elements.
+
+    Time Complexity:
+        O(n log k) - where n is the total number of elements and k is the number of iterables.
+
+    Space Complexity:
+        O(k) - regardless of the total number of elements.
+
+    Stability:
+        The merge is stable, equal elements are yielded in the order of the iterables they come from.
+
+    Examples:
+    >>> list(k_way_merge())
+    []
+    >>> list(k_way_merge([1, 4, 7], [2, 5, 8], [3, 6, 9]))
+    [1, 2, 3, 4, 5, 6, 7, 8, 9]
+    >>> list(k_way_merge([], [1], [], [0, 2]))
+    [0, 1, 2]
+    >>> list(k_way_merge(iter('ace'), (c for c in 'bdf')))
+    ['a', 'b', 'c', 'd', 'e', 'f']
+    >>> list(k_way_merge(['a', 'ccc'], ['bb', 'dd'], key=len))
+    ['a', 'bb', 'dd', 'ccc']
+    >>> list(k_way_merge([(3, 'x'), (1, 'x')], [(3, 'y'), (2, 'y')], key=lambda pair: pair[0], reverse=True))
+    [(3, 'x'), (3, 'y'), (2, 'y'), (1, 'x')]
+    """
+    iterators = [iter(iterable) for iterable in iterables]
+    if not iterators:
+        return
+
+    tree = LoserTree(len(iterators), key, reverse)
+
+    for source, iterator in enumerate(iterators):
+        for element in iterator:
+            tree.set_head(source, element)
+            break
+        else:
+            tree.exhaust(source)
+
+    winner = tree.build()
+
+    while not tree.exhausted[winner]:
+        yield tree.heads[winner]
+
+        for element in iterators[winner]:
+            tree.set_head(winner, element)
+            break
+        else:
+            tree.exhaust(winner)
+
+        winner = tree.replay(winner)
+
+
+async def async_k_way_merge(*iterables: AsyncIterable[T], key: Callable[[T], Any] = None, reverse: bool = False,
+                            buffer_size: int = 1) -> AsyncIterator[T]:
+    """
+    Merges sorted asynchronous iterables into one sorted asynchronous stream.
+
+    Every iterable is read by its own task, which prefetches elements into a queue of at most buffer_size elements
+    while the merge waits on other sources, so slow sources are read concurrently. Once a queue is full, its task
+    waits until the merge takes an element from it, so a source that runs ahead of the merge is held back rather
+    than buffered without bound. The elements are then merged with a LoserTree, as in k_way_merge.
+
+    If an iterable raises an exception, it is raised by the merged stream when the merge reaches that point of the
+    iterable. The reading tasks are cancelled once the merged stream is exhausted or closed.
+
+    Args:
+        *iterables (AsyncIterable[T]): The sorted asynchronous iterables.
+        key (Callable[[T], Any], optional): A function computing the comparison key of every element, called once per
+        element. Defaults to None.
+        reverse (bool, optional): Whether the iterables are sorted in descending order. Defaults to False.
+        buffer_size (int, optional): The maximum number of elements prefetched from every iterable. Defaults to 1.
+
+    Returns:
+        AsyncIterator[T]: The merged elements.
+
+    Raises:
+        ValueError: If buffer_size is less than 1.
+
+    Time Complexity:
+        O(n log k) - where n is the total number of elements and k is the number of iterables.
+
+    Space Complexity:
+        O(k * b) - where b is the buffer size, regardless of the total number of elements.
+
+    Stability:
+        The merge is stable, equal elements are yielded in the order of the iterables they come from.
+
+    Examples:
+    >>> async def stream(elements, delay=0):
+    ...     for element in elements:
+    ...         await asyncio.sleep(delay)
+    ...         yield element
+    >>> async def collect(merged):
+    ...     return [element async for element in merged]
+    >>> asyncio.run(collect(async_k_way_merge()))
+    []
+    >>> asyncio.run(collect(async_k_way_merge(stream([1, 4, 7], 0.002), stream([2, 5, 8]), stream([3, 6, 9], 0.001))))
+    [1, 2, 3, 4, 5, 6, 7, 8, 9]
+    >>> asyncio.run(collect(async_k_way_merge(stream(['a', 'ccc']), stream(['bb', 'dd']), key=len, buffer_size=4)))
+    ['a', 'bb', 'dd', 'ccc']
+    >>> asyncio.run(collect(async_k_way_merge(stream([3, 1]), stream([2]), reverse=True)))
+    [3, 2, 1]
+    """
+    if buffer_size < 1:
+        raise ValueError("Buffer size must be at least 1.")
+
+    if not iterables:
+        return
+
+    queues = [asyncio.Queue(maxsize=buffer_size) for _ in iterables]
+
+    async def prefetch(iterable: AsyncIterable[T], queue: asyncio.Queue) -> None:
+        """
+        Reads an iterable into its queue, followed by an end marker holding the exception it raised, if any.
+
+        Args:
+            iterable (AsyncIterable[T]): The sorted asynchronous iterable.
+            queue (asyncio.Queue): The queue of (has element, element or exception) pairs read from the iterable.
+        """
+        try:
+            async for element in iterable:
+                await queue.put((True, element))
+        except Exception as error:
+            await queue.put((False, error))
+        else:
+            await queue.put((False, None))
+
+    async def advance(source: int) -> None:
+        """
+        Takes the next element of a source from its queue as the head of the source.
+
+        Args:
+            source (int): The index of the source.
+        """
+        has_element, element = await queues[source].get()
+        if has_element:
+            tree.set_head(source, element)
+        elif element is not None:
+            raise element
+        else:
+            tree.exhaust(source)
+
+    tree = LoserTree(len(iterables), key, reverse)
+    tasks = [asyncio.ensure_future(prefetch(iterable, queue)) for iterable, queue in zip(iterables, queues)]
+
+    try:
+        for source in range(len(iterables)):
+            await advance(source)
+
+        winner = tree.build()
+
+        while not tree.exhausted[winner]:
+            yield tree.heads[winner]
+            await advance(winner)
+            winner = tree.replay(winner)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def merge_sort_iterative(array: MutableSequence[T], key: Callable[[T], Any] = None,
+                         reverse: bool = False) -> MutableSequence[T]:
     """
     Sorts a list in ascending order using the iterative Merge Sort algorithm.
 
@@ -23,10 +372,14 @@ def merge_sort_iterative(array: List[T]) -> List[T]:
     iteratively merging them.
 
     Args:
-        array (List[T]): The list to be sorted.
+        array (MutableSequence[T]): The list to be sorted.
+        key (Callable[[T], Any], optional): A function computing the comparison key of every element, called once per
+        element. Defaults to None.
+        reverse (bool, optional): Whether to sort in descending order, keeping equal elements in their original order.
+        Defaults to False.
 
     Returns:
-        List[T]: The sorted list.
+        MutableSequence[T]: The sorted list.
 
     Time Complexity:
         O(n log n)
@@ -52,31 +405,16 @@ def merge_sort_iterative(array: List[T]) -> List[T]:
     [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
     >>> merge_sort_iterative(['A', 'a', 'B', 'b', 'C', 'c', 'D', 'd', 'E', 'e'])
     ['A', 'B', 'C', 'D', 'E', 'a', 'b', 'c', 'd', 'e']
+    >>> merge_sort_iterative(['bb', 'a', 'ccc', 'dd'], key=len)
+    ['a', 'bb', 'dd', 'ccc']
+    >>> merge_sort_iterative([3, 1, 2, 1], reverse=True)
+    [3, 2, 1, 1]
+    >>> from array import array
+    >>> merge_sort_iterative(array('d', [2.5, -1.0, 0.5]))
+    array('d', [-1.0, 0.5, 2.5])
     """
-    def merge(left: List[T], right: List[T]) -> List[T]:
-        """
-        Merges two sorted lists into one sorted list.
-
-        Args:
-            left (List[T]): The first sorted list.
-            right (List[T]): The second sorted list.
-
-        Returns:
-            List[T]: The merged sorted list.
-        """
-        merged = []
-        n, m = len(left), len(right)
-        i, j = 0, 0
-
-        while i < n or j < m:
-            if j == m or (i < n and left[i] <= right[j]):
-                merged.append(left[i])
-                i += 1
-            else:
-                merged.append(right[j])
-                j += 1
-        
-        return merged
+    if key is not None or reverse:
+        return sort_by_key(merge_sort_iterative, array, key, reverse)
 
     n = len(array)
 
@@ -88,13 +426,121 @@ def merge_sort_iterative(array: List[T]) -> List[T]:
         for i in range(0, n, 2 * size):
             left = array[i:i + size]
             right = array[i + size:i + 2 * size]
-            array[i:i + 2 * size] = merge(left, right)
+            assign_slice(array, i, merge(left, right))
         size *= 2
 
     return array
 
 
-def merge_sort_recursive(array: List[T]) -> List[T]:
+def merge_sort_buffered(array: MutableSequence[T], key: Callable[[T], Any] = None,
+                        reverse: bool = False) -> MutableSequence[T]:
+    """
+    Sorts a list in ascending order using the buffered Merge Sort algorithm.
+
+    The buffered version is a bottom-up Merge Sort that allocates a single auxiliary buffer of size n up front,
+    instead of new sublists for every merge. Each pass merges pairs of sublists from one list into the other, and
+    the roles of the list and the buffer alternate between passes. If the last element of the left sublist is not
+    greater than the first element of the right sublist, the pair is already in order and is copied without
+    merging. If the last pass ends in the buffer, the result is copied back into the list.
+
+    Args:
+        array (MutableSequence[T]): The list to be sorted.
+        key (Callable[[T], Any], optional): A function computing the comparison key of every element, called once per
+        element. Defaults to None.
+        reverse (bool, optional): Whether to sort in descending order, keeping equal elements in their original order.
+        Defaults to False.
+
+    Returns:
+        MutableSequence[T]: The sorted list.
+
+    Time Complexity:
+        Best Case: O(n log n) - occurs when the list is sorted, with only n - 1 comparisons as every merge is skipped.
+        Average Case: O(n log n)
+        Worst Case: O(n log n)
+
+    Space Complexity:
+        O(n) - additional space is used for the single auxiliary buffer.
+
+    Stability:
+        Merge Sort is stable, it maintains the relative order of equal elements.
+
+    Examples:
+    >>> merge_sort_buffered([])
+    []
+    >>> merge_sort_buffered([1])
+    [1]
+    >>> merge_sort_buffered([1, 2, 3, 4, 5, 1, 2, 3, 4, 5])
+    [1, 1, 2, 2, 3, 3, 4, 4, 5, 5]
+    >>> merge_sort_buffered([1, 2, 3, 4, 5, 0, -1, -2, -3, -4, -5])
+    [-5, -4, -3, -2, -1, 0, 1, 2, 3, 4, 5]
+    >>> merge_sort_buffered([1, 2, 3, 4, 5, 6, 7, 8, 9, 10])
+    [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+    >>> merge_sort_buffered([10, 9, 8, 7, 6, 5, 4, 3, 2, 1])
+    [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+    >>> merge_sort_buffered(['A', 'a', 'B', 'b', 'C', 'c', 'D', 'd', 'E', 'e'])
+    ['A', 'B', 'C', 'D', 'E', 'a', 'b', 'c', 'd', 'e']
+    >>> merge_sort_buffered(['bb', 'a', 'ccc', 'dd'], key=len)
+    ['a', 'bb', 'dd', 'ccc']
+    >>> merge_sort_buffered([3, 1, 2, 1], reverse=True)
+    [3, 2, 1, 1]
+    >>> from array import array
+    >>> buffer = array('i', [3, 1, 2])
+    >>> view = merge_sort_buffered(memoryview(buffer))
+    >>> buffer
+    array('i', [1, 2, 3])
+    """
+    if key is not None or reverse:
+        return sort_by_key(merge_sort_buffered, array, key, reverse)
+
+    n = len(array)
+
+    if n <= 1:
+        return array
+
+    source, target = array, copy_slice(array, 0, n)
+
+    size = 1
+    while size < n:
+        for low in range(0, n, 2 * size):
+            mid = min(low + size, n)
+            high = min(low + 2 * size, n)
+
+            # The pair is already in order, or there is no right sublist
+            if mid == high or source[mid - 1] <= source[mid]:
+                for k in range(low, high):
+                    target[k] = source[k]
+                continue
+
+            i, j, k = low, mid, low
+            while i < mid and j < high:
+                if source[i] <= source[j]:
+                    target[k] = source[i]
+                    i += 1
+                else:
+                    target[k] = source[j]
+                    j += 1
+                k += 1
+
+            # Only one of the sublists has elements left
+            while i < mid:
+                target[k] = source[i]
+                i += 1
+                k += 1
+            while j < high:
+                target[k] = source[j]
+                j += 1
+                k += 1
+
+        source, target = target, source
+        size *= 2
+
+    if source is not array:
+        array[:] = source
+
+    return array
+
+
+def merge_sort_recursive(array: List[T], key: Callable[[T], Any] = None, reverse: bool = False) -> List[T]:
     """
     Sorts a list in ascending order using the recursive Merge Sort algorithm.
 
@@ -105,6 +551,10 @@ def merge_sort_recursive(array: List[T]) -> List[T]:
 
     Args:
         array (List[T]): The list to be sorted.
+        key (Callable[[T], Any], optional): A function computing the comparison key of every element, called once per
+        element. Defaults to None.
+        reverse (bool, optional): Whether to sort in descending order, keeping equal elements in their original order.
+        Defaults to False.
 
     Returns:
         List[T]: The sorted list.
@@ -133,32 +583,13 @@ def merge_sort_recursive(array: List[T]) -> List[T]:
     [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
     >>> merge_sort_recursive(['A', 'a', 'B', 'b', 'C', 'c', 'D', 'd', 'E', 'e'])
     ['A', 'B', 'C', 'D', 'E', 'a', 'b', 'c', 'd', 'e']
+    >>> merge_sort_recursive(['bb', 'a', 'ccc', 'dd'], key=len)
+    ['a', 'bb', 'dd', 'ccc']
+    >>> merge_sort_recursive([3, 1, 2, 1], reverse=True)
+    [3, 2, 1, 1]
     """
-
-    def merge(left: List[T], right: List[T]) -> List[T]:
-        """
-        Merges two sorted lists into one sorted list.
-
-        Args:
-            left (List[T]): The first sorted list.
-            right (List[T]): The second sorted list.
-
-        Returns:
-            List[T]: The merged sorted list.
-        """
-        merged = []
-        n, m = len(left), len(right)
-        i, j = 0, 0
-
-        while i < n or j < m:
-            if j == m or (i < n and left[i] <= right[j]):
-                merged.append(left[i])
-                i += 1
-            else:
-                merged.append(right[j])
-                j += 1
-
-        return merged
+    if key is not None or reverse:
+        return sort_by_key(merge_sort_recursive, array, key, reverse, in_place=False)
 
     n = len(array)
 
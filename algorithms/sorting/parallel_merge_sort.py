@@ -0,0 +1,183 @@
+"""
+Parallel Merge Sort Algorithm Implementation
+
+This module contains a multi-process implementation of the Merge Sort algorithm.
+
+Author: Aflah Hanif Amarlyadi
+Date: 2026-10-17
+License: MIT
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, List, Tuple, TypeVar
+from algorithms.sorting.merge_sort import merge, merge_sort_recursive
+from algorithms.sorting.sort_by_key import sort_by_key
+import os
+
+T = TypeVar('T')
+
+SEQUENTIAL_THRESHOLD = 100000
+
+
+def co_rank(k: int, left: List[T], right: List[T]) -> int:
+    """
+    Finds how many elements of the left list are among the first k elements of the stable merge of two sorted lists.
+
+    Together with k - i elements of the right list, the first i elements of the left list form the first k elements
+    of the merged output, which lets independent workers merge disjoint segments of the output (the merge path).
+
+    Args:
+        k (int): The number of elements in the prefix of the merged output, between 0 and len(left) + len(right).
+        left (List[T]): The first sorted list.
+        right (List[T]): The second sorted list.
+
+    Returns:
+        int: The number i of elements taken from the left list.
+
+    Time Complexity:
+        O(log min(n, m)) - where n and m are the lengths of the two lists.
+
+    Examples:
+    >>> co_rank(3, [1, 3, 5], [2, 4, 6])
+    2
+    >>> co_rank(2, [1, 1], [1, 1])
+    2
+    """
+    low, high = max(0, k - len(right)), min(k, len(left))
+
+    while low < high:
+        i = (low + high) // 2
+        if left[i] <= right[k - i - 1]:
+            low = i + 1
+        else:
+            high = i
+
+    return low
+
+
+def merge_path_splits(left: List[T], right: List[T], parts: int) -> List[Tuple[int, int, int, int]]:
+    """
+    Splits the merge of two sorted lists into segments of near-equal size that can be merged independently.
+
+    Args:
+        left (List[T]): The first sorted list.
+        right (List[T]): The second sorted list.
+        parts (int): The number of segments.
+
+    Returns:
+        List[Tuple[int, int, int, int]]: The bounds (i0, i1, j0, j1) of every segment, so that merging left[i0:i1]
+        with right[j0:j1] yields the segment of the output.
+
+    Examples:
+    >>> merge_path_splits([1, 3, 5, 7], [2, 4, 6, 8], 2)
+    [(0, 2, 0, 2), (2, 4, 2, 4)]
+    """
+    total = len(left) + len(right)
+    splits = []
+
+    i0 = j0 = 0
+    for part in range(1, parts + 1):
+        k = total * part // parts
+        i1 = co_rank(k, left, right)
+        j1 = k - i1
+        splits.append((i0, i1, j0, j1))
+        i0, j0 = i1, j1
+
+    return splits
+
+
+def parallel_merge_sort(array: List[T], workers: int = None, threshold: int = SEQUENTIAL_THRESHOLD,
+                        key: Callable[[T], Any] = None, reverse: bool = False) -> List[T]:
+    """
+    Sorts a list in ascending order using a multi-process Merge Sort algorithm.
+
+    The list is split into one chunk per worker and every chunk is sorted with Merge Sort in a separate process.
+    The sorted chunks are then merged pairwise in rounds. Within a round, every merge is split along its merge path
+    into segments of equal size, found by co-ranking, so all workers stay busy even in the final merge of two halves.
+
+    Lists with fewer than threshold elements are sorted sequentially, as the cost of starting processes and copying
+    the data to them outweighs the gain.
+
+    Args:
+        array (List[T]): The list to be sorted. Its elements must be picklable.
+        workers (int, optional): The number of worker processes. Defaults to the number of CPUs.
+        threshold (int, optional): The minimum length of list sorted in parallel. Defaults to SEQUENTIAL_THRESHOLD.
+        key (Callable[[T], Any], optional): A function computing the comparison key of every element, called once per
+        element. Defaults to None.
+        reverse (bool, optional): Whether to sort in descending order, keeping equal elements in their original order.
+        Defaults to False.
+
+    Returns:
+        List[T]: The sorted list.
+
+    Time Complexity:
+        O((n log n) / p + n log p) - where p is the number of workers, excluding the cost of copying the data between
+        processes.
+
+    Space Complexity:
+        O(n) - additional space is used for the sorted chunks and the merged segments.
+
+    Stability:
+        Parallel Merge Sort is stable, it maintains the relative order of equal elements.
+
+    Examples:
+    >>> parallel_merge_sort([])
+    []
+    >>> parallel_merge_sort([1])
+    [1]
+    >>> parallel_merge_sort([1, 2, 3, 4, 5, 1, 2, 3, 4, 5])
+    [1, 1, 2, 2, 3, 3, 4, 4, 5, 5]
+    >>> parallel_merge_sort([1, 2, 3, 4, 5, 0, -1, -2, -3, -4, -5], workers=2, threshold=0)
+    [-5, -4, -3, -2, -1, 0, 1, 2, 3, 4, 5]
+    >>> parallel_merge_sort([10, 9, 8, 7, 6, 5, 4, 3, 2, 1], workers=3, threshold=0)
+    [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+    >>> parallel_merge_sort(['A', 'a', 'B', 'b', 'C', 'c', 'D', 'd', 'E', 'e'], workers=4, threshold=0)
+    ['A', 'B', 'C', 'D', 'E', 'a', 'b', 'c', 'd', 'e']
+    >>> parallel_merge_sort(['bb', 'a', 'ccc', 'dd'], workers=2, threshold=0, key=len, reverse=True)
+    ['ccc', 'bb', 'dd', 'a']
+    """
+    if key is not None or reverse:
+        return sort_by_key(lambda pairs: parallel_merge_sort(pairs, workers, threshold), array, key, reverse,
+                           in_place=False)
+
+    n = len(array)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if n <= 1 or n < threshold or workers <= 1:
+        return merge_sort_recursive(array)
+
+    workers = min(workers, n)
+    size = -(-n // workers)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        runs = list(executor.map(merge_sort_recursive, [array[i:i + size] for i in range(0, n, size)]))
+
+        while len(runs) > 1:
+            pairs = len(runs) // 2
+            parts = max(1, workers // pairs)
+
+            futures = []
+            for p in range(pairs):
+                left, right = runs[2 * p], runs[2 * p + 1]
+                futures.append([executor.submit(merge, left[i0:i1], right[j0:j1])
+                                for i0, i1, j0, j1 in merge_path_splits(left, right, parts)])
+
+            merged = []
+            for segments in futures:
+                run = []
+                for future in segments:
+                    run.extend(future.result())
+                merged.append(run)
+
+            if len(runs) % 2 == 1:
+                merged.append(runs[-1])
+            runs = merged
+
+    return runs[0]
+
+
+if __name__ == "__main__":
+    import doctest
+    doctest.testmod()
@@ -0,0 +1,322 @@
+"""
+Pattern-Defeating Quick Sort Algorithm Implementation
+
+This module contains an implementation of the Pattern-Defeating Quick Sort (pdqsort) algorithm.
+
+Author: Aflah Hanif Amarlyadi
+Date: 2026-10-17
+License: MIT
+"""
+
+from typing import Any, Callable, MutableSequence, Tuple, TypeVar
+from algorithms.sorting.heap_sort import heap_sort
+from algorithms.sorting.insertion_sort import insertion_sort
+from algorithms.sorting.sort_by_key import sort_by_key
+
+T = TypeVar('T')
+
+INSERTION_SORT_THRESHOLD = 24
+NINTHER_THRESHOLD = 128
+PARTIAL_INSERTION_SORT_LIMIT = 8
+
+
+def pdq_sort(array: MutableSequence[T], low: int = 0, high: int = None, key: Callable[[T], Any] = None,
+             reverse: bool = False) -> MutableSequence[T]:
+    """
+    Sorts a list in ascending order using the Pattern-Defeating Quick Sort algorithm.
+
+    Pattern-Defeating Quick Sort is a Quick Sort that detects and defeats the patterns that make Quick Sort slow:
+    - The pivot is the median of three elements, or Tukey's ninther on large sublists.
+    - If partitioning moved no elements, the sublist may already be sorted, so a partial Insertion Sort that gives up
+      after PARTIAL_INSERTION_SORT_LIMIT moves is tried on both sides. Sorted inputs take linear time.
+    - If the pivot is equal to the element preceding the sublist (the pivot of a previous level), every element
+      equal to it is moved to the left and skipped, like the Dutch National Flag partitioning scheme. Many equal
+      elements take linear time.
+    - If a partition is highly unbalanced, a few elements are swapped around to break up the pattern. After
+      log2(n) such partitions, the sublist is sorted with Heap Sort, which bounds the worst case to O(n log n).
+    Sublists with fewer than INSERTION_SORT_THRESHOLD elements are sorted with Insertion Sort.
+
+    Args:
+        array (MutableSequence[T]): The list to be sorted.
+        low (int, optional): The lower index of the sublist. Defaults to 0.
+        high (int, optional): The upper index of the sublist. Defaults to None.
+        key (Callable[[T], Any], optional): A function computing the comparison key of every element, called once per
+        element. Defaults to None.
+        reverse (bool, optional): Whether to sort in descending order, keeping equal elements in their original order.
+        Defaults to False.
+
+    Returns:
+        MutableSequence[T]: The sorted list.
+
+    Time Complexity:
+        Best Case: O(n) - occurs when the list is sorted, or has few distinct elements.
+        Average Case: O(n log n)
+        Worst Case: O(n log n) - Heap Sort takes over once there have been too many unbalanced partitions.
+
+    Space Complexity:
+        O(log n) - additional space is used for the recursive call stack.
+
+    Stability:
+        Pattern-Defeating Quick Sort is unstable, it does not maintain the relative order of equal elements.
+
+    Examples:
+    >>> pdq_sort([])
+    []
+    >>> pdq_sort([1])
+    [1]
+    >>> pdq_sort([1, 2, 3, 4, 5, 1, 2, 3, 4, 5])
+    [1, 1, 2, 2, 3, 3, 4, 4, 5, 5]
+    >>> pdq_sort([1, 2, 3, 4, 5, 0, -1, -2, -3, -4, -5])
+    [-5, -4, -3, -2, -1, 0, 1, 2, 3, 4, 5]
+    >>> pdq_sort([1, 2, 3, 4, 5, 6, 7, 8, 9, 10])
+    [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+    >>> pdq_sort([10, 9, 8, 7, 6, 5, 4, 3, 2, 1])
+    [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+    >>> pdq_sort(['A', 'a', 'B', 'b', 'C', 'c', 'D', 'd', 'E', 'e'])
+    ['A', 'B', 'C', 'D', 'E', 'a', 'b', 'c', 'd', 'e']
+    >>> pdq_sort([i % 7 for i in range(1000)]) == sorted(i % 7 for i in range(1000))
+    True
+    >>> pdq_sort(['bb', 'a', 'ccc', 'dd'], key=len)
+    ['a', 'bb', 'dd', 'ccc']
+    >>> pdq_sort([3, 1, 2, 1], reverse=True)
+    [3, 2, 1, 1]
+    """
+    if key is not None or reverse:
+        return sort_by_key(pdq_sort, array, key, reverse, low, high)
+
+    def sort2(i: int, j: int) -> None:
+        """
+        Swaps the elements at the given indices if they are out of order.
+
+        Args:
+            i (int): The index of the first element.
+            j (int): The index of the second element.
+        """
+        if array[j] < array[i]:
+            array[i], array[j] = array[j], array[i]
+
+    def sort3(i: int, j: int, k: int) -> None:
+        """
+        Sorts the elements at the given indices, so the median ends up at index j.
+
+        Args:
+            i (int): The index of the first element.
+            j (int): The index of the second element.
+            k (int): The index of the third element.
+        """
+        sort2(i, j)
+        sort2(j, k)
+        sort2(i, j)
+
+    def swap(i: int, j: int) -> None:
+        """
+        Swaps the elements at the given indices.
+
+        Args:
+            i (int): The index of the first element.
+            j (int): The index of the second element.
+        """
+        array[i], array[j] = array[j], array[i]
+
+    def partition_right(begin: int, end: int) -> Tuple[int, bool]:
+        """
+        Partitions array[begin:end] around the pivot at array[begin], moving elements equal to the pivot to the right.
+
+        The sublist must contain an element not less than the pivot after the first position, which the median of
+        three guarantees.
+
+        Args:
+            begin (int): The index of the first element of the sublist, holding the pivot.
+            end (int): The index one past the last element of the sublist.
+
+        Returns:
+            Tuple[int, bool]: The final index of the pivot, and whether the sublist was already partitioned.
+        """
+        pivot = array[begin]
+
+        first = begin + 1
+        while array[first] < pivot:
+            first += 1
+
+        # Only guard the search if no element was less than the pivot, so none can stop it
+        last = end
+        if first - 1 == begin:
+            while first < last:
+                last -= 1
+                if array[last] < pivot:
+                    break
+        else:
+            last -= 1
+            while not array[last] < pivot:
+                last -= 1
+
+        already_partitioned = first >= last
+
+        while first < last:
+            swap(first, last)
+            first += 1
+            while array[first] < pivot:
+                first += 1
+            last -= 1
+            while not array[last] < pivot:
+                last -= 1
+
+        pivot_position = first - 1
+        array[begin] = array[pivot_position]
+        array[pivot_position] = pivot
+
+        return pivot_position, already_partitioned
+
+    def partition_left(begin: int, end: int) -> int:
+        """
+        Partitions array[begin:end] around the pivot at array[begin], moving elements equal to the pivot to the left.
+
+        Args:
+            begin (int): The index of the first element of the sublist, holding the pivot.
+            end (int): The index one past the last element of the sublist.
+
+        Returns:
+            int: The final index of the pivot. Every element to its left is equal to it.
+        """
+        pivot = array[begin]
+
+        last = end - 1
+        while pivot < array[last]:
+            last -= 1
+
+        first = begin
+        if last + 1 == end:
+            while first < last:
+                first += 1
+                if pivot < array[first]:
+                    break
+        else:
+            first += 1
+            while not pivot < array[first]:
+                first += 1
+
+        while first < last:
+            swap(first, last)
+            last -= 1
+            while pivot < array[last]:
+                last -= 1
+            first += 1
+            while not pivot < array[first]:
+                first += 1
+
+        array[begin] = array[last]
+        array[last] = pivot
+
+        return last
+
+    def partial_insertion_sort(begin: int, end: int) -> bool:
+        """
+        Attempts to sort array[begin:end] with Insertion Sort, giving up after too many element moves.
+
+        Args:
+            begin (int): The index of the first element of the sublist.
+            end (int): The index one past the last element of the sublist.
+
+        Returns:
+            bool: True if the sublist was sorted, False if the attempt was abandoned.
+        """
+        moves = 0
+        for i in range(begin + 1, end):
+            item = array[i]
+            j = i
+            while j > begin and item < array[j - 1]:
+                array[j] = array[j - 1]
+                j -= 1
+            array[j] = item
+
+            moves += i - j
+            if moves > PARTIAL_INSERTION_SORT_LIMIT:
+                return False
+
+        return True
+
+    def sort(begin: int, end: int, bad_allowed: int, leftmost: bool) -> None:
+        """
+        Sorts array[begin:end], recursing into the left part and looping on the right part.
+
+        Args:
+            begin (int): The index of the first element of the sublist.
+            end (int): The index one past the last element of the sublist.
+            bad_allowed (int): The number of highly unbalanced partitions left before falling back to Heap Sort.
+            leftmost (bool): Whether the sublist is at the start of the list, so no previous pivot precedes it.
+        """
+        while True:
+            size = end - begin
+
+            if size < INSERTION_SORT_THRESHOLD:
+                insertion_sort(array, begin, end - 1)
+                return
+
+            # Move the median of three, or Tukey's ninther, to the start of the sublist
+            half = size // 2
+            if size > NINTHER_THRESHOLD:
+                sort3(begin, begin + half, end - 1)
+                sort3(begin + 1, begin + half - 1, end - 2)
+                sort3(begin + 2, begin + half + 1, end - 3)
+                sort3(begin + half - 1, begin + half, begin + half + 1)
+                swap(begin, begin + half)
+            else:
+                sort3(begin + half, begin, end - 1)
+
+            # A pivot equal to the previous pivot means the sublist holds many equal elements, so skip all of them
+            if not leftmost and not array[begin - 1] < array[begin]:
+                begin = partition_left(begin, end) + 1
+                continue
+
+            pivot_position, already_partitioned = partition_right(begin, end)
+            left_size = pivot_position - begin
+            right_size = end - pivot_position - 1
+
+            if left_size < size // 8 or right_size < size // 8:
+                bad_allowed -= 1
+                if bad_allowed == 0:
+                    heap_sort(array, begin, end - 1)
+                    return
+
+                # Swap some elements around to break up the pattern that caused the unbalanced partition
+                if left_size >= INSERTION_SORT_THRESHOLD:
+                    quarter = left_size // 4
+                    swap(begin, begin + quarter)
+                    swap(pivot_position - 1, pivot_position - quarter)
+                    if left_size > NINTHER_THRESHOLD:
+                        swap(begin + 1, begin + quarter + 1)
+                        swap(begin + 2, begin + quarter + 2)
+                        swap(pivot_position - 2, pivot_position - quarter - 1)
+                        swap(pivot_position - 3, pivot_position - quarter - 2)
+
+                if right_size >= INSERTION_SORT_THRESHOLD:
+                    quarter = right_size // 4
+                    swap(pivot_position + 1, pivot_position + quarter + 1)
+                    swap(end - 1, end - quarter)
+                    if right_size > NINTHER_THRESHOLD:
+                        swap(pivot_position + 2, pivot_position + quarter + 2)
+                        swap(pivot_position + 3, pivot_position + quarter + 3)
+                        swap(end - 2, end - quarter - 1)
+                        swap(end - 3, end - quarter - 2)
+
+            elif already_partitioned and partial_insertion_sort(begin, pivot_position) and \
+                    partial_insertion_sort(pivot_position + 1, end):
+                return
+
+            sort(begin, pivot_position, bad_allowed, leftmost)
+            begin = pivot_position + 1
+            leftmost = False
+
+    n = len(array)
+
+    high = n-1 if high is None else high
+
+    if low < high:
+        sort(low, high + 1, (high - low + 1).bit_length() - 1, True)
+
+    return array
+
+
+if __name__ == "__main__":
+    import doctest
+    doctest.testmod()
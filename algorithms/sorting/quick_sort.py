@@ -8,13 +8,19 @@ Date: 2024-09-11
 License: MIT
 """
 
-from typing import List, Tuple, TypeVar
+from typing import Any, Callable, List, MutableSequence, Tuple, TypeVar
+from algorithms.selection.pivot_selection import select_pivot
+from algorithms.sorting.sort_by_key import sort_by_key
+from algorithms.sorting.sorting_network import MAX_NETWORK_SIZE, SORTERS
 import random
 
 T = TypeVar('T')
 
+NETWORK_THRESHOLD = MAX_NETWORK_SIZE
 
-def quick_sort(array: List[T]) -> List[T]:
+
+def quick_sort(array: List[T], pivot: str = 'random', rng: random.Random = None, key: Callable[[T], Any] = None,
+               reverse: bool = False) -> List[T]:
     """
     Sorts a list in ascending order using the Quick Sort algorithm.
 
@@ -24,6 +30,14 @@ def quick_sort(array: List[T]) -> List[T]:
 
     Args:
         array (List[T]): The list to be sorted.
+        pivot (str, optional): The pivot selection strategy, one of the PIVOT_STRATEGIES of pivot_selection. Defaults to
+        'random'.
+        rng (random.Random, optional): The random number generator for the 'random' pivot strategy. Defaults to the
+        random module.
+        key (Callable[[T], Any], optional): A function computing the comparison key of every element, called once per
+        element. Defaults to None.
+        reverse (bool, optional): Whether to sort in descending order, keeping equal elements in their original order.
+        Defaults to False.
 
     Returns:
         List[T]: The sorted list.
@@ -55,7 +69,18 @@ def quick_sort(array: List[T]) -> List[T]:
     [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
     >>> quick_sort(['A', 'a', 'B', 'b', 'C', 'c', 'D', 'd', 'E', 'e'])
     ['A', 'B', 'C', 'D', 'E', 'a', 'b', 'c', 'd', 'e']
+    >>> quick_sort([10, 9, 8, 7, 6, 5, 4, 3, 2, 1], pivot='median_of_three')
+    [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+    >>> quick_sort([3, 1, 2, 5, 4], rng=random.Random(0))
+    [1, 2, 3, 4, 5]
+    >>> quick_sort(['bb', 'a', 'ccc', 'dd'], key=len)
+    ['a', 'bb', 'dd', 'ccc']
+    >>> quick_sort([3, 1, 2, 1], reverse=True)
+    [3, 2, 1, 1]
     """
+    if key is not None or reverse:
+        return sort_by_key(lambda pairs: quick_sort(pairs, pivot, rng), array, key, reverse, in_place=False)
+
     n = len(array)
 
     if n <= 1:
@@ -65,19 +90,61 @@ def quick_sort(array: List[T]) -> List[T]:
     middle = []
     right = []
 
-    pivot = array[random.randint(0, n-1)]
+    value = array[select_pivot(array, 0, n - 1, pivot, rng)]
     for x in array:
-        if x < pivot:
+        if x < value:
             left.append(x)
-        elif x > pivot:
+        elif x > value:
             right.append(x)
         else:
             middle.append(x)
 
-    return quick_sort(left) + middle + quick_sort(right)
+    return quick_sort(left, pivot, rng) + middle + quick_sort(right, pivot, rng)
+
+
+def dnf_partition(array: MutableSequence[T], low: int, high: int, strategy: str = 'random',
+                  rng: random.Random = None) -> Tuple[int, int]:
+    """
+    Partitions the sublist with the Dutch National Flag partitioning scheme around a pivot chosen by strategy.
+
+    After partitioning, array[low:left] holds the elements less than the pivot, array[left:right] the elements equal
+    to it, and array[right:high + 1] the elements greater than it.
+
+    Args:
+        array (MutableSequence[T]): The list to partition.
+        low (int): The lower index of the sublist.
+        high (int): The upper index of the sublist.
+        strategy (str, optional): The pivot selection strategy, one of the PIVOT_STRATEGIES of pivot_selection.
+        Defaults to 'random'.
+        rng (random.Random, optional): The random number generator for the 'random' pivot strategy. Defaults to the
+        random module.
+
+    Returns:
+        Tuple[int, int]: The indices where elements equal to the pivot start and end.
+
+    Time Complexity:
+        O(n)
+    """
+    pivot = array[select_pivot(array, low, high, strategy, rng)]
+    mid = low
+
+    while mid <= high:
+        if array[mid] < pivot:
+            array[low], array[mid] = array[mid], array[low]
+            low += 1
+            mid += 1
+        elif array[mid] == pivot:
+            mid += 1
+        else:
+            array[mid], array[high] = array[high], array[mid]
+            high -= 1
+
+    return low, mid
 
 
-def quick_sort_dnf(array: List[T], low: int = 0, high: int = None) -> List[T]:
+def quick_sort_dnf(array: MutableSequence[T], low: int = 0, high: int = None, pivot: str = 'random',
+                   rng: random.Random = None, key: Callable[[T], Any] = None,
+                   reverse: bool = False) -> MutableSequence[T]:
     """
     Sorts a list in ascending order using the Quick Sort algorithm with Dutch National Flag partitioning scheme.
 
@@ -87,12 +154,20 @@ def quick_sort_dnf(array: List[T], low: int = 0, high: int = None) -> List[T]:
     calls on equal elements.
 
     Args:
-        array (List[T]): The list to be sorted.
+        array (MutableSequence[T]): The list to be sorted.
         low (int, optional): The lower index of the sublist. Defaults to 0.
         high (int, optional): The upper index of the sublist. Defaults to None.
+        pivot (str, optional): The pivot selection strategy, one of the PIVOT_STRATEGIES of pivot_selection. Defaults to
+        'random'.
+        rng (random.Random, optional): The random number generator for the 'random' pivot strategy. Defaults to the
+        random module.
+        key (Callable[[T], Any], optional): A function computing the comparison key of every element, called once per
+        element. Defaults to None.
+        reverse (bool, optional): Whether to sort in descending order, keeping equal elements in their original order.
+        Defaults to False.
 
     Returns:
-        List[T]: The sorted list.
+        MutableSequence[T]: The sorted list.
 
     Time Complexity:
         Best Case: O(n log n)
@@ -121,48 +196,167 @@ def quick_sort_dnf(array: List[T], low: int = 0, high: int = None) -> List[T]:
     [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
     >>> quick_sort_dnf(['A', 'a', 'B', 'b', 'C', 'c', 'D', 'd', 'E', 'e'])
     ['A', 'B', 'C', 'D', 'E', 'a', 'b', 'c', 'd', 'e']
+    >>> quick_sort_dnf([10, 9, 8, 7, 6, 5, 4, 3, 2, 1], pivot='median_of_three')
+    [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+    >>> quick_sort_dnf([3, 1, 2, 5, 4], rng=random.Random(0))
+    [1, 2, 3, 4, 5]
+    >>> quick_sort_dnf(['bb', 'a', 'ccc', 'dd'], key=len)
+    ['a', 'bb', 'dd', 'ccc']
+    >>> quick_sort_dnf([3, 1, 2, 1], reverse=True)
+    [3, 2, 1, 1]
     """
-    def partition(array: List[T], low: int, high: int) -> Tuple[int, int]:
-        """
-        Partitions the list with Dutch National Flag partitioning scheme.
+    if key is not None or reverse:
+        return sort_by_key(lambda pairs: quick_sort_dnf(pairs, pivot=pivot, rng=rng), array, key, reverse, low, high)
 
-        Args:
-            array (List[T]): The list to partition.
-            low (int): The lower index of the sublist.
-            high (int): The upper index of the sublist.
+    n = len(array)
 
-        Returns:
-            Tuple[int, int]: The indices where elements equal to the pivot start and end.
-        """
-        pivot = array[random.randint(low, high)]
-        mid = low
-        
-        while mid <= high:
-            if array[mid] < pivot:
-                array[low], array[mid] = array[mid], array[low]
-                low += 1
-                mid += 1
-            elif array[mid] == pivot:
-                mid += 1
-            else:
-                array[mid], array[high] = array[high], array[mid]
-                high -= 1
-        
-        return low, mid
+    high = n-1 if high is None else high
+
+    if low < high:
+        left, right = dnf_partition(array, low, high, pivot, rng)
+        quick_sort_dnf(array, low, left - 1, pivot, rng)
+        quick_sort_dnf(array, right, high, pivot, rng)
+
+    return array
+
+
+def quick_sort_dnf_iterative(array: MutableSequence[T], low: int = 0, high: int = None, pivot: str = 'random',
+                             rng: random.Random = None, key: Callable[[T], Any] = None,
+                             reverse: bool = False) -> MutableSequence[T]:
+    """
+    Sorts a list in ascending order using the iterative Quick Sort algorithm with Dutch National Flag partitioning
+    scheme.
+
+    This version of Quick Sort partitions like quick_sort_dnf, but does not recurse. After partitioning, the larger
+    part is pushed onto an explicit stack and the loop continues with the smaller part. As the smaller part holds at
+    most half of the elements, the stack never holds more than log2(n) parts, even when the partitions are
+    unbalanced, so large lists can be sorted without raising the recursion limit. Elements equal to the pivot belong
+    to neither part.
+
+    Args:
+        array (MutableSequence[T]): The list to be sorted.
+        low (int, optional): The lower index of the sublist. Defaults to 0.
+        high (int, optional): The upper index of the sublist. Defaults to None.
+        pivot (str, optional): The pivot selection strategy, one of the PIVOT_STRATEGIES of pivot_selection. Defaults to
+        'random'.
+        rng (random.Random, optional): The random number generator for the 'random' pivot strategy. Defaults to the
+        random module.
+        key (Callable[[T], Any], optional): A function computing the comparison key of every element, called once per
+        element. Defaults to None.
+        reverse (bool, optional): Whether to sort in descending order, keeping equal elements in their original order.
+        Defaults to False.
+
+    Returns:
+        MutableSequence[T]: The sorted list.
+
+    Time Complexity:
+        Best Case: O(n log n)
+        Average Case: O(n log n)
+        Worst Case: O(n^2) - occurs when the pivot selection consistently results in the smallest or largest element in
+        the sublist, leading to highly unbalanced partitions.
+
+    Space Complexity:
+        O(log n) - additional space is used for the explicit stack, even in the worst case.
+
+    Stability:
+        This implementation of Quick Sort is unstable, it does not maintain the relative order of equal elements.
+
+    Examples:
+    >>> quick_sort_dnf_iterative([])
+    []
+    >>> quick_sort_dnf_iterative([1])
+    [1]
+    >>> quick_sort_dnf_iterative([1, 2, 3, 4, 5, 1, 2, 3, 4, 5])
+    [1, 1, 2, 2, 3, 3, 4, 4, 5, 5]
+    >>> quick_sort_dnf_iterative([1, 2, 3, 4, 5, 0, -1, -2, -3, -4, -5])
+    [-5, -4, -3, -2, -1, 0, 1, 2, 3, 4, 5]
+    >>> quick_sort_dnf_iterative([1, 2, 3, 4, 5, 6, 7, 8, 9, 10])
+    [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+    >>> quick_sort_dnf_iterative([10, 9, 8, 7, 6, 5, 4, 3, 2, 1])
+    [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+    >>> quick_sort_dnf_iterative(['A', 'a', 'B', 'b', 'C', 'c', 'D', 'd', 'E', 'e'])
+    ['A', 'B', 'C', 'D', 'E', 'a', 'b', 'c', 'd', 'e']
+    >>> quick_sort_dnf_iterative([5, 4, 3, 2, 1, 0], 1, 4)
+    [5, 1, 2, 3, 4, 0]
+    >>> quick_sort_dnf_iterative([10, 9, 8, 7, 6, 5, 4, 3, 2, 1], pivot='median_of_three')
+    [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+    >>> quick_sort_dnf_iterative([3, 1, 2, 5, 4], rng=random.Random(0))
+    [1, 2, 3, 4, 5]
+    >>> quick_sort_dnf_iterative(['bb', 'a', 'ccc', 'dd'], key=len)
+    ['a', 'bb', 'dd', 'ccc']
+    >>> quick_sort_dnf_iterative([3, 1, 2, 1], reverse=True)
+    [3, 2, 1, 1]
+    """
+    if key is not None or reverse:
+        return sort_by_key(lambda pairs: quick_sort_dnf_iterative(pairs, pivot=pivot, rng=rng), array, key, reverse,
+                           low, high)
 
     n = len(array)
 
     high = n-1 if high is None else high
 
-    if low < high:
-        left, right = partition(array, low, high)
-        quick_sort_dnf(array, low, left - 1)
-        quick_sort_dnf(array, right, high)
+    stack = [(low, high)]
+    while stack:
+        low, high = stack.pop()
+
+        while low < high:
+            left, right = dnf_partition(array, low, high, pivot, rng)
+
+            # Push the larger of array[low:left] and array[right:high + 1], and continue with the smaller
+            if left - low < high - right + 1:
+                stack.append((right, high))
+                high = left - 1
+            else:
+                stack.append((low, left - 1))
+                low = right
 
     return array
 
 
-def quick_sort_hoare(array: List[T], low: int = 0, high: int = None) -> List[T]:
+def hoare_partition(array: MutableSequence[T], low: int, high: int, strategy: str = 'random',
+                    rng: random.Random = None) -> int:
+    """
+    Partitions the sublist with Hoare's partitioning scheme around a pivot chosen by strategy.
+
+    After partitioning, every element in array[low:mid + 1] is less than or equal to every element in
+    array[mid + 1:high + 1]. The pivot itself is not guaranteed to be in its final sorted position.
+
+    Args:
+        array (MutableSequence[T]): The list to partition.
+        low (int): The lower index of the sublist.
+        high (int): The upper index of the sublist.
+        strategy (str, optional): The pivot selection strategy, one of the PIVOT_STRATEGIES of pivot_selection.
+        Defaults to 'random'.
+        rng (random.Random, optional): The random number generator for the 'random' pivot strategy. Defaults to the
+        random module.
+
+    Returns:
+        int: The index of the last element of the left partition.
+
+    Time Complexity:
+        O(n)
+    """
+    # With the pivot at the start of the sublist, the returned index is always less than high
+    index = select_pivot(array, low, high, strategy, rng)
+    array[low], array[index] = array[index], array[low]
+    pivot = array[low]
+    i, j = low, high
+
+    while True:
+        while array[i] < pivot:
+            i += 1
+        while array[j] > pivot:
+            j -= 1
+        if i >= j:
+            return j
+        array[i], array[j] = array[j], array[i]
+        i += 1
+        j -= 1
+
+
+def quick_sort_hoare(array: MutableSequence[T], low: int = 0, high: int = None, pivot: str = 'random',
+                     rng: random.Random = None, key: Callable[[T], Any] = None,
+                     reverse: bool = False) -> MutableSequence[T]:
     """
     Sorts a list in ascending order using the Quick Sort algorithm with Hoare's partitioning scheme.
 
@@ -172,12 +366,20 @@ def quick_sort_hoare(array: List[T], low: int = 0, high: int = None) -> List[T]:
     they overlap, swapping elements that are in the wrong partition.
 
     Args:
-        array (List[T]): The list to be sorted.
+        array (MutableSequence[T]): The list to be sorted.
         low (int, optional): The lower index of the sublist. Defaults to 0.
         high (int, optional): The upper index of the sublist. Defaults to None.
+        pivot (str, optional): The pivot selection strategy, one of the PIVOT_STRATEGIES of pivot_selection. Defaults to
+        'random'.
+        rng (random.Random, optional): The random number generator for the 'random' pivot strategy. Defaults to the
+        random module.
+        key (Callable[[T], Any], optional): A function computing the comparison key of every element, called once per
+        element. Defaults to None.
+        reverse (bool, optional): Whether to sort in descending order, keeping equal elements in their original order.
+        Defaults to False.
 
     Returns:
-        List[T]: The sorted list.
+        MutableSequence[T]: The sorted list.
 
     Time Complexity:
         Best Case: O(n log n)
@@ -206,46 +408,160 @@ def quick_sort_hoare(array: List[T], low: int = 0, high: int = None) -> List[T]:
     [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
     >>> quick_sort_hoare(['A', 'a', 'B', 'b', 'C', 'c', 'D', 'd', 'E', 'e'])
     ['A', 'B', 'C', 'D', 'E', 'a', 'b', 'c', 'd', 'e']
+    >>> quick_sort_hoare([10, 9, 8, 7, 6, 5, 4, 3, 2, 1], pivot='median_of_three')
+    [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+    >>> quick_sort_hoare([3, 1, 2, 5, 4], rng=random.Random(0))
+    [1, 2, 3, 4, 5]
+    >>> quick_sort_hoare(['bb', 'a', 'ccc', 'dd'], key=len)
+    ['a', 'bb', 'dd', 'ccc']
+    >>> quick_sort_hoare([3, 1, 2, 1], reverse=True)
+    [3, 2, 1, 1]
     """
-    def partition(array: List[T], low: int, high: int) -> int:
-        """
-        Partitions the list with Hoare's partitioning.
+    if key is not None or reverse:
+        return sort_by_key(lambda pairs: quick_sort_hoare(pairs, pivot=pivot, rng=rng), array, key, reverse, low, high)
 
-        Args:
-            array (List[T]): The list to partition.
-            low (int): The lower index of the sublist.
-            high (int): The upper index of the sublist.
+    n = len(array)
 
-        Returns:
-            int: The index of the sorted pivot.
-        """
-        pivot = array[random.randint(low, high)]
-        i, j = low, high
-
-        while True:
-            while array[i] < pivot:
-                i += 1
-            while array[j] > pivot:
-                j -= 1
-            if i >= j:
-                return j
-            array[i], array[j] = array[j], array[i]
-            i += 1
-            j -= 1
+    high = n-1 if high is None else high
+
+    if low < high:
+        mid = hoare_partition(array, low, high, pivot, rng)
+        quick_sort_hoare(array, low, mid, pivot, rng)
+        quick_sort_hoare(array, mid+1, high, pivot, rng)
+
+    return array
+
+
+def quick_sort_hoare_iterative(array: MutableSequence[T], low: int = 0, high: int = None, pivot: str = 'random',
+                               rng: random.Random = None, key: Callable[[T], Any] = None,
+                               reverse: bool = False) -> MutableSequence[T]:
+    """
+    Sorts a list in ascending order using the iterative Quick Sort algorithm with Hoare's partitioning scheme.
+
+    This version of Quick Sort partitions like quick_sort_hoare, but does not recurse. After partitioning, the larger
+    part is pushed onto an explicit stack and the loop continues with the smaller part. As the smaller part holds at
+    most half of the elements, the stack never holds more than log2(n) parts, even when the partitions are
+    unbalanced, so large lists can be sorted without raising the recursion limit.
+
+    Args:
+        array (MutableSequence[T]): The list to be sorted.
+        low (int, optional): The lower index of the sublist. Defaults to 0.
+        high (int, optional): The upper index of the sublist. Defaults to None.
+        pivot (str, optional): The pivot selection strategy, one of the PIVOT_STRATEGIES of pivot_selection. Defaults to
+        'random'.
+        rng (random.Random, optional): The random number generator for the 'random' pivot strategy. Defaults to the
+        random module.
+        key (Callable[[T], Any], optional): A function computing the comparison key of every element, called once per
+        element. Defaults to None.
+        reverse (bool, optional): Whether to sort in descending order, keeping equal elements in their original order.
+        Defaults to False.
+
+    Returns:
+        MutableSequence[T]: The sorted list.
+
+    Time Complexity:
+        Best Case: O(n log n)
+        Average Case: O(n log n)
+        Worst Case: O(n^2) - occurs when the pivot selection consistently results in the smallest or largest element in
+        the sublist, leading to highly unbalanced partitions.
+
+    Space Complexity:
+        O(log n) - additional space is used for the explicit stack, even in the worst case.
+
+    Stability:
+        This implementation of Quick Sort is unstable, it does not maintain the relative order of equal elements.
+
+    Examples:
+    >>> quick_sort_hoare_iterative([])
+    []
+    >>> quick_sort_hoare_iterative([1])
+    [1]
+    >>> quick_sort_hoare_iterative([1, 2, 3, 4, 5, 1, 2, 3, 4, 5])
+    [1, 1, 2, 2, 3, 3, 4, 4, 5, 5]
+    >>> quick_sort_hoare_iterative([1, 2, 3, 4, 5, 0, -1, -2, -3, -4, -5])
+    [-5, -4, -3, -2, -1, 0, 1, 2, 3, 4, 5]
+    >>> quick_sort_hoare_iterative([1, 2, 3, 4, 5, 6, 7, 8, 9, 10])
+    [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+    >>> quick_sort_hoare_iterative([10, 9, 8, 7, 6, 5, 4, 3, 2, 1])
+    [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+    >>> quick_sort_hoare_iterative(['A', 'a', 'B', 'b', 'C', 'c', 'D', 'd', 'E', 'e'])
+    ['A', 'B', 'C', 'D', 'E', 'a', 'b', 'c', 'd', 'e']
+    >>> quick_sort_hoare_iterative([5, 4, 3, 2, 1, 0], 1, 4)
+    [5, 1, 2, 3, 4, 0]
+    >>> quick_sort_hoare_iterative([10, 9, 8, 7, 6, 5, 4, 3, 2, 1], pivot='median_of_three')
+    [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+    >>> quick_sort_hoare_iterative([3, 1, 2, 5, 4], rng=random.Random(0))
+    [1, 2, 3, 4, 5]
+    >>> quick_sort_hoare_iterative(['bb', 'a', 'ccc', 'dd'], key=len)
+    ['a', 'bb', 'dd', 'ccc']
+    >>> quick_sort_hoare_iterative([3, 1, 2, 1], reverse=True)
+    [3, 2, 1, 1]
+    """
+    if key is not None or reverse:
+        return sort_by_key(lambda pairs: quick_sort_hoare_iterative(pairs, pivot=pivot, rng=rng), array, key, reverse,
+                           low, high)
 
     n = len(array)
 
     high = n-1 if high is None else high
 
-    if low < high:
-        mid = partition(array, low, high)
-        quick_sort_hoare(array, low, mid)
-        quick_sort_hoare(array, mid+1, high)
+    stack = [(low, high)]
+    while stack:
+        low, high = stack.pop()
+
+        while low < high:
+            mid = hoare_partition(array, low, high, pivot, rng)
+
+            # Push the larger of array[low:mid + 1] and array[mid + 1:high + 1], and continue with the smaller
+            if mid - low < high - mid:
+                stack.append((mid + 1, high))
+                high = mid
+            else:
+                stack.append((low, mid))
+                low = mid + 1
 
     return array
 
 
-def quick_sort_lomuto(array: List[T], low: int = 0, high: int = None) -> List[T]:
+def lomuto_partition(array: MutableSequence[T], low: int, high: int, strategy: str = 'random',
+                     rng: random.Random = None) -> int:
+    """
+    Partitions the sublist with Lomuto's partitioning scheme around a pivot chosen by strategy.
+
+    After partitioning, the pivot is in its final sorted position, with the elements less than it to its left and the
+    other elements to its right.
+
+    Args:
+        array (MutableSequence[T]): The list to partition.
+        low (int): The lower index of the sublist.
+        high (int): The upper index of the sublist.
+        strategy (str, optional): The pivot selection strategy, one of the PIVOT_STRATEGIES of pivot_selection.
+        Defaults to 'random'.
+        rng (random.Random, optional): The random number generator for the 'random' pivot strategy. Defaults to the
+        random module.
+
+    Returns:
+        int: The index of the sorted pivot.
+
+    Time Complexity:
+        O(n)
+    """
+    pivot = select_pivot(array, low, high, strategy, rng)
+    array[high], array[pivot] = array[pivot], array[high]
+
+    i = low
+    for j in range(low, high):
+        if array[j] < array[high]:
+            array[i], array[j] = array[j], array[i]
+            i += 1
+
+    array[high], array[i] = array[i], array[high]
+    return i
+
+
+def quick_sort_lomuto(array: MutableSequence[T], low: int = 0, high: int = None, pivot: str = 'random',
+                      rng: random.Random = None, key: Callable[[T], Any] = None,
+                      reverse: bool = False) -> MutableSequence[T]:
     """
     Sorts a list in ascending order using the Quick Sort algorithm with Lomuto's partitioning scheme.
 
@@ -255,12 +571,20 @@ def quick_sort_lomuto(array: List[T], low: int = 0, high: int = None) -> List[T]
     guaranteed to be in its final sorted position.
 
     Args:
-        array (List[T]): The list to be sorted.
+        array (MutableSequence[T]): The list to be sorted.
         low (int, optional): The lower index of the sublist. Defaults to 0.
         high (int, optional): The upper index of the sublist. Defaults to None.
+        pivot (str, optional): The pivot selection strategy, one of the PIVOT_STRATEGIES of pivot_selection. Defaults to
+        'random'.
+        rng (random.Random, optional): The random number generator for the 'random' pivot strategy. Defaults to the
+        random module.
+        key (Callable[[T], Any], optional): A function computing the comparison key of every element, called once per
+        element. Defaults to None.
+        reverse (bool, optional): Whether to sort in descending order, keeping equal elements in their original order.
+        Defaults to False.
 
     Returns:
-        List[T]: The sorted list.
+        MutableSequence[T]: The sorted list.
 
     Time Complexity:
         Best Case: O(n log n)
@@ -289,39 +613,261 @@ def quick_sort_lomuto(array: List[T], low: int = 0, high: int = None) -> List[T]
     [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
     >>> quick_sort_lomuto(['A', 'a', 'B', 'b', 'C', 'c', 'D', 'd', 'E', 'e'])
     ['A', 'B', 'C', 'D', 'E', 'a', 'b', 'c', 'd', 'e']
+    >>> quick_sort_lomuto([10, 9, 8, 7, 6, 5, 4, 3, 2, 1], pivot='median_of_three')
+    [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+    >>> quick_sort_lomuto([3, 1, 2, 5, 4], rng=random.Random(0))
+    [1, 2, 3, 4, 5]
+    >>> quick_sort_lomuto(['bb', 'a', 'ccc', 'dd'], key=len)
+    ['a', 'bb', 'dd', 'ccc']
+    >>> quick_sort_lomuto([3, 1, 2, 1], reverse=True)
+    [3, 2, 1, 1]
+    """
+    if key is not None or reverse:
+        return sort_by_key(lambda pairs: quick_sort_lomuto(pairs, pivot=pivot, rng=rng), array, key, reverse, low, high)
+
+    n = len(array)
+
+    high = n-1 if high is None else high
+
+    if low < high:
+        mid = lomuto_partition(array, low, high, pivot, rng)
+        quick_sort_lomuto(array, low, mid-1, pivot, rng)
+        quick_sort_lomuto(array, mid+1, high, pivot, rng)
+
+    return array
+
+
+def quick_sort_lomuto_iterative(array: MutableSequence[T], low: int = 0, high: int = None, pivot: str = 'random',
+                                rng: random.Random = None, key: Callable[[T], Any] = None,
+                                reverse: bool = False) -> MutableSequence[T]:
+    """
+    Sorts a list in ascending order using the iterative Quick Sort algorithm with Lomuto's partitioning scheme.
+
+    This version of Quick Sort partitions like quick_sort_lomuto, but does not recurse. After partitioning, the larger
+    part is pushed onto an explicit stack and the loop continues with the smaller part. As the smaller part holds at
+    most half of the elements, the stack never holds more than log2(n) parts, even when the partitions are
+    unbalanced, so large lists can be sorted without raising the recursion limit.
+
+    Args:
+        array (MutableSequence[T]): The list to be sorted.
+        low (int, optional): The lower index of the sublist. Defaults to 0.
+        high (int, optional): The upper index of the sublist. Defaults to None.
+        pivot (str, optional): The pivot selection strategy, one of the PIVOT_STRATEGIES of pivot_selection. Defaults to
+        'random'.
+        rng (random.Random, optional): The random number generator for the 'random' pivot strategy. Defaults to the
+        random module.
+        key (Callable[[T], Any], optional): A function computing the comparison key of every element, called once per
+        element. Defaults to None.
+        reverse (bool, optional): Whether to sort in descending order, keeping equal elements in their original order.
+        Defaults to False.
+
+    Returns:
+        MutableSequence[T]: The sorted list.
+
+    Time Complexity:
+        Best Case: O(n log n)
+        Average Case: O(n log n)
+        Worst Case: O(n^2) - occurs when the pivot selection consistently results in the smallest or largest element in
+        the sublist, leading to highly unbalanced partitions.
+
+    Space Complexity:
+        O(log n) - additional space is used for the explicit stack, even in the worst case.
+
+    Stability:
+        This implementation of Quick Sort is unstable, it does not maintain the relative order of equal elements.
+
+    Examples:
+    >>> quick_sort_lomuto_iterative([])
+    []
+    >>> quick_sort_lomuto_iterative([1])
+    [1]
+    >>> quick_sort_lomuto_iterative([1, 2, 3, 4, 5, 1, 2, 3, 4, 5])
+    [1, 1, 2, 2, 3, 3, 4, 4, 5, 5]
+    >>> quick_sort_lomuto_iterative([1, 2, 3, 4, 5, 0, -1, -2, -3, -4, -5])
+    [-5, -4, -3, -2, -1, 0, 1, 2, 3, 4, 5]
+    >>> quick_sort_lomuto_iterative([1, 2, 3, 4, 5, 6, 7, 8, 9, 10])
+    [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+    >>> quick_sort_lomuto_iterative([10, 9, 8, 7, 6, 5, 4, 3, 2, 1])
+    [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+    >>> quick_sort_lomuto_iterative(['A', 'a', 'B', 'b', 'C', 'c', 'D', 'd', 'E', 'e'])
+    ['A', 'B', 'C', 'D', 'E', 'a', 'b', 'c', 'd', 'e']
+    >>> quick_sort_lomuto_iterative([5, 4, 3, 2, 1, 0], 1, 4)
+    [5, 1, 2, 3, 4, 0]
+    >>> quick_sort_lomuto_iterative([10, 9, 8, 7, 6, 5, 4, 3, 2, 1], pivot='median_of_three')
+    [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+    >>> quick_sort_lomuto_iterative([3, 1, 2, 5, 4], rng=random.Random(0))
+    [1, 2, 3, 4, 5]
+    >>> quick_sort_lomuto_iterative(['bb', 'a', 'ccc', 'dd'], key=len)
+    ['a', 'bb', 'dd', 'ccc']
+    >>> quick_sort_lomuto_iterative([3, 1, 2, 1], reverse=True)
+    [3, 2, 1, 1]
+    """
+    if key is not None or reverse:
+        return sort_by_key(lambda pairs: quick_sort_lomuto_iterative(pairs, pivot=pivot, rng=rng), array, key, reverse,
+                           low, high)
+
+    n = len(array)
+
+    high = n-1 if high is None else high
+
+    stack = [(low, high)]
+    while stack:
+        low, high = stack.pop()
+
+        while low < high:
+            mid = lomuto_partition(array, low, high, pivot, rng)
+
+            # Push the larger of array[low:mid] and array[mid + 1:high + 1], and continue with the smaller
+            if mid - low < high - mid:
+                stack.append((mid + 1, high))
+                high = mid - 1
+            else:
+                stack.append((low, mid - 1))
+                low = mid + 1
+
+    return array
+
+
+def quick_sort_dual_pivot(array: MutableSequence[T], low: int = 0, high: int = None, pivot: str = 'random',
+                          rng: random.Random = None, key: Callable[[T], Any] = None,
+                          reverse: bool = False) -> MutableSequence[T]:
+    """
+    Sorts a list in ascending order using the Quick Sort algorithm with Yaroslavskiy's dual-pivot partitioning scheme.
+
+    This version of Quick Sort picks two pivots p <= q, one from each half of the sublist, and partitions the sublist
+    into three parts in a single pass: elements less than p, elements between p and q, and elements greater than q.
+    Splitting into three parts instead of two reduces the number of partitioning levels and the number of element
+    moves. It is implemented with an explicit stack instead of recursion, so deep inputs do not hit the recursion
+    limit; the smaller parts are popped first, which bounds the stack to O(log n) entries. Sublists with at most
+    NETWORK_THRESHOLD elements are sorted with an optimal sorting network.
+
+    Args:
+        array (MutableSequence[T]): The list to be sorted.
+        low (int, optional): The lower index of the sublist. Defaults to 0.
+        high (int, optional): The upper index of the sublist. Defaults to None.
+        pivot (str, optional): The pivot selection strategy, one of the PIVOT_STRATEGIES of pivot_selection. Defaults to
+        'random'.
+        rng (random.Random, optional): The random number generator for the 'random' pivot strategy. Defaults to the
+        random module.
+        key (Callable[[T], Any], optional): A function computing the comparison key of every element, called once per
+        element. Defaults to None.
+        reverse (bool, optional): Whether to sort in descending order, keeping equal elements in their original order.
+        Defaults to False.
+
+    Returns:
+        MutableSequence[T]: The sorted list.
+
+    Time Complexity:
+        Best Case: O(n log n)
+        Average Case: O(n log n)
+        Worst Case: O(n^2) - occurs when the pivot selection consistently results in the smallest or largest elements
+        in the sublist, leading to highly unbalanced partitions.
+
+    Space Complexity:
+        O(log n) - additional space is used for the explicit stack.
+
+    Stability:
+        This implementation of Quick Sort is unstable, it does not maintain the relative order of equal elements.
+
+    Examples:
+    >>> quick_sort_dual_pivot([])
+    []
+    >>> quick_sort_dual_pivot([1])
+    [1]
+    >>> quick_sort_dual_pivot([1, 2, 3, 4, 5, 1, 2, 3, 4, 5])
+    [1, 1, 2, 2, 3, 3, 4, 4, 5, 5]
+    >>> quick_sort_dual_pivot([1, 2, 3, 4, 5, 0, -1, -2, -3, -4, -5])
+    [-5, -4, -3, -2, -1, 0, 1, 2, 3, 4, 5]
+    >>> quick_sort_dual_pivot([1, 2, 3, 4, 5, 6, 7, 8, 9, 10])
+    [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+    >>> quick_sort_dual_pivot([10, 9, 8, 7, 6, 5, 4, 3, 2, 1])
+    [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+    >>> quick_sort_dual_pivot(['A', 'a', 'B', 'b', 'C', 'c', 'D', 'd', 'E', 'e'])
+    ['A', 'B', 'C', 'D', 'E', 'a', 'b', 'c', 'd', 'e']
+    >>> quick_sort_dual_pivot([i % 7 for i in range(100)]) == sorted(i % 7 for i in range(100))
+    True
+    >>> quick_sort_dual_pivot([10, 9, 8, 7, 6, 5, 4, 3, 2, 1], pivot='median_of_three')
+    [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+    >>> quick_sort_dual_pivot([3, 1, 2, 5, 4], rng=random.Random(0))
+    [1, 2, 3, 4, 5]
+    >>> quick_sort_dual_pivot(['bb', 'a', 'ccc', 'dd'], key=len)
+    ['a', 'bb', 'dd', 'ccc']
+    >>> quick_sort_dual_pivot([3, 1, 2, 1], reverse=True)
+    [3, 2, 1, 1]
     """
-    def lomuto_partition(array: List[T], low: int, high: int) -> int:
+    if key is not None or reverse:
+        return sort_by_key(lambda pairs: quick_sort_dual_pivot(pairs, pivot=pivot, rng=rng), array, key, reverse,
+                           low, high)
+
+    def dual_pivot_partition(array: MutableSequence[T], low: int, high: int) -> Tuple[int, int]:
         """
-        Partitions the list with Lomuto's partitioning scheme.
+        Partitions the list with Yaroslavskiy's dual-pivot partitioning scheme.
 
         Args:
-            array (List[T]): The list to partition.
+            array (MutableSequence[T]): The list to partition.
             low (int): The lower index of the sublist.
             high (int): The upper index of the sublist.
 
         Returns:
-            int: The index of the sorted pivot.
+            Tuple[int, int]: The indices of the sorted pivots.
         """
-        pivot = random.randint(low, high)
-        array[high], array[pivot] = array[pivot], array[high]
+        # Move a pivot from each half of the sublist to both ends of it
+        mid = (low + high) // 2
+        left, right = select_pivot(array, low, mid, pivot, rng), select_pivot(array, mid + 1, high, pivot, rng)
+        array[low], array[left] = array[left], array[low]
+        array[high], array[right] = array[right], array[high]
+        if array[high] < array[low]:
+            array[low], array[high] = array[high], array[low]
+
+        p, q = array[low], array[high]
+        lt, gt, i = low + 1, high - 1, low + 1
+
+        while i <= gt:
+            if array[i] < p:
+                array[i], array[lt] = array[lt], array[i]
+                lt += 1
+            elif q < array[i]:
+                while q < array[gt] and i < gt:
+                    gt -= 1
+                array[i], array[gt] = array[gt], array[i]
+                gt -= 1
+                if array[i] < p:
+                    array[i], array[lt] = array[lt], array[i]
+                    lt += 1
+            i += 1
 
-        i = low
-        for j in range(low, high):
-            if array[j] < array[high]:
-                array[i], array[j] = array[j], array[i]
-                i += 1
+        lt -= 1
+        gt += 1
+        array[low], array[lt] = array[lt], array[low]
+        array[high], array[gt] = array[gt], array[high]
 
-        array[high], array[i] = array[i], array[high]
-        return i
+        return lt, gt
 
     n = len(array)
 
     high = n-1 if high is None else high
 
-    if low < high:
-        mid = lomuto_partition(array, low, high)
-        quick_sort_lomuto(array, low, mid-1)
-        quick_sort_lomuto(array, mid+1, high)
+    stack = [(low, high)]
+
+    while stack:
+        low, high = stack.pop()
+
+        if high - low + 1 <= NETWORK_THRESHOLD:
+            SORTERS[high - low + 1](array, low)
+            continue
+
+        left, right = dual_pivot_partition(array, low, high)
+
+        parts = [(low, left - 1), (right + 1, high)]
+        # When both pivots are equal, every element between them is equal to the pivots
+        if array[left] < array[right]:
+            parts.append((left + 1, right - 1))
+
+        # Push the larger parts first, so the smaller parts are sorted first and the stack stays small
+        parts.sort(key=lambda part: part[1] - part[0], reverse=True)
+        for part in parts:
+            if part[0] < part[1]:
+                stack.append(part)
 
     return array
 
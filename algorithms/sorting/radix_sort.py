@@ -8,12 +8,31 @@ Date: 2024-09-11
 License: MIT
 """
 
-from typing import List, TypeVar
+from array import array as typed_array
+from functools import reduce
+from itertools import chain
+from numbers import Integral
+from operator import and_, or_
+from typing import Callable, List, MutableSequence, TypeVar, Union
+from algorithms.sorting.insertion_sort import insertion_sort
+from algorithms.sorting.sort_by_key import assign_slice, sort_by_key
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 T = TypeVar('T')
 
+INTEGER_TYPECODES = 'bBhHiIlLqQ'
+INSERTION_SORT_THRESHOLD = 16
+RADIX_BITS = (8, 11, 16)
+FLOAT_WIDTH = 64
+BYTE_ALPHABET = 256
 
-def radix_sort(array: List[int], k: int = 10) -> List[int]:
+
+def radix_sort(array: List[int], k: int = 10, key: Callable[[T], int] = None,
+               reverse: bool = False) -> List[int]:
     """
     Sorts a list of non-negative integers in ascending order using the Radix Sort algorithm.
 
@@ -24,6 +43,10 @@ def radix_sort(array: List[int], k: int = 10) -> List[int]:
     Args:
         array (List[int]): The list of non-negative integers to be sorted.
         k (int, optional): The base of the number system used for counting sort. Defaults to 10.
+        key (Callable[[T], int], optional): A function computing the key of every element, called once per element.
+        Defaults to None.
+        reverse (bool, optional): Whether to sort in descending order, keeping equal elements in their original order.
+        Defaults to False.
 
     Returns:
         List[int]: The sorted list.
@@ -50,7 +73,14 @@ def radix_sort(array: List[int], k: int = 10) -> List[int]:
     [1, 1, 10, 10, 100, 100, 1000, 1000, 10000, 10000, 100000, 100000]
     >>> radix_sort([1, 10, 100, 1000, 10000, 100000, 200000, 20000, 2000, 200, 20, 2])
     [1, 2, 10, 20, 100, 200, 1000, 2000, 10000, 20000, 100000, 200000]
+    >>> radix_sort([('b', 20), ('a', 3), ('c', 20)], key=lambda record: record[1], reverse=True)
+    [('b', 20), ('c', 20), ('a', 3)]
+    >>> radix_sort([5, 3, 15, 8], k=2)
+    [3, 5, 8, 15]
     """
+    if key is not None or reverse:
+        return sort_by_key(lambda keys: radix_sort(keys, k), array, key, reverse, decorate=False)
+
     def counting_sort(array: List[int], k: int, exponent: int) -> List[int]:
         """
         Performs counting sort on the array based on the digit represented by the given exponent.
@@ -97,30 +127,354 @@ def radix_sort(array: List[int], k: int = 10) -> List[int]:
     exp = 1
     while maximum // exp > 0:
         counting_sort(array, k, exp)
-        exp *= 10
+        exp *= k
 
     return array
 
 
-def radix_sort_str(array: List[str]) -> List[str]:
+def radix_sort_vectorized(array: MutableSequence[int], bits: int = 8, key: Callable[[T], int] = None,
+                          reverse: bool = False) -> MutableSequence[int]:
+    """
+    Sorts a buffer of non-negative integers in ascending order using a vectorised LSD Radix Sort algorithm.
+
+    This version of Radix Sort is meant for NumPy arrays, array.array buffers and memoryviews of them. It processes
+    bits bits per pass (8 or 16 are good choices) with shifts and masks instead of decimal digits. Every pass counts
+    the digits with numpy.bincount and skips the pass if all elements share the same digit. Otherwise, the digits are
+    narrowed to uint8 or uint16, which numpy.argsort sorts stably with a counting sort in C, and the elements are
+    gathered in that order into a second preallocated buffer. The two buffers swap roles after every pass, so no
+    per-element Python objects are created. The buffer is sorted in place.
+
+    When NumPy is not installed, the same passes are run in the interpreter with a typed array('q') count array and
+    a preallocated buffer of the same type as the input.
+
+    Args:
+        array (MutableSequence[int]): The buffer of non-negative integers to be sorted.
+        bits (int, optional): The number of bits processed per pass. Defaults to 8.
+        key (Callable[[T], int], optional): A function computing the key of every element, called once per element.
+        Defaults to None.
+        reverse (bool, optional): Whether to sort in descending order, keeping equal elements in their original order.
+        Defaults to False.
+
+    Returns:
+        MutableSequence[int]: The sorted buffer.
+
+    Raises:
+        TypeError: If the buffer does not hold integers.
+        ValueError: If the buffer contains negative integers.
+
+    Time Complexity:
+        O(d(n + 2^b)) - where d is the number of b-bit digits in the maximum integer and n is the number of elements.
+
+    Space Complexity:
+        O(n + 2^b) - for the second buffer and the count array.
+
+    Stability:
+        This implementation of Radix Sort is stable, it maintains the relative order of equal elements.
+
+    Examples:
+    >>> radix_sort_vectorized(typed_array('I', []))
+    array('I')
+    >>> radix_sort_vectorized(typed_array('I', [1]))
+    array('I', [1])
+    >>> radix_sort_vectorized(typed_array('Q', [1, 10, 100, 1000, 10000, 100000, 1, 10, 100, 1000, 10000, 100000]))
+    array('Q', [1, 1, 10, 10, 100, 100, 1000, 1000, 10000, 10000, 100000, 100000])
+    >>> radix_sort_vectorized(typed_array('q', [70000, 3, 65536, 255, 256, 0]), bits=16)
+    array('q', [0, 3, 255, 256, 65536, 70000])
+    >>> radix_sort_vectorized(typed_array('I', [2, 3, 1]), reverse=True)
+    array('I', [3, 2, 1])
+    """
+    if key is not None or reverse:
+        return sort_by_key(lambda keys: radix_sort_vectorized(keys, bits), array, key, reverse, decorate=False)
+
+    radix = 1 << bits
+    mask = radix - 1
+
+    if np is not None and isinstance(array, (np.ndarray, typed_array, memoryview)):
+        keys = np.frombuffer(array, dtype=array.typecode) if isinstance(array, typed_array) else np.asarray(array)
+
+        if keys.dtype.kind not in 'iu':
+            raise TypeError("Array must contain integers.")
+        if keys.size == 0:
+            return array
+        if keys.dtype.kind == 'i' and keys.min() < 0:
+            raise ValueError("Array must not contain any negative integers.")
+
+        source, target = keys, np.empty_like(keys)
+        # NumPy sorts integers of at most 16 bits stably with a counting sort, and wider ones by comparison
+        digit_type = np.uint8 if bits <= 8 else np.uint16 if bits <= 16 else np.uint64
+        digit_mask = digit_type(mask)
+        shift = 0
+        maximum = int(keys.max())
+        while maximum >> shift > 0:
+            digits = (source >> shift).astype(digit_type) & digit_mask
+            counts = np.bincount(digits, minlength=radix)
+            if counts.max() < keys.size:
+                np.take(source, np.argsort(digits, kind='stable'), out=target)
+                source, target = target, source
+            shift += bits
+
+        if source is not keys:
+            keys[:] = source
+        return array
+
+    typed = isinstance(array, (typed_array, memoryview))
+    typecode = array.typecode if isinstance(array, typed_array) else getattr(array, 'format', None)
+    if typed and typecode not in INTEGER_TYPECODES:
+        raise TypeError("Array must contain integers.")
+
+    n = len(array)
+
+    if n == 0:
+        return array
+
+    maximum = 0
+    for num in array:
+        if num < 0:
+            raise ValueError("Array must not contain any negative integers.")
+        if num > maximum:
+            maximum = num
+
+    source = array
+    target = typed_array(typecode, bytes(n * array.itemsize)) if typed else [0] * n
+    count = typed_array('q', bytes(8 * radix))
+
+    shift = 0
+    while maximum >> shift > 0:
+        for i in range(radix):
+            count[i] = 0
+        for num in source:
+            count[(num >> shift) & mask] += 1
+
+        if max(count) < n:
+            # Turn the counts into the starting position of every digit
+            total = 0
+            for i in range(radix):
+                count[i], total = total, total + count[i]
+
+            for num in source:
+                digit = (num >> shift) & mask
+                target[count[digit]] = num
+                count[digit] += 1
+
+            source, target = target, source
+
+        shift += bits
+
+    if source is not array:
+        assign_slice(array, 0, source)
+
+    return array
+
+
+def radix_bits(n: int, width: int) -> int:
+    """
+    Chooses the number of bits per digit of an LSD Radix Sort, out of RADIX_BITS.
+
+    A b-bit digit takes ceil(width / b) passes, each of which touches the n elements and the 2^b counts, so the digit
+    width with the least total work is chosen. Wider digits take fewer passes, but only pay off for larger inputs.
+
+    Args:
+        n (int): The number of elements.
+        width (int): The number of bits of the keys.
+
+    Returns:
+        int: The number of bits per digit.
+
+    Examples:
+    >>> radix_bits(1000, 64), radix_bits(10000, 64), radix_bits(1000000, 64)
+    (8, 11, 16)
+    >>> radix_bits(1000000, 8)
+    8
+    """
+    return min(RADIX_BITS, key=lambda bits: -(-width // bits) * (n + (1 << bits)))
+
+
+def radix_sort_numeric(array: MutableSequence[Union[int, float]], key: Callable[[T], Union[int, float]] = None,
+                       reverse: bool = False) -> MutableSequence[Union[int, float]]:
+    """
+    Sorts a list of signed integers or floats in ascending order using an LSD Radix Sort algorithm on their bits.
+
+    Every key is first mapped to a non-negative integer with the same order, by an order-preserving bit flip:
+    - Integers, including NumPy integers, are taken as two's complement integers of the smallest width w that fits
+      them all, and their sign bit is flipped, so negative integers come before non-negative ones.
+    - Floats are taken as their 64-bit IEEE 754 patterns, read in bulk through an array('d') buffer. The sign bit of
+      non-negative floats is set, and all bits of negative floats are flipped, which also reverses their order. -0.0
+      is mapped to the same key as 0.0, as they are equal. Integers among floats are converted to floats, so they
+      must be exactly representable as floats.
+    In descending order, all bits of the mapped keys are flipped too, so equal elements still keep their order.
+
+    The mapped keys are then sorted with shifts and masks, with a number of bits per digit chosen by radix_bits from
+    the number of elements and the width of the bits that differ between keys. Digits that all keys share are
+    skipped. Every pass counts the digits, turns the counts into starting positions with a prefix sum, and stably
+    scatters the mapped keys into a second buffer, the two buffers swapping roles after every pass. Every mapped key
+    carries the index of its element in its low bits, so only one list of integers is scattered per pass, and the
+    elements are gathered in sorted order and written back into the list at the end.
+
+    Args:
+        array (MutableSequence[Union[int, float]]): The list of integers or floats to be sorted.
+        key (Callable[[T], Union[int, float]], optional): A function computing the key of every element, called once
+        per element. Defaults to None.
+        reverse (bool, optional): Whether to sort in descending order, keeping equal elements in their original order.
+        Defaults to False.
+
+    Returns:
+        MutableSequence[Union[int, float]]: The sorted list.
+
+    Raises:
+        TypeError: If the keys are not integers or floats, or if integers mixed with floats are not exactly
+        representable as floats.
+
+    Time Complexity:
+        O(w/b (n + 2^b)) - where w is the key width, which is 64 for floats, and b is the number of bits per digit.
+
+    Space Complexity:
+        O(n + 2^b) - for the mapped keys, the second buffer and the count array.
+
+    Stability:
+        This implementation of Radix Sort is stable, it maintains the relative order of equal elements. NaNs are
+        placed after infinity, or before negative infinity if their sign bit is set.
+
+    Examples:
+    >>> radix_sort_numeric([])
+    []
+    >>> radix_sort_numeric([1])
+    [1]
+    >>> radix_sort_numeric([1, 2, 3, 4, 5, 1, 2, 3, 4, 5])
+    [1, 1, 2, 2, 3, 3, 4, 4, 5, 5]
+    >>> radix_sort_numeric([1, 2, 3, 4, 5, 0, -1, -2, -3, -4, -5])
+    [-5, -4, -3, -2, -1, 0, 1, 2, 3, 4, 5]
+    >>> radix_sort_numeric([10, 9, 8, 7, 6, 5, 4, 3, 2, 1])
+    [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+    >>> radix_sort_numeric([-2 ** 70, 2 ** 70, -1, 0])
+    [-1180591620717411303424, -1, 0, 1180591620717411303424]
+    >>> radix_sort_numeric([2.5, -0.5, float('inf'), 0.0, -0.0, -1e300, 3])
+    [-1e+300, -0.5, 0.0, -0.0, 2.5, 3, inf]
+    >>> radix_sort_numeric(typed_array('d', [0.25, -4.0, 1.5]))
+    array('d', [-4.0, 0.25, 1.5])
+    >>> radix_sort_numeric(typed_array('q', [2 ** 63 - 1, 2 ** 53 + 1, 2 ** 53, -5]))
+    array('q', [-5, 9007199254740992, 9007199254740993, 9223372036854775807])
+    >>> np is None or radix_sort_numeric(np.array([2 ** 53 + 1, 2 ** 53, -5])).tolist() == [-5, 2 ** 53, 2 ** 53 + 1]
+    True
+    >>> radix_sort_numeric([('b', -2.5), ('a', 3.0), ('c', -2.5)], key=lambda record: record[1])
+    [('b', -2.5), ('c', -2.5), ('a', 3.0)]
+    >>> radix_sort_numeric([3, -1, 2, -1], reverse=True)
+    [3, 2, -1, -1]
+    >>> radix_sort_numeric(['a', 'b'])
+    Traceback (most recent call last):
+        ...
+    TypeError: Array must contain integers or floats.
+    >>> radix_sort_numeric([2 ** 53 + 1, float(2 ** 53)])
+    Traceback (most recent call last):
+        ...
+    TypeError: Integers mixed with floats must be exactly representable as floats.
+    """
+    n = len(array)
+
+    if n <= 1:
+        return array
+
+    values = list(array)
+    keys = values if key is None else [key(x) for x in values]
+
+    if all(isinstance(k, Integral) for k in keys):
+        # NumPy integers are not int, and have no bit_length
+        keys = [int(k) for k in keys]
+        width = max(k.bit_length() for k in keys) + 1
+        sign, mask = 1 << (width - 1), (1 << width) - 1
+        # Flipping the sign bit of the two's complement of k, as Python integers have no fixed width
+        keys = [(k & mask) ^ sign for k in keys]
+    else:
+        try:
+            patterns = typed_array('Q', typed_array('d', keys).tobytes())
+        except TypeError:
+            raise TypeError("Array must contain integers or floats.") from None
+        except OverflowError:
+            raise TypeError("Integers mixed with floats must be exactly representable as floats.") from None
+        # Converting an integer to a float rounds it to 53 significant bits, which may change its order
+        if any(isinstance(k, Integral) and float(k) != int(k) for k in keys):
+            raise TypeError("Integers mixed with floats must be exactly representable as floats.")
+        width = FLOAT_WIDTH
+        sign, mask = 1 << (width - 1), (1 << width) - 1
+        # -0.0 is the sign bit alone, and is mapped to the same key as 0.0
+        keys = [pattern ^ mask if pattern > sign else pattern | sign for pattern in patterns]
+
+    if reverse:
+        keys = [k ^ mask for k in keys]
+
+    # Only the bits that differ between keys need to be sorted on
+    varying = reduce(or_, keys) ^ reduce(and_, keys)
+    width = varying.bit_length()
+
+    bits = radix_bits(n, width)
+    radix = 1 << bits
+    digit_mask = radix - 1
+
+    # Every key carries the index of its element in its low bits, so only one list is moved per pass
+    index_bits = (n - 1).bit_length()
+    index_mask = (1 << index_bits) - 1
+    keys = [(k << index_bits) | i for i, k in enumerate(keys)]
+
+    target = [0] * n
+    count = typed_array('q', bytes(8 * radix))
+
+    for shift in range(0, width, bits):
+        if (varying >> shift) & digit_mask == 0:
+            continue
+
+        shift += index_bits
+        digits = [(k >> shift) & digit_mask for k in keys]
+
+        for i in range(radix):
+            count[i] = 0
+        for digit in digits:
+            count[digit] += 1
+
+        # Turn the counts into the starting position of every digit
+        total = 0
+        for i in range(radix):
+            count[i], total = total, total + count[i]
+
+        for k, digit in zip(keys, digits):
+            target[count[digit]] = k
+            count[digit] += 1
+
+        keys, target = target, keys
+
+    values = [values[k & index_mask] for k in keys]
+
+    assign_slice(array, 0, values)
+
+    return array
+
+
+def radix_sort_str(array: List[str], key: Callable[[T], str] = None, reverse: bool = False) -> List[str]:
     """
     Sorts a list of strings in ascending order using the Radix Sort algorithm.
 
-    This version of Radix Sort sorts strings by treating them as sequences of ASCII characters.
-    It sorts from the rightmost character to the leftmost, based on their ASCII values.
+    This version of Radix Sort sorts strings by treating them as sequences of Unicode code points.
+    It sorts from the rightmost character to the leftmost, based on their code points. Every pass stably distributes
+    the strings into buckets over an alphabet of s characters: the 128 ASCII characters, where character c goes into
+    bucket ord(c) + 1, or otherwise the distinct characters of the list, numbered in code point order with Radix Sort.
+    Strings that end before the current position go into bucket 0, ahead of every character, so shorter strings come
+    before the strings they prefix.
 
     Args:
         array (List[str]): The list to be sorted.
+        key (Callable[[T], str], optional): A function computing the key of every element, called once per element.
+        Defaults to None.
+        reverse (bool, optional): Whether to sort in descending order, keeping equal elements in their original order.
+        Defaults to False.
 
     Returns:
         List[str]: The sorted list.
 
     Time Complexity:
-        O(nk) - where n is the number of strings and k is the length of the longest string.
+        O(k(n + s)) - where n is the number of strings, k is the length of the longest string and s is the alphabet
+        size.
 
     Space Complexity:
-        O(n) - where n is the number of elements.
-    
+        O(n + s) - for the buckets.
+
     Stability:
         This implementation of Radix Sort is stable, it maintains the relative order of equal elements.
 
@@ -129,40 +483,164 @@ def radix_sort_str(array: List[str]) -> List[str]:
     []
     >>> radix_sort_str(['a'])
     ['a']
+    >>> radix_sort_str(['z', 'ab', 'aa'])
+    ['aa', 'ab', 'z']
+    >>> radix_sort_str([' ', '', 'a ', 'a'])
+    ['', ' ', 'a', 'a ']
+    >>> radix_sort_str(['a~', 'a b', 'a\\tb', 'ä', 'a'])
+    ['a', 'a\\tb', 'a b', 'a~', 'ä']
+    >>> radix_sort_str(['b', 'A', 'a'], key=str.lower)
+    ['A', 'a', 'b']
+    >>> radix_sort_str(['bb', 'a', 'ab'], reverse=True)
+    ['bb', 'ab', 'a']
     """
-    def counting_sort_chr(array: List[str], position: int) -> List[str]:
-        """
-        Performs counting sort on the list based on the character at the given position.
+    if key is not None or reverse:
+        return sort_by_key(radix_sort_str, array, key, reverse, decorate=False)
 
-        Args:
-            array (List[str]): The list of strings to be sorted.
-            position (int): The position of the character to sort by.
+    n = len(array)
 
-        Returns:
-            array (List[str]): The list sorted by the current character.
-        """
-        n = len(array)
-        count = [[] for _ in range(95)]
+    if n <= 1:
+        return array
 
-        for string in array:
-            char_index = ord(string[position]) - 32 if position < len(string) else 0
-            count[char_index].append(string)
+    text = ''.join(array)
+    if text.isascii():
+        alphabet, rank = 128, None
+    else:
+        # Number the distinct characters in code point order, so the buckets do not span all of Unicode
+        codes = radix_sort([ord(char) for char in set(text)], 1 << 8)
+        alphabet, rank = len(codes), {chr(code): i + 1 for i, code in enumerate(codes)}
+
+    max_length = max(len(string) for string in array)
+
+    for position in range(max_length - 1, -1, -1):
+        # Bucket 0 holds the strings that end before the position, and the characters follow it in order
+        buckets = [[] for _ in range(alphabet + 1)]
+        appends = [bucket.append for bucket in buckets]
+        if rank is None:
+            for string in array:
+                appends[ord(string[position]) + 1 if position < len(string) else 0](string)
+        else:
+            for string in array:
+                appends[rank[string[position]] if position < len(string) else 0](string)
+
+        array[:] = chain.from_iterable(buckets)
 
-        index = 0
-        for char_list in count:
-            for string in char_list:
-                array[index] = string
-                index += 1
+    return array
 
-        return array
 
-    if not array:
-        return array
+def radix_sort_msd(array: List[Union[str, bytes]], key: Callable[[T], Union[str, bytes]] = None,
+                   reverse: bool = False) -> List[Union[str, bytes]]:
+    """
+    Sorts a list of strings or bytes in ascending order using the MSD Radix Sort algorithm.
+
+    MSD Radix Sort distributes the elements into buckets by their first character, then recursively sorts every
+    bucket by the next character. Elements that end at the current position go first. Buckets holding a single
+    element are already in place and buckets with at most INSERTION_SORT_THRESHOLD elements are finished with
+    Insertion Sort on the rest of their elements from the current position, so only the distinguishing prefix of every
+    element is examined. Buckets are kept in a dictionary keyed by code point, or by byte value for bytes, so the full
+    Unicode range is supported without a count array per code point. Only the distinct codes of every bucket are put
+    in order: with Insertion Sort if there are at most INSERTION_SORT_THRESHOLD of them, by scanning the fixed
+    alphabet of BYTE_ALPHABET codes if they all fit in it, as for bytes and ASCII, and with Radix Sort in base
+    BYTE_ALPHABET otherwise.
+
+    Args:
+        array (List[Union[str, bytes]]): The list of strings, or of bytes, to be sorted.
+        key (Callable[[T], Union[str, bytes]], optional): A function computing the key of every element, called once
+        per element. Defaults to None.
+        reverse (bool, optional): Whether to sort in descending order, keeping equal elements in their original order.
+        Defaults to False.
+
+    Returns:
+        List[Union[str, bytes]]: The sorted list.
+
+    Time Complexity:
+        O(D + m) - where D is the total length of the distinguishing prefixes and m is the cost of ordering the c
+        distinct codes of every bucket: O(c^2) for at most INSERTION_SORT_THRESHOLD codes, O(256) for codes below
+        256, and O(c + 256) per byte of the largest code otherwise.
+
+    Space Complexity:
+        O(n + s) - for the buckets and the stack of buckets left to sort.
 
-    max_length = len(max(array))
+    Stability:
+        This implementation of Radix Sort is stable, it maintains the relative order of equal elements.
 
-    for pos in range(max_length - 1, -1, -1):
-        counting_sort_chr(array, pos)
+    Examples:
+    >>> radix_sort_msd([])
+    []
+    >>> radix_sort_msd(['a'])
+    ['a']
+    >>> radix_sort_msd(['banana', 'apple', 'band', 'ban', 'b', 'apple', 'Zebra', 'äpfel', ''])
+    ['', 'Zebra', 'apple', 'apple', 'b', 'ban', 'banana', 'band', 'äpfel']
+    >>> radix_sort_msd([b'\\xff', b'ab', b'a\\x00', b'a'])
+    [b'a', b'a\\x00', b'ab', b'\\xff']
+    >>> radix_sort_msd(['key' + str(i % 20) for i in range(40)]) == sorted('key' + str(i % 20) for i in range(40))
+    True
+    >>> radix_sort_msd(['b', 'A', 'a'], key=str.lower)
+    ['A', 'a', 'b']
+    >>> radix_sort_msd(['bb', 'a', 'ab'], reverse=True)
+    ['bb', 'ab', 'a']
+    """
+    if key is not None or reverse:
+        return sort_by_key(radix_sort_msd, array, key, reverse, decorate=False)
+
+    n = len(array)
+    is_bytes = n > 0 and not isinstance(array[0], str)
+
+    # Every bucket on the stack holds elements sharing their first depth characters
+    stack = [(0, n - 1, 0)]
+
+    while stack:
+        low, high, depth = stack.pop()
+
+        if high - low + 1 <= INSERTION_SORT_THRESHOLD:
+            # The elements share their first depth characters, so only the rest of them is compared
+            suffixes = [string[depth:] for string in array[low:high + 1]]
+            for i in range(1, len(suffixes)):
+                suffix, string = suffixes[i], array[low + i]
+                j = i - 1
+                while j >= 0 and suffix < suffixes[j]:
+                    suffixes[j + 1] = suffixes[j]
+                    array[low + j + 1] = array[low + j]
+                    j -= 1
+                suffixes[j + 1] = suffix
+                array[low + j + 1] = string
+            continue
+
+        ended = []
+        buckets = {}
+        for i in range(low, high + 1):
+            string = array[i]
+            if len(string) == depth:
+                ended.append(string)
+                continue
+            # Bytes are indexed as integers, and characters are keyed by their code points
+            code = string[depth] if is_bytes else ord(string[depth])
+            if code in buckets:
+                buckets[code].append(string)
+            else:
+                buckets[code] = [string]
+
+        index = low
+        for string in ended:
+            array[index] = string
+            index += 1
+
+        # Only the distinct codes of the bucket are put in order, never the elements themselves
+        codes = list(buckets)
+        if len(codes) <= INSERTION_SORT_THRESHOLD:
+            insertion_sort(codes)
+        elif max(codes) < BYTE_ALPHABET:
+            codes = [code for code in range(BYTE_ALPHABET) if code in buckets]
+        else:
+            radix_sort(codes, BYTE_ALPHABET)
+
+        for code in codes:
+            bucket = buckets[code]
+            for string in bucket:
+                array[index] = string
+                index += 1
+            if len(bucket) > 1:
+                stack.append((index - len(bucket), index - 1, depth + 1))
 
     return array
 
@@ -0,0 +1,134 @@
+"""
+Sample Sort Algorithm Implementation
+
+This module contains a multi-process implementation of the Sample Sort algorithm.
+
+Author: Aflah Hanif Amarlyadi
+Date: 2026-10-17
+License: MIT
+"""
+
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, List, TypeVar
+from algorithms.sorting.intro_sort import intro_sort
+from algorithms.sorting.sort_by_key import sort_by_key
+import os
+import random
+
+T = TypeVar('T')
+
+SEQUENTIAL_THRESHOLD = 100000
+
+
+def sample_sort(array: List[T], workers: int = None, oversampling: int = 32,
+                threshold: int = SEQUENTIAL_THRESHOLD, rng: random.Random = None, key: Callable[[T], Any] = None,
+                reverse: bool = False) -> List[T]:
+    """
+    Sorts a list in ascending order using a multi-process Sample Sort algorithm.
+
+    Sample Sort generalises the partitioning step of Quick Sort to many pivots. It draws a random sample of
+    oversampling elements per worker, sorts it, and picks evenly spaced splitters from it. Every element is placed
+    in the bucket between the two splitters around it, and every bucket is sorted in a separate process with Intro
+    Sort. As the buckets are ordered, the sorted buckets are simply concatenated, with no merge phase.
+
+    A splitter that takes up at least a bucket's share of the sample is heavy. Like the Dutch National Flag
+    partitioning scheme, elements equal to a heavy splitter get a bucket of their own, which is already sorted, so a
+    single worker does not receive all of the duplicates.
+
+    Lists with fewer than threshold elements are sorted sequentially, as the cost of starting processes and copying
+    the data to them outweighs the gain.
+
+    Args:
+        array (List[T]): The list to be sorted. Its elements must be picklable.
+        workers (int, optional): The number of worker processes. Defaults to the number of CPUs.
+        oversampling (int, optional): The number of sample elements drawn per worker. Defaults to 32.
+        threshold (int, optional): The minimum length of list sorted in parallel. Defaults to SEQUENTIAL_THRESHOLD.
+        rng (random.Random, optional): The random number generator for the sample and for the pivots of Intro Sort,
+        which makes runs reproducible when seeded. Defaults to the random module.
+        key (Callable[[T], Any], optional): A function computing the comparison key of every element, called once per
+        element. Defaults to None.
+        reverse (bool, optional): Whether to sort in descending order, keeping equal elements in their original order.
+        Defaults to False.
+
+    Returns:
+        List[T]: The sorted list.
+
+    Time Complexity:
+        O((n log n) / p + n log p) - where p is the number of workers, with high probability and excluding the cost
+        of copying the data between processes.
+
+    Space Complexity:
+        O(n) - additional space is used for the buckets.
+
+    Stability:
+        Sample Sort is unstable, it does not maintain the relative order of equal elements.
+
+    Examples:
+    >>> sample_sort([])
+    []
+    >>> sample_sort([1])
+    [1]
+    >>> sample_sort([1, 2, 3, 4, 5, 1, 2, 3, 4, 5])
+    [1, 1, 2, 2, 3, 3, 4, 4, 5, 5]
+    >>> sample_sort([1, 2, 3, 4, 5, 0, -1, -2, -3, -4, -5], workers=2, oversampling=2, threshold=0)
+    [-5, -4, -3, -2, -1, 0, 1, 2, 3, 4, 5]
+    >>> sample_sort([10, 9, 8, 7, 6, 5, 4, 3, 2, 1], workers=3, oversampling=2, threshold=0)
+    [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+    >>> sample_sort(['A', 'a', 'B', 'b', 'C', 'c', 'D', 'd', 'E', 'e'], workers=4, oversampling=2, threshold=0)
+    ['A', 'B', 'C', 'D', 'E', 'a', 'b', 'c', 'd', 'e']
+    >>> sample_sort([0, 7, 7, 7, 7, 7, 7, 7, 7, 1], workers=2, oversampling=5, threshold=0)
+    [0, 1, 7, 7, 7, 7, 7, 7, 7, 7]
+    >>> sample_sort(['bb', 'a', 'ccc', 'dd'], workers=2, oversampling=2, threshold=0, key=len, reverse=True)
+    ['ccc', 'bb', 'dd', 'a']
+    >>> sample_sort([i % 7 for i in range(50)], workers=2, oversampling=4, threshold=0,
+    ...             rng=random.Random(0)) == sorted(i % 7 for i in range(50))
+    True
+    """
+    if key is not None or reverse:
+        return sort_by_key(lambda pairs: sample_sort(pairs, workers, oversampling, threshold, rng), array, key, reverse,
+                           in_place=False)
+
+    n = len(array)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if n <= 1 or n < threshold or workers <= 1:
+        return intro_sort(list(array), rng=rng)
+
+    sample = intro_sort((random if rng is None else rng).sample(array, min(n, workers * oversampling)), rng=rng)
+    share = len(sample) / workers
+
+    # Pick evenly spaced, distinct splitters and mark those that fill at least a bucket's share of the sample
+    splitters = []
+    for i in range(1, workers):
+        splitter = sample[int(i * share)]
+        if not splitters or splitters[-1] < splitter:
+            splitters.append(splitter)
+
+    heavy = [bisect_right(sample, splitter) - bisect_left(sample, splitter) >= share for splitter in splitters]
+
+    # Bucket 2i holds the elements between splitters i - 1 and i, bucket 2i + 1 the elements equal to splitter i
+    buckets = [[] for _ in range(2 * len(splitters) + 1)]
+    for x in array:
+        i = bisect_left(splitters, x)
+        if i < len(splitters) and heavy[i] and not x < splitters[i]:
+            buckets[2 * i + 1].append(x)
+        else:
+            buckets[2 * i].append(x)
+
+    sorted_array = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(intro_sort, bucket, rng=rng) if i % 2 == 0 and len(bucket) > 1 else None
+                   for i, bucket in enumerate(buckets)]
+
+        for bucket, future in zip(buckets, futures):
+            sorted_array.extend(bucket if future is None else future.result())
+
+    return sorted_array
+
+
+if __name__ == "__main__":
+    import doctest
+    doctest.testmod()
@@ -8,12 +8,14 @@ Date: 2024-09-11
 License: MIT
 """
 
-from typing import List, TypeVar
+from typing import Any, Callable, MutableSequence, TypeVar
+from algorithms.sorting.sort_by_key import sort_by_key
 
 T = TypeVar('T')
 
 
-def selection_sort(array: List[T]) -> List[T]:
+def selection_sort(array: MutableSequence[T], key: Callable[[T], Any] = None,
+                   reverse: bool = False) -> MutableSequence[T]:
     """
     Sorts a list in ascending order using the Selection Sort algorithm.
 
@@ -22,10 +24,14 @@ def selection_sort(array: List[T]) -> List[T]:
     This process is repeated for the entire list until the list is sorted.
 
     Args:
-        array (List[T]): The list to be sorted.
+        array (MutableSequence[T]): The list to be sorted.
+        key (Callable[[T], Any], optional): A function computing the comparison key of every element, called once per
+        element. Defaults to None.
+        reverse (bool, optional): Whether to sort in descending order, keeping equal elements in their original order.
+        Defaults to False.
 
     Returns:
-        List[T]: The sorted list.
+        MutableSequence[T]: The sorted list.
 
     Time Complexity:
         O(n^2)
@@ -51,7 +57,14 @@ def selection_sort(array: List[T]) -> List[T]:
     [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
     >>> selection_sort(['A', 'a', 'B', 'b', 'C', 'c', 'D', 'd', 'E', 'e'])
     ['A', 'B', 'C', 'D', 'E', 'a', 'b', 'c', 'd', 'e']
+    >>> selection_sort(['bb', 'a', 'ccc', 'dd'], key=len)
+    ['a', 'bb', 'dd', 'ccc']
+    >>> selection_sort([3, 1, 2, 1], reverse=True)
+    [3, 2, 1, 1]
     """
+    if key is not None or reverse:
+        return sort_by_key(selection_sort, array, key, reverse)
+
     n = len(array)
 
     for i in range(n-1):
@@ -0,0 +1,165 @@
+"""
+Sort By Key Implementation
+
+This module contains the decorate-sort-undecorate helper that adds key functions and descending order to the sorting
+algorithms, and the helpers that copy and assign slices of any mutable sequence, such as array.array, memoryview and
+NumPy buffers.
+
+Author: Aflah Hanif Amarlyadi
+Date: 2026-10-17
+License: MIT
+"""
+
+from array import array as typed_array
+from typing import Any, Callable, List, MutableSequence, Sequence, TypeVar
+
+T = TypeVar('T')
+
+
+def copy_slice(array: MutableSequence[T], start: int, stop: int) -> MutableSequence[T]:
+    """
+    Copies a slice of a mutable sequence into a new sequence of the same kind, that does not share its memory.
+
+    Slicing copies lists, array.array and bytearray buffers, but a slice of a memoryview or a NumPy array is a view,
+    which changes along with the sequence. A memoryview slice is copied into an array.array of the same format, and a
+    NumPy view into a new NumPy array, so neither boxes its elements.
+
+    Args:
+        array (MutableSequence[T]): The sequence.
+        start (int): The index of the first element of the slice.
+        stop (int): The index after the last element of the slice.
+
+    Returns:
+        MutableSequence[T]: The copied slice.
+
+    Examples:
+    >>> copy_slice([1, 2, 3, 4], 1, 3)
+    [2, 3]
+    >>> view = memoryview(typed_array('q', [1, 2, 3, 4]))
+    >>> copy = copy_slice(view, 1, 3)
+    >>> view[1] = 0
+    >>> copy
+    array('q', [2, 3])
+    """
+    part = array[start:stop]
+
+    if isinstance(part, memoryview):
+        try:
+            return typed_array(part.format, part.tobytes())
+        except ValueError:
+            return part.tolist()
+
+    # NumPy views keep a reference to the array they view
+    if getattr(part, 'base', None) is not None:
+        return part.copy()
+
+    return part
+
+
+def assign_slice(array: MutableSequence[T], start: int, values: Sequence[T]) -> None:
+    """
+    Writes values into a mutable sequence, from the given index on.
+
+    The values are assigned to a slice in one step where the sequence accepts them, as lists accept any sequence and
+    typed buffers accept buffers of the same type, and are otherwise written one element at a time.
+
+    Args:
+        array (MutableSequence[T]): The sequence.
+        start (int): The index to write the first value to.
+        values (Sequence[T]): The values.
+
+    Examples:
+    >>> buffer = typed_array('d', [0.0, 0.0, 0.0])
+    >>> assign_slice(buffer, 1, [2.5, 1.5])
+    >>> buffer
+    array('d', [0.0, 2.5, 1.5])
+    """
+    try:
+        array[start:start + len(values)] = values
+    except (TypeError, ValueError):
+        for i in range(len(values)):
+            array[start + i] = values[i]
+
+
+def sort_by_key(sort: Callable[[List[Any]], List[Any]], array: MutableSequence[T], key: Callable[[T], Any] = None,
+                reverse: bool = False, low: int = 0, high: int = None, in_place: bool = True,
+                decorate: bool = True) -> MutableSequence[T]:
+    """
+    Sorts a sublist by the keys of its elements with the given sorting algorithm, optionally in descending order.
+
+    The key of every element is computed exactly once. For comparison sorts, every key is decorated with the index of
+    its element, so the sort compares (key, index) pairs and never the elements themselves, and the elements are then
+    rearranged in the order of the sorted indices. Because the indices break ties, the result is stable even for
+    unstable algorithms. For descending order, the negated index is used and the sorted pairs are reversed, which
+    keeps equal elements in their original order.
+
+    Algorithms that only accept plain keys, such as Counting Sort and Radix Sort, are run with decorate set to False.
+    The bare keys are sorted, and every key in the sorted list is mapped back to the next unused element with that
+    key, which is stable too. The keys must then be hashable.
+
+    Args:
+        sort (Callable[[List[Any]], List[Any]]): The sorting algorithm, called with a list and returning it sorted.
+        array (MutableSequence[T]): The list to be sorted.
+        key (Callable[[T], Any], optional): A function computing the comparison key of every element. Defaults to
+        None, in which case the elements are the keys.
+        reverse (bool, optional): Whether to sort in descending order. Defaults to False.
+        low (int, optional): The lower index of the sublist. Defaults to 0.
+        high (int, optional): The upper index of the sublist. Defaults to None.
+        in_place (bool, optional): Whether to write the result back into the list rather than return a new list.
+        Defaults to True.
+        decorate (bool, optional): Whether the algorithm is a comparison sort that can sort (key, index) pairs.
+        Defaults to True.
+
+    Returns:
+        MutableSequence[T]: The sorted list.
+
+    Time Complexity:
+        O(n) - plus the time complexity of the sorting algorithm, where n is the number of elements.
+
+    Space Complexity:
+        O(n) - for the keys and the decorated pairs.
+
+    Examples:
+    >>> sort_by_key(sorted, ['bb', 'a', 'ccc', 'dd'], key=len)
+    ['a', 'bb', 'dd', 'ccc']
+    >>> sort_by_key(sorted, ['bb', 'a', 'ccc', 'dd'], key=len, reverse=True)
+    ['ccc', 'bb', 'dd', 'a']
+    >>> sort_by_key(sorted, [('b', 2), ('a', 1), ('c', 2)], key=lambda record: record[1], decorate=False)
+    [('a', 1), ('b', 2), ('c', 2)]
+    """
+    n = len(array)
+
+    high = n-1 if high is None else high
+
+    values = array[low:high + 1]
+    keys = list(values) if key is None else [key(x) for x in values]
+
+    if decorate:
+        sign = -1 if reverse else 1
+        pairs = sort([(keys[i], sign * i) for i in range(len(keys))])
+        if reverse:
+            pairs.reverse()
+        result = [values[sign * i] for _, i in pairs]
+    else:
+        positions = {}
+        for i in range(len(keys)):
+            positions.setdefault(keys[i], []).append(i)
+        for indices in positions.values():
+            indices.reverse()
+
+        keys = sort(keys)
+        if reverse:
+            keys.reverse()
+        result = [values[positions[k].pop()] for k in keys]
+
+    if not in_place:
+        return result
+
+    assign_slice(array, low, result)
+
+    return array
+
+
+if __name__ == "__main__":
+    import doctest
+    doctest.testmod()
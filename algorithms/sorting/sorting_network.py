@@ -0,0 +1,264 @@
+"""
+Sorting Network Implementation
+
+This module contains optimal sorting networks for small fixed sizes, and the straight-line sorting functions generated
+from them.
+
+A sorting network is a fixed sequence of compare-exchange operations on pairs of positions that sorts every input of
+its size. As the sequence does not depend on the data, it can be compiled into a function without loops or index
+arithmetic, which sorts a tiny sublist faster than Insertion Sort does. The networks are used as base cases by the
+divide-and-conquer algorithms of the package.
+
+Author: Aflah Hanif Amarlyadi
+Date: 2026-10-17
+License: MIT
+"""
+
+from typing import Any, Callable, Dict, List, MutableSequence, Tuple, TypeVar
+from algorithms.sorting.sort_by_key import sort_by_key
+
+T = TypeVar('T')
+
+MAX_NETWORK_SIZE = 16
+
+# The networks with the fewest known compare-exchanges, which are proven optimal for up to 12 elements. The network
+# for 15 elements is the one for 16 elements without the compare-exchanges on its last position.
+NETWORKS: Dict[int, List[Tuple[int, int]]] = {
+    0: [],
+    1: [],
+    2: [(0, 1)],
+    3: [(0, 2), (0, 1), (1, 2)],
+    4: [(0, 2), (1, 3), (0, 1), (2, 3), (1, 2)],
+    5: [(0, 3), (1, 4), (0, 2), (1, 3), (0, 1), (2, 4), (1, 2), (3, 4), (2, 3)],
+    6: [(0, 5), (1, 3), (2, 4), (1, 2), (3, 4), (0, 3), (2, 5), (0, 1), (2, 3), (4, 5), (1, 2), (3, 4)],
+    7: [(0, 6), (2, 3), (4, 5), (0, 2), (1, 4), (3, 6), (0, 1), (2, 5), (3, 4), (1, 2), (4, 6), (2, 3), (4, 5), (1, 2),
+        (3, 4), (5, 6)],
+    8: [(0, 2), (1, 3), (4, 6), (5, 7), (0, 4), (1, 5), (2, 6), (3, 7), (0, 1), (2, 3), (4, 5), (6, 7), (2, 4), (3, 5),
+        (1, 4), (3, 6), (1, 2), (3, 4), (5, 6)],
+    9: [(0, 3), (1, 7), (2, 5), (4, 8), (0, 7), (2, 4), (3, 8), (5, 6), (0, 2), (1, 3), (4, 5), (7, 8), (1, 4), (3, 6),
+        (5, 7), (0, 1), (2, 4), (3, 5), (6, 8), (2, 3), (4, 5), (6, 7), (1, 2), (3, 4), (5, 6)],
+    10: [(0, 8), (1, 9), (2, 7), (3, 5), (4, 6), (0, 2), (1, 4), (5, 8), (7, 9), (0, 3), (2, 4), (5, 7), (6, 9), (0, 1),
+         (3, 6), (8, 9), (1, 5), (2, 3), (4, 8), (6, 7), (1, 2), (3, 5), (4, 6), (7, 8), (2, 3), (4, 5), (6, 7), (3, 4),
+         (5, 6)],
+    11: [(0, 9), (1, 6), (2, 4), (3, 7), (5, 8), (0, 1), (3, 5), (4, 10), (6, 9), (7, 8), (1, 3), (2, 5), (4, 7),
+         (8, 10), (0, 4), (1, 2), (3, 7), (5, 9), (6, 8), (0, 1), (2, 6), (4, 5), (7, 8), (9, 10), (2, 4), (3, 6),
+         (5, 7), (8, 9), (1, 2), (3, 4), (5, 6), (7, 8), (2, 3), (4, 5), (6, 7)],
+    12: [(0, 8), (1, 7), (2, 6), (3, 11), (4, 10), (5, 9), (0, 1), (2, 5), (3, 4), (6, 9), (7, 8), (10, 11), (0, 2),
+         (1, 6), (5, 10), (9, 11), (0, 3), (1, 2), (4, 6), (5, 7), (8, 11), (9, 10), (1, 4), (3, 5), (6, 8), (7, 10),
+         (1, 3), (2, 5), (6, 9), (8, 10), (2, 3), (4, 5), (6, 7), (8, 9), (4, 6), (5, 7), (3, 4), (5, 6), (7, 8)],
+    13: [(0, 12), (1, 10), (2, 9), (3, 7), (5, 11), (6, 8), (1, 6), (2, 3), (4, 11), (7, 9), (8, 10), (0, 4), (1, 2),
+         (3, 6), (7, 8), (9, 10), (11, 12), (4, 6), (5, 9), (8, 11), (10, 12), (0, 5), (3, 8), (4, 7), (6, 11), (9, 10),
+         (0, 1), (2, 5), (6, 9), (7, 8), (10, 11), (1, 3), (2, 4), (5, 6), (9, 10), (1, 2), (3, 4), (5, 7), (6, 8),
+         (2, 3), (4, 5), (6, 7), (8, 9), (3, 4), (5, 6)],
+    14: [(0, 1), (2, 3), (4, 5), (6, 7), (8, 9), (10, 11), (12, 13), (0, 2), (1, 3), (4, 8), (5, 9), (10, 12), (11, 13),
+         (0, 4), (1, 2), (3, 7), (5, 8), (6, 10), (9, 13), (11, 12), (0, 6), (1, 5), (3, 9), (4, 10), (7, 13), (8, 12),
+         (2, 10), (3, 11), (4, 6), (7, 9), (1, 3), (2, 8), (5, 11), (6, 7), (10, 12), (1, 4), (2, 6), (3, 5), (7, 11),
+         (8, 10), (9, 12), (2, 4), (3, 6), (5, 8), (7, 10), (9, 11), (3, 4), (5, 6), (7, 8), (9, 10), (6, 7)],
+    15: [(0, 13), (1, 12), (3, 14), (4, 8), (5, 6), (7, 11), (9, 10), (0, 5), (1, 7), (2, 9), (3, 4), (6, 13), (8, 14),
+         (11, 12), (0, 1), (2, 3), (4, 5), (6, 8), (7, 9), (10, 11), (12, 13), (0, 2), (1, 3), (4, 10), (5, 11), (6, 7),
+         (8, 9), (12, 14), (1, 2), (3, 12), (4, 6), (5, 7), (8, 10), (9, 11), (13, 14), (1, 4), (2, 6), (5, 8), (7, 10),
+         (9, 13), (11, 14), (2, 4), (3, 6), (9, 12), (11, 13), (3, 5), (6, 8), (7, 9), (10, 12), (3, 4), (5, 6), (7, 8),
+         (9, 10), (11, 12), (6, 7), (8, 9)],
+    16: [(0, 13), (1, 12), (2, 15), (3, 14), (4, 8), (5, 6), (7, 11), (9, 10), (0, 5), (1, 7), (2, 9), (3, 4), (6, 13),
+         (8, 14), (10, 15), (11, 12), (0, 1), (2, 3), (4, 5), (6, 8), (7, 9), (10, 11), (12, 13), (14, 15), (0, 2),
+         (1, 3), (4, 10), (5, 11), (6, 7), (8, 9), (12, 14), (13, 15), (1, 2), (3, 12), (4, 6), (5, 7), (8, 10),
+         (9, 11), (13, 14), (1, 4), (2, 6), (5, 8), (7, 10), (9, 13), (11, 14), (2, 4), (3, 6), (9, 12), (11, 13),
+         (3, 5), (6, 8), (7, 9), (10, 12), (3, 4), (5, 6), (7, 8), (9, 10), (11, 12), (6, 7), (8, 9)],
+}
+
+
+def is_sorting_network(network: List[Tuple[int, int]], n: int) -> bool:
+    """
+    Checks whether a network of compare-exchanges sorts every input of size n.
+
+    By the 0-1 principle, a network sorts every input if it sorts every input of zeros and ones. All 2^n such inputs
+    are checked at once: position i is held as a bitset of 2^n bits, whose bit x is bit i of the input x. A
+    compare-exchange then takes the AND and the OR of two bitsets, and the outputs are sorted if no bit is set at a
+    position but clear at the next one.
+
+    Args:
+        network (List[Tuple[int, int]]): The compare-exchanges, as pairs of positions i < j.
+        n (int): The number of elements.
+
+    Returns:
+        bool: Whether the network sorts every input of size n.
+
+    Time Complexity:
+        O(2^n * (c + n) / w) - where c is the number of compare-exchanges and w is the word size.
+
+    Examples:
+    >>> all(is_sorting_network(NETWORKS[n], n) for n in NETWORKS)
+    True
+    >>> [len(NETWORKS[n]) for n in range(2, MAX_NETWORK_SIZE + 1)]
+    [1, 3, 5, 9, 12, 16, 19, 25, 29, 35, 39, 45, 51, 56, 60]
+    >>> is_sorting_network([(0, 1), (1, 2)], 3)
+    False
+    """
+    inputs = 1 << n
+    ones = (1 << inputs) - 1
+    positions = [ones // ((1 << (2 << i)) - 1) * (((1 << (1 << i)) - 1) << (1 << i)) for i in range(n)]
+
+    for i, j in network:
+        positions[i], positions[j] = positions[i] & positions[j], positions[i] | positions[j]
+
+    return all(positions[i] & ~positions[i + 1] == 0 for i in range(n - 1))
+
+
+def generate_network_code(n: int, rank: int = None) -> str:
+    """
+    Generates the source code of the straight-line function sorting n elements with NETWORKS[n], or selecting the
+    element of a given rank.
+
+    The sorting function loads the sublist into local variables, compare-exchanges them in the order of the network
+    and stores them back by index, so every element is read and written exactly once, in any mutable sequence. The
+    selecting function only keeps the compare-exchanges that the element at position rank depends on, and returns it
+    without writing anything back.
+
+    Args:
+        n (int): The number of elements, at most MAX_NETWORK_SIZE.
+        rank (int, optional): The rank of the element to select, less than n. Defaults to None, to sort.
+
+    Returns:
+        str: The source code of a function sort_n(array, low) sorting array[low:low + n] in place, or of a function
+        select_n_rank(array) returning the element of the given rank in a list of n elements.
+
+    Examples:
+    >>> print(generate_network_code(3))
+    def sort_3(array, low):
+        x0, x1, x2 = array[low:low + 3]
+        if x2 < x0: x0, x2 = x2, x0
+        if x1 < x0: x0, x1 = x1, x0
+        if x2 < x1: x1, x2 = x2, x1
+        array[low], array[low + 1], array[low + 2] = x0, x1, x2
+    >>> print(generate_network_code(3, 0))
+    def select_3_0(array):
+        x0, x1, x2 = array
+        if x2 < x0: x0, x2 = x2, x0
+        if x1 < x0: x0, x1 = x1, x0
+        return x0
+    """
+    variables = ', '.join(f'x{i}' for i in range(n))
+
+    if rank is None:
+        if n < 2:
+            return f"def sort_{n}(array, low):\n    pass"
+        network = NETWORKS[n]
+        lines = [f"def sort_{n}(array, low):", f"    {variables} = array[low:low + {n}]"]
+    else:
+        # Walk the network backwards, keeping the compare-exchanges that reach the selected position
+        network, needed = [], {rank}
+        for i, j in reversed(NETWORKS[n]):
+            if i in needed or j in needed:
+                network.append((i, j))
+                needed.update((i, j))
+        network.reverse()
+        lines = [f"def select_{n}_{rank}(array):", f"    {variables}{',' if n == 1 else ''} = array"]
+
+    lines += [f"    if x{j} < x{i}: x{i}, x{j} = x{j}, x{i}" for i, j in network]
+    if rank is None:
+        targets = ', '.join(f'array[low + {i}]' if i else 'array[low]' for i in range(n))
+        lines.append(f"    {targets} = {variables}")
+    else:
+        lines.append(f"    return x{rank}")
+
+    return '\n'.join(lines)
+
+
+def compile_network(n: int, rank: int = None) -> Callable[..., Any]:
+    """
+    Compiles the straight-line function generated by generate_network_code.
+
+    Args:
+        n (int): The number of elements, at most MAX_NETWORK_SIZE.
+        rank (int, optional): The rank of the element to select, less than n. Defaults to None, to sort.
+
+    Returns:
+        Callable[..., Any]: A function sorting array[low:low + n] in place, given array and low, or a function
+        returning the element of the given rank in a list of n elements.
+    """
+    namespace = {}
+    exec(generate_network_code(n, rank), namespace)
+    return namespace[f'sort_{n}' if rank is None else f'select_{n}_{rank}']
+
+
+# SORTERS[n] sorts n elements starting at a given index
+SORTERS: List[Callable[[List[T], int], None]] = [compile_network(n) for n in range(MAX_NETWORK_SIZE + 1)]
+
+# MEDIANS[n] returns the median of a list of n elements, the upper one if n is even
+MEDIANS: Dict[int, Callable[[List[T]], T]] = {n: compile_network(n, n // 2) for n in range(1, MAX_NETWORK_SIZE + 1)}
+
+
+def network_sort(array: MutableSequence[T], low: int = 0, high: int = None, key: Callable[[T], Any] = None,
+                 reverse: bool = False) -> MutableSequence[T]:
+    """
+    Sorts a list of at most MAX_NETWORK_SIZE elements in ascending order with an optimal sorting network.
+
+    Args:
+        array (MutableSequence[T]): The list to be sorted.
+        low (int, optional): The lower index of the sublist. Defaults to 0.
+        high (int, optional): The upper index of the sublist. Defaults to None.
+        key (Callable[[T], Any], optional): A function computing the comparison key of every element, called once per
+        element. Defaults to None.
+        reverse (bool, optional): Whether to sort in descending order, keeping equal elements in their original order.
+        Defaults to False.
+
+    Returns:
+        MutableSequence[T]: The sorted list.
+
+    Raises:
+        ValueError: If the sublist has more than MAX_NETWORK_SIZE elements.
+
+    Time Complexity:
+        O(1) - at most len(NETWORKS[MAX_NETWORK_SIZE]) comparisons.
+
+    Space Complexity:
+        O(1) - for the local copies of at most MAX_NETWORK_SIZE elements.
+
+    Stability:
+        Sorting networks are unstable, they do not maintain the relative order of equal elements.
+
+    Examples:
+    >>> network_sort([])
+    []
+    >>> network_sort([1])
+    [1]
+    >>> network_sort([1, 2, 3, 4, 5, 1, 2, 3, 4, 5])
+    [1, 1, 2, 2, 3, 3, 4, 4, 5, 5]
+    >>> network_sort([1, 2, 3, 4, 5, 0, -1, -2, -3, -4, -5])
+    [-5, -4, -3, -2, -1, 0, 1, 2, 3, 4, 5]
+    >>> network_sort([1, 2, 3, 4, 5, 6, 7, 8, 9, 10])
+    [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+    >>> network_sort([10, 9, 8, 7, 6, 5, 4, 3, 2, 1])
+    [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+    >>> network_sort(['A', 'a', 'B', 'b', 'C', 'c', 'D', 'd', 'E', 'e'])
+    ['A', 'B', 'C', 'D', 'E', 'a', 'b', 'c', 'd', 'e']
+    >>> network_sort([5, 4, 3, 2, 1], 1, 3)
+    [5, 2, 3, 4, 1]
+    >>> network_sort(['bb', 'a', 'ccc', 'dd'], key=len)
+    ['a', 'bb', 'dd', 'ccc']
+    >>> network_sort([3, 1, 2, 1], reverse=True)
+    [3, 2, 1, 1]
+    >>> network_sort(list(range(17)))
+    Traceback (most recent call last):
+        ...
+    ValueError: Sorting networks sort at most 16 elements, got 17.
+    """
+    n = len(array)
+
+    high = n-1 if high is None else high
+    size = max(0, high - low + 1)
+
+    if size > MAX_NETWORK_SIZE:
+        raise ValueError(f"Sorting networks sort at most {MAX_NETWORK_SIZE} elements, got {size}.")
+
+    if key is not None or reverse:
+        return sort_by_key(network_sort, array, key, reverse, low, high)
+
+    SORTERS[size](array, low)
+
+    return array
+
+
+if __name__ == "__main__":
+    import doctest
+    doctest.testmod()
@@ -0,0 +1,510 @@
+"""
+Tim Sort Algorithm Implementation
+
+This module contains an implementation of the Tim Sort algorithm, an adaptive Merge Sort.
+
+Author: Aflah Hanif Amarlyadi
+Date: 2026-10-17
+License: MIT
+"""
+
+from typing import Any, Callable, MutableSequence, TypeVar
+from algorithms.sorting.insertion_sort import binary_insertion_sort
+from algorithms.sorting.sort_by_key import copy_slice, sort_by_key
+
+T = TypeVar('T')
+
+MIN_MERGE = 32
+MIN_GALLOP = 7
+
+
+def gallop_left(key: T, array: MutableSequence[T], base: int, length: int, hint: int) -> int:
+    """
+    Finds the leftmost position at which key can be inserted into the sorted sublist array[base:base + length].
+
+    The search starts at array[base + hint] and probes at exponentially growing offsets before finishing with a binary
+    search, so it is fast when the position is close to the hint.
+
+    Args:
+        key (T): The element whose position is searched for.
+        array (MutableSequence[T]): The list containing the sorted sublist.
+        base (int): The index of the first element of the sublist.
+        length (int): The number of elements in the sublist, must be positive.
+        hint (int): The offset in the sublist at which to start searching.
+
+    Returns:
+        int: The offset k such that array[base + k - 1] < key <= array[base + k].
+
+    Time Complexity:
+        O(log d) - where d is the distance between the hint and the returned offset.
+    """
+    last_offset, offset = 0, 1
+
+    if key > array[base + hint]:
+        max_offset = length - hint
+        while offset < max_offset and key > array[base + hint + offset]:
+            last_offset = offset
+            offset = (offset << 1) + 1
+        offset = min(offset, max_offset)
+        last_offset, offset = last_offset + hint, offset + hint
+    else:
+        max_offset = hint + 1
+        while offset < max_offset and key <= array[base + hint - offset]:
+            last_offset = offset
+            offset = (offset << 1) + 1
+        offset = min(offset, max_offset)
+        last_offset, offset = hint - offset, hint - last_offset
+
+    last_offset += 1
+    while last_offset < offset:
+        mid = last_offset + (offset - last_offset) // 2
+        if key > array[base + mid]:
+            last_offset = mid + 1
+        else:
+            offset = mid
+
+    return offset
+
+
+def gallop_right(key: T, array: MutableSequence[T], base: int, length: int, hint: int) -> int:
+    """
+    Finds the rightmost position at which key can be inserted into the sorted sublist array[base:base + length].
+
+    Args:
+        key (T): The element whose position is searched for.
+        array (MutableSequence[T]): The list containing the sorted sublist.
+        base (int): The index of the first element of the sublist.
+        length (int): The number of elements in the sublist, must be positive.
+        hint (int): The offset in the sublist at which to start searching.
+
+    Returns:
+        int: The offset k such that array[base + k - 1] <= key < array[base + k].
+
+    Time Complexity:
+        O(log d) - where d is the distance between the hint and the returned offset.
+    """
+    last_offset, offset = 0, 1
+
+    if key < array[base + hint]:
+        max_offset = hint + 1
+        while offset < max_offset and key < array[base + hint - offset]:
+            last_offset = offset
+            offset = (offset << 1) + 1
+        offset = min(offset, max_offset)
+        last_offset, offset = hint - offset, hint - last_offset
+    else:
+        max_offset = length - hint
+        while offset < max_offset and key >= array[base + hint + offset]:
+            last_offset = offset
+            offset = (offset << 1) + 1
+        offset = min(offset, max_offset)
+        last_offset, offset = last_offset + hint, offset + hint
+
+    last_offset += 1
+    while last_offset < offset:
+        mid = last_offset + (offset - last_offset) // 2
+        if key < array[base + mid]:
+            offset = mid
+        else:
+            last_offset = mid + 1
+
+    return offset
+
+
+def tim_sort(array: MutableSequence[T], low: int = 0, high: int = None, key: Callable[[T], Any] = None,
+             reverse: bool = False) -> MutableSequence[T]:
+    """
+    Sorts a list in ascending order using the Tim Sort algorithm.
+
+    Tim Sort is an adaptive Merge Sort. It scans the list for natural runs, ascending or strictly descending (which
+    are reversed in place), and extends runs shorter than a computed minimum length with Binary Insertion Sort. The
+    runs are pushed onto a stack whose lengths are kept growing faster than the Fibonacci sequence, so merges stay
+    balanced. While merging, once one run wins MIN_GALLOP times in a row, the merge switches to galloping mode and
+    copies whole blocks found by exponential search instead of comparing element by element.
+
+    Args:
+        array (MutableSequence[T]): The list to be sorted.
+        low (int, optional): The lower index of the sublist. Defaults to 0.
+        high (int, optional): The upper index of the sublist. Defaults to None.
+        key (Callable[[T], Any], optional): A function computing the comparison key of every element, called once per
+        element. Defaults to None.
+        reverse (bool, optional): Whether to sort in descending order, keeping equal elements in their original order.
+        Defaults to False.
+
+    Returns:
+        MutableSequence[T]: The sorted list.
+
+    Time Complexity:
+        Best Case: O(n) - occurs when the list consists of a few natural runs, e.g. already sorted or reversed.
+        Average Case: O(n log n)
+        Worst Case: O(n log n)
+
+    Space Complexity:
+        O(n) - a temporary copy of the smaller run is made for every merge.
+
+    Stability:
+        Tim Sort is stable, it maintains the relative order of equal elements.
+
+    Examples:
+    >>> tim_sort([])
+    []
+    >>> tim_sort([1])
+    [1]
+    >>> tim_sort([1, 2, 3, 4, 5, 1, 2, 3, 4, 5])
+    [1, 1, 2, 2, 3, 3, 4, 4, 5, 5]
+    >>> tim_sort([1, 2, 3, 4, 5, 0, -1, -2, -3, -4, -5])
+    [-5, -4, -3, -2, -1, 0, 1, 2, 3, 4, 5]
+    >>> tim_sort([1, 2, 3, 4, 5, 6, 7, 8, 9, 10])
+    [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+    >>> tim_sort([10, 9, 8, 7, 6, 5, 4, 3, 2, 1])
+    [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+    >>> tim_sort(['A', 'a', 'B', 'b', 'C', 'c', 'D', 'd', 'E', 'e'])
+    ['A', 'B', 'C', 'D', 'E', 'a', 'b', 'c', 'd', 'e']
+    >>> tim_sort(list(range(100)) + list(range(50))) == sorted(list(range(100)) + list(range(50)))
+    True
+    >>> tim_sort(['bb', 'a', 'ccc', 'dd'], key=len)
+    ['a', 'bb', 'dd', 'ccc']
+    >>> tim_sort([3, 1, 2, 1], reverse=True)
+    [3, 2, 1, 1]
+    >>> from array import array
+    >>> buffer = array('q', [i * 7919 % 1000 for i in range(1000)])
+    >>> view = tim_sort(memoryview(buffer))
+    >>> buffer == array('q', range(1000))
+    True
+    """
+    if key is not None or reverse:
+        return sort_by_key(tim_sort, array, key, reverse, low, high)
+
+    def min_run_length(n: int) -> int:
+        """
+        Computes the minimum run length, so that n / min_run is close to, but no more than, a power of two.
+
+        Args:
+            n (int): The number of elements to be sorted.
+
+        Returns:
+            int: The minimum run length, between MIN_MERGE / 2 and MIN_MERGE.
+        """
+        r = 0
+        while n >= MIN_MERGE:
+            r |= n & 1
+            n >>= 1
+        return n + r
+
+    def count_run(low: int, high: int) -> int:
+        """
+        Finds the end of the natural run starting at low, reversing it in place if it is strictly descending.
+
+        Args:
+            low (int): The index of the first element of the run.
+            high (int): The index one past the last element that may belong to the run.
+
+        Returns:
+            int: The index one past the last element of the run.
+        """
+        end = low + 1
+        if end == high:
+            return end
+
+        if array[end] < array[low]:
+            while end < high and array[end] < array[end - 1]:
+                end += 1
+            i, j = low, end - 1
+            while i < j:
+                array[i], array[j] = array[j], array[i]
+                i += 1
+                j -= 1
+        else:
+            while end < high and not array[end] < array[end - 1]:
+                end += 1
+
+        return end
+
+    def merge_at(i: int) -> None:
+        """
+        Merges the runs at positions i and i + 1 of the run stack.
+
+        Args:
+            i (int): The stack position of the first run to merge.
+        """
+        base1, length1 = runs[i]
+        base2, length2 = runs[i + 1]
+        runs[i] = (base1, length1 + length2)
+        del runs[i + 1]
+
+        # Elements of the first run that are not greater than the head of the second run are already in place
+        k = gallop_right(array[base2], array, base1, length1, 0)
+        base1 += k
+        length1 -= k
+        if length1 == 0:
+            return
+
+        # Elements of the second run that are not less than the tail of the first run are already in place
+        length2 = gallop_left(array[base1 + length1 - 1], array, base2, length2, length2 - 1)
+        if length2 == 0:
+            return
+
+        if length1 <= length2:
+            merge_low(base1, length1, base2, length2)
+        else:
+            merge_high(base1, length1, base2, length2)
+
+    def merge_low(base1: int, length1: int, base2: int, length2: int) -> None:
+        """
+        Merges two adjacent runs from left to right, copying the first (shorter) run to a temporary list.
+
+        Args:
+            base1 (int): The index of the first element of the first run.
+            length1 (int): The length of the first run.
+            base2 (int): The index of the first element of the second run.
+            length2 (int): The length of the second run.
+        """
+        nonlocal min_gallop
+
+        temp = copy_slice(array, base1, base1 + length1)
+        cursor1, cursor2, dest = 0, base2, base1
+
+        array[dest] = array[cursor2]
+        dest += 1
+        cursor2 += 1
+        length2 -= 1
+
+        done = length2 == 0 or length1 == 1
+        while not done:
+            count1 = count2 = 0
+
+            # Compare element by element until one run wins consistently
+            while True:
+                if array[cursor2] < temp[cursor1]:
+                    array[dest] = array[cursor2]
+                    dest += 1
+                    cursor2 += 1
+                    length2 -= 1
+                    count2 += 1
+                    count1 = 0
+                    if length2 == 0:
+                        done = True
+                        break
+                else:
+                    array[dest] = temp[cursor1]
+                    dest += 1
+                    cursor1 += 1
+                    length1 -= 1
+                    count1 += 1
+                    count2 = 0
+                    if length1 == 1:
+                        done = True
+                        break
+                if count1 >= min_gallop or count2 >= min_gallop:
+                    break
+
+            # Gallop while either run keeps winning by long stretches
+            while not done:
+                count1 = gallop_right(array[cursor2], temp, cursor1, length1, 0)
+                if count1:
+                    array[dest:dest + count1] = temp[cursor1:cursor1 + count1]
+                    dest += count1
+                    cursor1 += count1
+                    length1 -= count1
+                    if length1 <= 1:
+                        done = True
+                        break
+
+                array[dest] = array[cursor2]
+                dest += 1
+                cursor2 += 1
+                length2 -= 1
+                if length2 == 0:
+                    done = True
+                    break
+
+                count2 = gallop_left(temp[cursor1], array, cursor2, length2, 0)
+                if count2:
+                    array[dest:dest + count2] = array[cursor2:cursor2 + count2]
+                    dest += count2
+                    cursor2 += count2
+                    length2 -= count2
+                    if length2 == 0:
+                        done = True
+                        break
+
+                array[dest] = temp[cursor1]
+                dest += 1
+                cursor1 += 1
+                length1 -= 1
+                if length1 == 1:
+                    done = True
+                    break
+
+                min_gallop -= 1
+                if count1 < MIN_GALLOP and count2 < MIN_GALLOP:
+                    break
+
+            min_gallop = max(min_gallop, 0) + 2
+
+        min_gallop = max(min_gallop, 1)
+
+        if length1 == 1:
+            array[dest:dest + length2] = array[cursor2:cursor2 + length2]
+            array[dest + length2] = temp[cursor1]
+        else:
+            array[dest:dest + length1] = temp[cursor1:cursor1 + length1]
+
+    def merge_high(base1: int, length1: int, base2: int, length2: int) -> None:
+        """
+        Merges two adjacent runs from right to left, copying the second (shorter) run to a temporary list.
+
+        Args:
+            base1 (int): The index of the first element of the first run.
+            length1 (int): The length of the first run.
+            base2 (int): The index of the first element of the second run.
+            length2 (int): The length of the second run.
+        """
+        nonlocal min_gallop
+
+        temp = copy_slice(array, base2, base2 + length2)
+        cursor1, cursor2, dest = base1 + length1 - 1, length2 - 1, base2 + length2 - 1
+
+        array[dest] = array[cursor1]
+        dest -= 1
+        cursor1 -= 1
+        length1 -= 1
+
+        done = length1 == 0 or length2 == 1
+        while not done:
+            count1 = count2 = 0
+
+            # Compare element by element until one run wins consistently
+            while True:
+                if temp[cursor2] < array[cursor1]:
+                    array[dest] = array[cursor1]
+                    dest -= 1
+                    cursor1 -= 1
+                    length1 -= 1
+                    count1 += 1
+                    count2 = 0
+                    if length1 == 0:
+                        done = True
+                        break
+                else:
+                    array[dest] = temp[cursor2]
+                    dest -= 1
+                    cursor2 -= 1
+                    length2 -= 1
+                    count2 += 1
+                    count1 = 0
+                    if length2 == 1:
+                        done = True
+                        break
+                if count1 >= min_gallop or count2 >= min_gallop:
+                    break
+
+            # Gallop while either run keeps winning by long stretches
+            while not done:
+                count1 = length1 - gallop_right(temp[cursor2], array, base1, length1, length1 - 1)
+                if count1:
+                    dest -= count1
+                    cursor1 -= count1
+                    length1 -= count1
+                    array[dest + 1:dest + 1 + count1] = array[cursor1 + 1:cursor1 + 1 + count1]
+                    if length1 == 0:
+                        done = True
+                        break
+
+                array[dest] = temp[cursor2]
+                dest -= 1
+                cursor2 -= 1
+                length2 -= 1
+                if length2 == 1:
+                    done = True
+                    break
+
+                count2 = length2 - gallop_left(array[cursor1], temp, 0, length2, length2 - 1)
+                if count2:
+                    dest -= count2
+                    cursor2 -= count2
+                    length2 -= count2
+                    array[dest + 1:dest + 1 + count2] = temp[cursor2 + 1:cursor2 + 1 + count2]
+                    if length2 <= 1:
+                        done = True
+                        break
+
+                array[dest] = array[cursor1]
+                dest -= 1
+                cursor1 -= 1
+                length1 -= 1
+                if length1 == 0:
+                    done = True
+                    break
+
+                min_gallop -= 1
+                if count1 < MIN_GALLOP and count2 < MIN_GALLOP:
+                    break
+
+            min_gallop = max(min_gallop, 0) + 2
+
+        min_gallop = max(min_gallop, 1)
+
+        if length2 == 1:
+            dest -= length1
+            cursor1 -= length1
+            array[dest + 1:dest + 1 + length1] = array[cursor1 + 1:cursor1 + 1 + length1]
+            array[dest] = temp[cursor2]
+        else:
+            array[dest - length2 + 1:dest + 1] = temp[:length2]
+
+    n = len(array)
+
+    high = n-1 if high is None else high
+
+    remaining = high - low + 1
+    if remaining < 2:
+        return array
+
+    if remaining < MIN_MERGE:
+        binary_insertion_sort(array, low, high, count_run(low, high + 1))
+        return array
+
+    min_gallop = MIN_GALLOP
+    min_run = min_run_length(remaining)
+    runs = []
+
+    while remaining > 0:
+        end = count_run(low, high + 1)
+
+        if end - low < min_run:
+            forced_end = low + min(remaining, min_run)
+            binary_insertion_sort(array, low, forced_end - 1, end)
+            end = forced_end
+
+        runs.append((low, end - low))
+
+        # Restore the invariants of the run stack, where X, Y, Z, W are the lengths of the topmost runs:
+        # Y > X, Z > Y + X and W > Z + Y
+        while len(runs) > 1:
+            i = len(runs) - 2
+            if (i > 0 and runs[i - 1][1] <= runs[i][1] + runs[i + 1][1]) or \
+                    (i > 1 and runs[i - 2][1] <= runs[i - 1][1] + runs[i][1]):
+                if runs[i - 1][1] < runs[i + 1][1]:
+                    i -= 1
+                merge_at(i)
+            elif runs[i][1] <= runs[i + 1][1]:
+                merge_at(i)
+            else:
+                break
+
+        remaining -= end - low
+        low = end
+
+    while len(runs) > 1:
+        i = len(runs) - 2
+        if i > 0 and runs[i - 1][1] < runs[i + 1][1]:
+            i -= 1
+        merge_at(i)
+
+    return array
+
+
+if __name__ == "__main__":
+    import doctest
+    doctest.testmod()
@@ -0,0 +1,67 @@
+"""
+Heap Sort Arity Benchmark
+
+This script compares the binary, bottom-up and d-ary Heap Sort variants by wall time and number of comparisons.
+
+Usage:
+    python -m benchmarks.heap_sort_arity --size 100000 --arities 2 3 4 8
+
+Author: Aflah Hanif Amarlyadi
+Date: 2026-10-17
+License: MIT
+"""
+
+from typing import Callable, List, Tuple
+from algorithms.instrumentation import instrument
+from algorithms.sorting.heap_sort import heap_sort, heap_sort_bottom_up, heap_sort_d_ary
+import argparse
+import random
+import time
+
+
+def measure(sort: Callable[[List[float]], List[float]], values: List[float]) -> Tuple[float, int]:
+    """
+    Sorts a copy of the values with the given sorting algorithm.
+
+    Args:
+        sort (Callable[[List[float]], List[float]]): The sorting algorithm.
+        values (List[float]): The values to be sorted.
+
+    Returns:
+        Tuple[float, int]: The wall time in seconds and the number of comparisons.
+    """
+    array = values[:]
+
+    start = time.perf_counter()
+    sort(array)
+    elapsed = time.perf_counter() - start
+
+    assert all(not array[i + 1] < array[i] for i in range(len(array) - 1))
+
+    _, counts = instrument(sort, values[:], writes=False, depth=False, memory=False)
+
+    return elapsed, counts.comparisons
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--size', type=int, default=100000, help="the number of elements to sort")
+    parser.add_argument('--arities', type=int, nargs='+', default=[2, 3, 4, 8], help="the d-ary heap arities")
+    parser.add_argument('--seed', type=int, default=0, help="the random seed")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    values = [rng.random() for _ in range(args.size)]
+
+    variants = [('binary', heap_sort), ('bottom-up', heap_sort_bottom_up)]
+    variants += [(f'{d}-ary', lambda array, d=d: heap_sort_d_ary(array, d=d)) for d in args.arities]
+
+    print(f"{'variant':<12}{'time (s)':>12}{'comparisons':>14}{'per n log2 n':>14}")
+    for name, sort in variants:
+        elapsed, comparisons = measure(sort, values)
+        ratio = comparisons / (args.size * max(1, args.size.bit_length() - 1))
+        print(f"{name:<12}{elapsed:>12.3f}{comparisons:>14}{ratio:>14.2f}")
+
+
+if __name__ == '__main__':
+    main()
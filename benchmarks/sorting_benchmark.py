@@ -0,0 +1,391 @@
+"""
+Sorting Benchmark Suite
+
+This script runs the sorting algorithms on a range of input patterns and sizes, and reports the wall time, numbers of
+comparisons and in-place writes, recursion depth and peak memory of every run as JSON. Only the writes to the input
+list are counted, not those to auxiliary buffers, so write counts are only comparable between in-place algorithms.
+
+Usage:
+    python -m benchmarks.sorting_benchmark --sizes 10 100 1000 10000 --output results.json
+
+Author: Aflah Hanif Amarlyadi
+Date: 2026-10-17
+License: MIT
+"""
+
+from typing import Any, Callable, Dict, List
+from algorithms.instrumentation import instrument
+from algorithms.sorting.bubble_sort import bubble_sort
+from algorithms.sorting.counting_sort import counting_sort, counting_sort_chr, counting_sort_chr_unstable, \
+    counting_sort_prefix_sum, counting_sort_unstable
+from algorithms.sorting.external_merge_sort import external_merge_sort
+from algorithms.sorting.heap_sort import heap_sort, heap_sort_bottom_up, heap_sort_d_ary
+from algorithms.sorting.insertion_sort import binary_insertion_sort, insertion_sort, shell_sort
+from algorithms.sorting.intro_sort import intro_sort
+from algorithms.sorting.merge_sort import merge_sort_buffered, merge_sort_iterative, merge_sort_recursive
+from algorithms.sorting.parallel_merge_sort import parallel_merge_sort
+from algorithms.sorting.pdq_sort import pdq_sort
+from algorithms.sorting.quick_sort import quick_sort, quick_sort_dnf, quick_sort_dnf_iterative, quick_sort_dual_pivot, \
+    quick_sort_hoare, quick_sort_hoare_iterative, quick_sort_lomuto, quick_sort_lomuto_iterative
+from algorithms.sorting.radix_sort import radix_sort, radix_sort_msd, radix_sort_numeric, radix_sort_str, \
+    radix_sort_vectorized
+from algorithms.sorting.sample_sort import sample_sort
+from algorithms.sorting.selection_sort import selection_sort
+from algorithms.sorting.tim_sort import tim_sort
+import argparse
+import inspect
+import json
+import platform
+import random
+import sys
+import time
+
+ALL = frozenset(['random', 'sorted', 'reversed', 'organ_pipe', 'few_unique', 'sawtooth', 'nearly_sorted', 'killer'])
+
+# The kind of elements every algorithm sorts, and the inputs on which it takes quadratic time
+ALGORITHMS = [
+    ('bubble_sort', bubble_sort, 'comparison', ALL),
+    ('selection_sort', selection_sort, 'comparison', ALL),
+    ('insertion_sort', insertion_sort, 'comparison', ALL - {'sorted', 'nearly_sorted'}),
+    ('binary_insertion_sort', binary_insertion_sort, 'comparison', ALL - {'sorted'}),
+    ('shell_sort', shell_sort, 'comparison', set()),
+    ('quick_sort', quick_sort, 'comparison', {'killer'}),
+    ('quick_sort_dnf', quick_sort_dnf, 'comparison', {'killer'}),
+    ('quick_sort_hoare', quick_sort_hoare, 'comparison', {'killer'}),
+    ('quick_sort_lomuto', quick_sort_lomuto, 'comparison', {'killer', 'few_unique'}),
+    ('quick_sort_dnf_iterative', quick_sort_dnf_iterative, 'comparison', {'killer'}),
+    ('quick_sort_hoare_iterative', quick_sort_hoare_iterative, 'comparison', {'killer'}),
+    ('quick_sort_lomuto_iterative', quick_sort_lomuto_iterative, 'comparison', {'killer', 'few_unique'}),
+    ('quick_sort_dual_pivot', quick_sort_dual_pivot, 'comparison', {'killer'}),
+    ('intro_sort', intro_sort, 'comparison', set()),
+    ('pdq_sort', pdq_sort, 'comparison', set()),
+    ('heap_sort', heap_sort, 'comparison', set()),
+    ('heap_sort_bottom_up', heap_sort_bottom_up, 'comparison', set()),
+    ('heap_sort_d_ary', heap_sort_d_ary, 'comparison', set()),
+    ('merge_sort_iterative', merge_sort_iterative, 'comparison', set()),
+    ('merge_sort_recursive', merge_sort_recursive, 'comparison', set()),
+    ('merge_sort_buffered', merge_sort_buffered, 'comparison', set()),
+    ('tim_sort', tim_sort, 'comparison', set()),
+    ('external_merge_sort', lambda array: list(external_merge_sort(array)), 'comparison', set()),
+    ('parallel_merge_sort', parallel_merge_sort, 'parallel', set()),
+    ('sample_sort', sample_sort, 'parallel', set()),
+    ('counting_sort', counting_sort, 'integer', set()),
+    ('counting_sort_unstable', counting_sort_unstable, 'integer', set()),
+    ('counting_sort_prefix_sum', counting_sort_prefix_sum, 'integer', set()),
+    ('counting_sort_chr', counting_sort_chr, 'character', set()),
+    ('counting_sort_chr_unstable', counting_sort_chr_unstable, 'character', set()),
+    ('radix_sort', radix_sort, 'integer', set()),
+    ('radix_sort_vectorized', radix_sort_vectorized, 'integer', set()),
+    ('radix_sort_numeric', radix_sort_numeric, 'numeric', set()),
+    ('radix_sort_str', radix_sort_str, 'string', set()),
+    ('radix_sort_msd', radix_sort_msd, 'string', set()),
+]
+
+# How the integer inputs are turned into the elements every kind of algorithm sorts
+PREPARE = {
+    'comparison': list,
+    'parallel': list,
+    'integer': list,
+    'numeric': lambda values: [(x - len(values) // 2) / 4 for x in values],
+    'character': lambda values: [chr(ord('a') + x % 26) for x in values],
+    'string': lambda values: [str(x) for x in values],
+}
+
+
+def random_input(n: int, rng: random.Random) -> List[int]:
+    """
+    Generates a list of random integers between 0 and n - 1.
+
+    Args:
+        n (int): The number of elements.
+        rng (random.Random): The random number generator.
+
+    Returns:
+        List[int]: The random list.
+    """
+    return [rng.randrange(n) for _ in range(n)]
+
+
+def sorted_input(n: int, rng: random.Random) -> List[int]:
+    """
+    Generates the integers from 0 to n - 1 in ascending order.
+
+    Args:
+        n (int): The number of elements.
+        rng (random.Random): The random number generator, which is not used.
+
+    Returns:
+        List[int]: The sorted list.
+    """
+    return list(range(n))
+
+
+def reversed_input(n: int, rng: random.Random) -> List[int]:
+    """
+    Generates the integers from 0 to n - 1 in descending order.
+
+    Args:
+        n (int): The number of elements.
+        rng (random.Random): The random number generator, which is not used.
+
+    Returns:
+        List[int]: The reversed list.
+    """
+    return list(range(n - 1, -1, -1))
+
+
+def organ_pipe_input(n: int, rng: random.Random) -> List[int]:
+    """
+    Generates a list that ascends to its middle and then descends again.
+
+    Args:
+        n (int): The number of elements.
+        rng (random.Random): The random number generator, which is not used.
+
+    Returns:
+        List[int]: The organ pipe list.
+    """
+    return [min(i, n - 1 - i) for i in range(n)]
+
+
+def few_unique_input(n: int, rng: random.Random) -> List[int]:
+    """
+    Generates a list of random integers with only 8 distinct values.
+
+    Args:
+        n (int): The number of elements.
+        rng (random.Random): The random number generator.
+
+    Returns:
+        List[int]: The list with few unique elements.
+    """
+    return [rng.randrange(8) for _ in range(n)]
+
+
+def sawtooth_input(n: int, rng: random.Random) -> List[int]:
+    """
+    Generates a list of ascending runs of length sqrt(n), all starting again from 0.
+
+    Args:
+        n (int): The number of elements.
+        rng (random.Random): The random number generator, which is not used.
+
+    Returns:
+        List[int]: The sawtooth list.
+    """
+    period = max(1, int(n ** 0.5))
+    return [i % period for i in range(n)]
+
+
+def nearly_sorted_input(n: int, rng: random.Random, swaps: int = None) -> List[int]:
+    """
+    Generates a sorted list with a number of random pairs of elements swapped.
+
+    Args:
+        n (int): The number of elements.
+        rng (random.Random): The random number generator.
+        swaps (int, optional): The number of swaps. Defaults to 1% of the elements.
+
+    Returns:
+        List[int]: The nearly sorted list.
+    """
+    array = list(range(n))
+    for _ in range(max(1, n // 100) if swaps is None else swaps):
+        i, j = rng.randrange(n), rng.randrange(n)
+        array[i], array[j] = array[j], array[i]
+    return array
+
+
+def seeded(sort: Callable[..., Any], seed: int) -> Callable[[List[Any]], Any]:
+    """
+    Gives a sorting algorithm that draws random numbers a random number generator of its own, so every run with the
+    same seed draws the same numbers without touching the state of the random module.
+
+    Args:
+        sort (Callable[..., Any]): The sorting algorithm.
+        seed (int): The seed of the random number generator.
+
+    Returns:
+        Callable[[List[Any]], Any]: The sorting algorithm, called with rng=random.Random(seed) if it takes an rng
+        argument, and unchanged otherwise.
+    """
+    if 'rng' not in inspect.signature(sort).parameters:
+        return sort
+    return lambda array: sort(array, rng=random.Random(seed))
+
+
+def killer_input(n: int, sort: Callable[[List[Any]], Any], seed: int) -> List[int]:
+    """
+    Generates an input on which the given Quick Sort takes quadratic time, using McIlroy's adversary.
+
+    The adversary sorts placeholder elements whose values are only fixed when they are compared: all elements start
+    as gas, larger than any fixed value, and when two gas elements are compared one of them is frozen at the next
+    smallest value, preferring the element that looks like the pivot. The values fixed during the run form an input
+    that makes the sort choose a bad pivot at every step. The random-pivot variants are given a new random.Random(seed)
+    through seeded, both in the adversary run and in the benchmarked run, which then draws the same pivots.
+
+    Args:
+        n (int): The number of elements.
+        sort (Callable[[List[Any]], Any]): The sorting algorithm to attack.
+        seed (int): The seed of the random number generator of both runs.
+
+    Returns:
+        List[int]: The adversarial input.
+    """
+    gas = n
+    values = [gas] * n
+    solid = 0
+    candidate = None
+
+    def compare(x: int, y: int) -> int:
+        nonlocal solid, candidate
+        if values[x] == gas and values[y] == gas:
+            frozen = x if x == candidate else y
+            values[frozen] = solid
+            solid += 1
+        if values[x] == gas:
+            candidate = x
+        elif values[y] == gas:
+            candidate = y
+        return values[x] - values[y]
+
+    class Placeholder:
+        __slots__ = ('index',)
+
+        def __init__(self, index: int):
+            self.index = index
+
+        def __lt__(self, other: 'Placeholder') -> bool:
+            return compare(self.index, other.index) < 0
+
+        def __le__(self, other: 'Placeholder') -> bool:
+            return compare(self.index, other.index) <= 0
+
+        def __gt__(self, other: 'Placeholder') -> bool:
+            return compare(self.index, other.index) > 0
+
+        def __ge__(self, other: 'Placeholder') -> bool:
+            return compare(self.index, other.index) >= 0
+
+        def __eq__(self, other: 'Placeholder') -> bool:
+            return compare(self.index, other.index) == 0
+
+    seeded(sort, seed)([Placeholder(i) for i in range(n)])
+
+    return values
+
+
+INPUTS = {
+    'random': random_input,
+    'sorted': sorted_input,
+    'reversed': reversed_input,
+    'organ_pipe': organ_pipe_input,
+    'few_unique': few_unique_input,
+    'sawtooth': sawtooth_input,
+    'nearly_sorted': nearly_sorted_input,
+}
+
+
+def measure(sort: Callable[[List[Any]], Any], kind: str, values: List[int], seed: int, counts: bool,
+            memory: bool) -> Dict[str, Any]:
+    """
+    Runs a sorting algorithm on an input, checks the result, and measures it.
+
+    Every measurement is taken in a separate run, so instrumentation does not distort the wall time. Algorithms that
+    draw random numbers are given a new random number generator with the same seed in every run, through seeded.
+
+    Args:
+        sort (Callable[[List[Any]], Any]): The sorting algorithm.
+        kind (str): The kind of elements the algorithm sorts.
+        values (List[int]): The input.
+        seed (int): The seed of the random number generator of every run.
+        counts (bool): Whether to count comparisons, in-place writes and recursion depth.
+        memory (bool): Whether to measure the peak memory.
+
+    Returns:
+        Dict[str, Any]: The wall time in seconds, numbers of comparisons and in-place writes, recursion depth and peak
+        memory in bytes. Comparisons are None for algorithms that do not compare elements, and counts are None for
+        algorithms that work in other processes.
+    """
+    array = PREPARE[kind](values)
+    expected = sorted(array)
+
+    sort = seeded(sort, seed)
+
+    start = time.perf_counter()
+    result = sort(array)
+    elapsed = time.perf_counter() - start
+
+    if list(result) != expected:
+        raise AssertionError("the result is not sorted")
+
+    record = {'time': elapsed, 'comparisons': None, 'writes': None, 'max_depth': None, 'peak_memory': None}
+
+    if counts and kind != 'parallel':
+        _, operations = instrument(sort, PREPARE[kind](values), comparisons=kind == 'comparison', memory=False)
+        record.update(writes=operations.writes, max_depth=operations.max_depth)
+        if kind == 'comparison':
+            record.update(comparisons=operations.comparisons)
+
+    if memory:
+        _, operations = instrument(sort, PREPARE[kind](values), comparisons=False, writes=False, depth=False)
+        record.update(peak_memory=operations.peak_memory)
+
+    return record
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10, 100, 1000, 10000, 100000],
+                        help="the input sizes, up to 10000000")
+    parser.add_argument('--inputs', nargs='+', choices=sorted(ALL), default=sorted(ALL), help="the input patterns")
+    parser.add_argument('--algorithms', nargs='+', choices=[name for name, *_ in ALGORITHMS],
+                        help="the algorithms to run, defaults to all of them")
+    parser.add_argument('--quadratic-limit', type=int, default=10000,
+                        help="the largest size run on inputs that take an algorithm quadratic time")
+    parser.add_argument('--no-counts', action='store_true', help="skip counting comparisons, writes and depth")
+    parser.add_argument('--no-memory', action='store_true', help="skip measuring peak memory")
+    parser.add_argument('--seed', type=int, default=0, help="the random seed")
+    parser.add_argument('--output', default='benchmark.json', help="the JSON file to write the results to")
+    args = parser.parse_args()
+
+    # The recursive algorithms need more stack on adversarial inputs
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 10 * args.quadratic_limit))
+
+    results = []
+    for name, sort, kind, quadratic in ALGORITHMS:
+        if args.algorithms and name not in args.algorithms:
+            continue
+
+        for pattern in args.inputs:
+            for n in args.sizes:
+                if pattern in quadratic and n > args.quadratic_limit:
+                    continue
+
+                if pattern == 'killer':
+                    values = killer_input(n, sort if kind == 'comparison' else quick_sort_hoare, args.seed)
+                else:
+                    values = INPUTS[pattern](n, random.Random(args.seed))
+
+                record = {'algorithm': name, 'input': pattern, 'size': n}
+                try:
+                    record.update(measure(sort, kind, values, args.seed, not args.no_counts, not args.no_memory))
+                except (AssertionError, RecursionError, MemoryError) as error:
+                    record['error'] = f'{type(error).__name__}: {error}'
+                results.append(record)
+
+                print(f"{name:<28}{pattern:<15}{n:>10}  " +
+                      (record['error'] if 'error' in record else f"{record['time']:.4f} s"), file=sys.stderr)
+
+    report = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'seed': args.seed,
+        'results': results,
+    }
+    with open(args.output, 'w') as file:
+        json.dump(report, file, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""
+Sorting Network Benchmark
+
+This script compares the straight-line sorting network functions with Insertion Sort on tiny lists, by wall time and
+average number of comparisons.
+
+Usage:
+    python -m benchmarks.sorting_network_benchmark --lists 10000 --sizes 4 8 12 16
+
+Author: Aflah Hanif Amarlyadi
+Date: 2026-10-17
+License: MIT
+"""
+
+from typing import Callable, List, Tuple
+from algorithms.instrumentation import instrument
+from algorithms.sorting.insertion_sort import insertion_sort
+from algorithms.sorting.sorting_network import MAX_NETWORK_SIZE, SORTERS
+import argparse
+import random
+import time
+
+
+def measure(sort: Callable[[List[float]], None], lists: List[List[float]]) -> Tuple[float, float]:
+    """
+    Sorts a copy of every list with the given sorting function.
+
+    Args:
+        sort (Callable[[List[float]], None]): The sorting function, sorting a whole list in place.
+        lists (List[List[float]]): The lists to be sorted, all of the same size.
+
+    Returns:
+        Tuple[float, float]: The wall time in seconds and the average number of comparisons per list.
+    """
+    copies = [values[:] for values in lists]
+
+    start = time.perf_counter()
+    for array in copies:
+        sort(array)
+    elapsed = time.perf_counter() - start
+
+    assert all(all(not array[i + 1] < array[i] for i in range(len(array) - 1)) for array in copies)
+
+    comparisons = sum(instrument(sort, values[:], writes=False, depth=False, memory=False)[1].comparisons
+                      for values in lists)
+
+    return elapsed, comparisons / len(lists)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--lists', type=int, default=10000, help="the number of lists of every size to sort")
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(range(2, MAX_NETWORK_SIZE + 1)),
+                        help=f"the list sizes, at most {MAX_NETWORK_SIZE}")
+    parser.add_argument('--seed', type=int, default=0, help="the random seed")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+
+    print(f"{'size':<6}{'network (s)':>14}{'insertion (s)':>16}{'speedup':>10}{'network cmp':>14}{'insertion cmp':>16}")
+    for n in args.sizes:
+        lists = [[rng.random() for _ in range(n)] for _ in range(args.lists)]
+
+        network_time, network_comparisons = measure(lambda array, n=n: SORTERS[n](array, 0), lists)
+        insertion_time, insertion_comparisons = measure(insertion_sort, lists)
+
+        print(f"{n:<6}{network_time:>14.4f}{insertion_time:>16.4f}{insertion_time / network_time:>10.2f}"
+              f"{network_comparisons:>14.1f}{insertion_comparisons:>16.1f}")
+
+
+if __name__ == '__main__':
+    main()